@@ -1,5 +1,16 @@
 from .note import Note
 from .note import Rest
+from .note import NoteParseError
 from .interval import Interval
 from .scale import Scale
-from .chord import Chord
\ No newline at end of file
+from .chord import Chord
+
+try:
+    import numpy
+except ImportError: # NumPy is an optional dependency
+    pass
+else:
+    from .note_array import NoteArray
+    from .random_streams import RandomStreams
+    from .key import Key, KeyTracker
+    del numpy
@@ -0,0 +1,96 @@
+import collections
+import threading
+
+# Statistics reported by LRUCache.info()
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+class LRUCache(object):
+    """A bounded, thread-safe mapping that discards the least recently used entry when full.
+
+    Used to memoize results that are expensive to build and requested repeatedly, e.g.,
+    :attr:`~music_essentials.scale.Scale.build_scale()`. Cached values are shared between
+    callers, so they should be immutable.
+    """
+
+    def __init__(self, maxsize=128):
+        """Create a new, empty cache.
+
+        Kwargs:
+            maxsize : int (default 128)
+                The maximum number of entries to hold. Should be positive.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the maximum size is not an integer.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the maximum size is not positive.
+        """
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int):
+            raise TypeError('Expected integer for maximum cache size, got: ' + str(maxsize))
+        if maxsize < 1:
+            raise ValueError('Maximum cache size must be positive, got: ' + str(maxsize))
+
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, build):
+        """Get the value for a key, building and storing it if it is not already cached.
+
+        Args:
+            key : hashable
+                The key to look up.
+
+            build : callable
+                Called with no arguments to create the value on a cache miss.
+
+        Returns:
+            object
+                The cached (or newly built) value.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+        # build outside the lock; if two threads miss on the same key, the last result is kept
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return value
+
+    def info(self):
+        """Get the cache statistics.
+
+        Returns:
+            :attr:`~music_essentials.cache.CacheInfo`
+                A named tuple of ``(hits, misses, evictions, maxsize, currsize)``.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self):
+        """Get the number of cached entries."""
+        return len(self._entries)
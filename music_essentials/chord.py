@@ -1,17 +1,66 @@
-# TODO: instantiate chord with multiple notes
 # TODO: add_note support note string
 
+import bisect
+import collections
+import operator
+
 from .note import Note
+from .note import _interned_note, _SORT_KEY_GETTER, _NOTE_TABLE, _NOTES_BY_MIDI_NUM
+from .note import _NATURAL_SEMITONES, _ACCIDENTAL_OFFSETS, _PITCH_INDEX
 from .scale import Scale
 from .interval import Interval
 
+# Result of Chord.identify()
+ChordName = collections.namedtuple('ChordName', ['root', 'quality', 'inversion'])
+
 class Chord(object):
     """Representation of group of notes that are played together."""
 
-    # Difference in pitch index from the root note in the scale to each note in the chord
+    # Semitones above the root of each note in a chord quality, in stacked order (root, third, fifth, ...);
+    # when a set of notes matches several qualities, the first listed is preferred
+    _CHORD_QUALITIES = (
+        ('major', (0, 4, 7)),
+        ('minor', (0, 3, 7)),
+        ('diminished', (0, 3, 6)),
+        ('augmented', (0, 4, 8)),
+        ('sus4', (0, 5, 7)),
+        ('sus2', (0, 2, 7)),
+        ('power', (0, 7)),
+        ('dominant 7', (0, 4, 7, 10)),
+        ('major 7', (0, 4, 7, 11)),
+        ('minor 7', (0, 3, 7, 10)),
+        ('minor major 7', (0, 3, 7, 11)),
+        ('half-diminished 7', (0, 3, 6, 10)),
+        ('diminished 7', (0, 3, 6, 9)),
+        ('augmented 7', (0, 4, 8, 10)),
+        ('augmented major 7', (0, 4, 8, 11)),
+        ('7sus4', (0, 5, 7, 10)),
+        ('major 6', (0, 4, 7, 9)),
+        ('minor 6', (0, 3, 7, 9)),
+        ('dominant 9', (0, 4, 7, 10, 2)),
+        ('major 9', (0, 4, 7, 11, 2)),
+        ('minor 9', (0, 3, 7, 10, 2)),
+        ('add9', (0, 4, 7, 2)),
+        ('minor add9', (0, 3, 7, 2)),
+        ('dominant 11', (0, 4, 7, 10, 2, 5)),
+        ('minor 11', (0, 3, 7, 10, 2, 5)),
+        ('dominant 13', (0, 4, 7, 10, 2, 5, 9)),
+    )
+
+    # Difference in pitch index from the root note in the scale to each note in the chord.
+    # Both tonalities stack diatonic thirds; the tonality comes from the scale the steps are taken from
     _MAJOR = (2, 4)
     _MINOR = (2, 4)
-    
+
+    # Extra pitch index differences added by an extension suffix on the chord number (e.g., 'V7')
+    _CHORD_EXTENSIONS = {
+        '': (),
+        '7': (6,),
+        '9': (6, 8),
+        '11': (6, 8, 10),
+        '13': (6, 8, 10, 12)
+    }
+
     _CHORD_PATTERNS = {
         'major': _MAJOR,
         'maj': _MAJOR,
@@ -29,6 +78,12 @@ class Chord(object):
         'VII': 6,
         'VIII': 7}
 
+    # key = (pitch, octave, accidental, scale pattern); val = the seven notes of the key, from the tonic up
+    _KEY_DEGREES = {}
+
+    # key = (pitch, octave, accidental, chord number, scale pattern); val = notes of the built chord
+    _BUILT_CHORDS = {}
+
     def __init__(self, root_note):
         """Create a new Chord.
 
@@ -63,6 +118,75 @@ class Chord(object):
 
         self.notes = [root_note]
 
+    @classmethod
+    def from_notes(cls, notes):
+        """Create a new Chord from several notes at once.
+
+        The notes are sorted once, so this is faster than adding them one at a time with
+        :attr:`~music_essentials.chord.Chord.add_note`.
+
+        Args:
+            notes : iterable
+                The :attr:`~music_essentials.note.Note` objects in the chord, in any order.
+
+        Returns:
+            :attr:`~music_essentials.chord.Chord`
+                A new chord holding the notes, in ascending order.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything but an instance of :attr:`~music_essentials.note.Note` is provided, or a note is a rest.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If no notes are provided.
+
+        Examples:
+            >>> c = Chord.from_notes([Note.from_note_string('G4'), Note.from_note_string('C4'), Note.from_note_string('E4')])
+            >>> print(c)
+            C4+E4+G4
+        """
+        notes = list(notes)
+        if not notes:
+            raise ValueError('Expected at least one note for chord')
+        for n in notes:
+            if not isinstance(n, Note):
+                raise TypeError('Expected Note for chord note, got \'' + str(n) + '\'')
+            if n.is_rest:
+                raise TypeError('Can not add a rest to a chord')
+
+        return Chord._from_sorted(sorted(notes, key=_SORT_KEY_GETTER))
+
+    @classmethod
+    def from_string(cls, chord_string):
+        """Create a new Chord from a string of notes.
+
+        Args:
+            chord_string : str
+                The notes in the chord, in the form ``<note_1>+<note_2>+...+<note_n>`` (as created
+                by :attr:`~music_essentials.chord.Chord.__str__`). Each note should be a valid note
+                string for :attr:`~music_essentials.note.Note.from_note_string()`; the notes may be in any order.
+
+        Returns:
+            :attr:`~music_essentials.chord.Chord`
+                A new chord holding the notes, in ascending order.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the chord string is not a string, or contains a rest.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any note string is invalid.
+
+        Examples:
+            >>> c = Chord.from_string('C4+E4+G4')
+            >>> print(c.root())
+            C4
+        """
+        if not isinstance(chord_string, str):
+            raise TypeError('Expected string for chord string, got \'' + str(chord_string) + '\'')
+
+        return Chord.from_notes([Note.from_note_string(note_string) for note_string in chord_string.split('+')])
+
     @classmethod
     def build_chord(cls, tonic_key, chord_number, chord_type):
         """Build a chord.
@@ -76,7 +200,9 @@ class Chord(object):
                 They key in which the chord should be built
 
             chord_number : str
-                The scale degree to start building the chord on
+                The scale degree to start building the chord on, as an upper case Roman numeral
+                ('I' to 'VIII'). May end with an extension - '7', '9', '11', or '13' - to stack
+                further diatonic thirds on the triad (e.g., 'V7').
 
             chord_type : str
                 The tonality of the key to build the cord in. Can be one of:
@@ -86,8 +212,9 @@ class Chord(object):
 
         Returns
         -------
-            list
-                The list of notes in the chord, in ascending order.
+            :attr:`~music_essentials.chord.Chord`
+                The chord, with its notes in ascending order. Chords are built from cached tables
+                of each key's degrees, so building the same chord again is a lookup.
 
         Examples
         --------
@@ -100,28 +227,273 @@ class Chord(object):
             >>> c = Chord.build_chord(Note.from_note_string('C4'), 'IV', 'minor')
             >>> print(c)
             >>> F4+A4b+C5
+            >>> c = Chord.build_chord(Note.from_note_string('C4'), 'V7', 'major')
+            >>> print(c)
+            >>> G4+B4+D5+F5
         """
         if not isinstance(tonic_key, Note):
             raise TypeError('Expected Note for tonic key, got \'' + str(tonic_key) + '\'')
-        if not chord_number in Chord._CHORD_NUM_SCALE_INDEX.keys():
+        if tonic_key.is_rest:
+            raise TypeError('Can not build a chord from a rest')
+        if not chord_number in _CHORD_NUMBERS:
             raise ValueError('Unsupported chord number: ' + str(chord_number))
         if not chord_type in Chord._CHORD_PATTERNS.keys():
             raise ValueError('Unsupported chord type: ' + str(chord_type))
 
-        s = Scale.build_scale(tonic_key, chord_type)
-        root_idx = Chord._CHORD_NUM_SCALE_INDEX[chord_number]
-        root = s[root_idx]
-        cls = Chord(root)
-        for index_diff in Chord._CHORD_PATTERNS[chord_type]:
-            next_idx = root_idx + index_diff
-            octave_diff = 0
-            if next_idx > (len(s) - 1):
-                next_idx -= len(s) - 1
-                octave_diff += 1
-            next_note = s[next_idx]
-            cls.add_note(Note(next_note.pitch, next_note.octave + octave_diff, next_note.accidental))
-
-        return cls
+        return Chord._from_sorted(Chord._built_chord_notes(tonic_key, chord_number, chord_type))
+
+    @classmethod
+    def build_progression(cls, tonic_key, progression, chord_type, as_array=False):
+        """Build a sequence of chords from Roman numerals.
+
+        The whole progression is parsed (and validated) at once, and each chord is looked up in the
+        same cached tables as :attr:`~music_essentials.chord.Chord.build_chord`.
+
+        Args:
+            tonic_key : :attr:`~music_essentials.note.Note`
+                They key in which the chords should be built.
+
+            progression : str or list
+                The chord numbers, either as a string separated by whitespace (e.g., ``'I IV V7 I'``)
+                or as a list of strings. Numerals are not case sensitive - the quality of each
+                chord comes from the key, so ``'vi'`` and ``'VI'`` build the same chord.
+
+            chord_type : str
+                The tonality of the key; see :attr:`~music_essentials.chord.Chord.build_chord`.
+
+        Kwargs:
+            as_array : bool (default `False`)
+                If true, return the MIDI note numbers of the chords as a 2D `NumPy <http://www.numpy.org/>`_
+                array (one row per chord, padded with -1) instead of a list of chords.
+
+        Returns:
+            list or `numpy.ndarray`
+                The :attr:`~music_essentials.chord.Chord` objects, in order, or an array if `as_array` is true.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the tonic key is not a :attr:`~music_essentials.note.Note`, or the progression is not a
+                string or list of strings.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any chord number or the chord type is not supported, or a chord falls outside the MIDI range.
+
+        Examples:
+            >>> chords = Chord.build_progression(Note.from_note_string('C4'), 'I vi ii V7 I', 'major')
+            >>> print(' '.join(str(c) for c in chords))
+            C4+E4+G4 A4+C5+E5 D4+F4+A4 G4+B4+D5+F5 C4+E4+G4
+        """
+        if not isinstance(tonic_key, Note):
+            raise TypeError('Expected Note for tonic key, got \'' + str(tonic_key) + '\'')
+        if tonic_key.is_rest:
+            raise TypeError('Can not build a chord from a rest')
+        if not chord_type in Chord._CHORD_PATTERNS.keys():
+            raise ValueError('Unsupported chord type: ' + str(chord_type))
+
+        chord_numbers = Chord._parse_progression(progression)
+        chords = [Chord._built_chord_notes(tonic_key, chord_number, chord_type) for chord_number in chord_numbers]
+        if not as_array:
+            return [Chord._from_sorted(notes) for notes in chords]
+
+        import numpy as np
+        midi_nums = np.full((len(chords), max([len(notes) for notes in chords] or [0])), -1, dtype=np.int16)
+        for row, notes in enumerate(chords):
+            midi_nums[row, :len(notes)] = [n.midi_note_number() for n in notes]
+
+        return midi_nums
+
+    @classmethod
+    def voice_progression(cls, chords, voices=None, lowest_midi_num=48, highest_midi_num=84, max_spread=24):
+        """Voice a sequence of chords so that the voices move as little as possible.
+
+        Every chord is re-voiced as `voices` distinct notes that cover all of its pitch classes (doubling
+        some if the chord has fewer pitch classes than voices), spelled as in the original chord (or, where
+        that spelling has no note at the edge of the MIDI range, with sharps). Of all such voicings, the
+        sequence with the smallest total voice movement (the sum, over each pair of consecutive chords, of
+        the semitones moved by each voice) is chosen.
+
+        Voices never cross, so the movement between two voicings is found by matching them in sorted
+        order, which is the optimal assignment of voices for notes on a line. The best sequence is found
+        by dynamic programming over the candidate voicings of each chord, pruned with a greedy upper
+        bound on the total movement.
+
+        Args:
+            chords : list
+                The :attr:`~music_essentials.chord.Chord` objects to voice, in order.
+
+        Kwargs:
+            voices : int (default `None`)
+                The number of notes in each voicing. If `None`, uses the largest number of pitch classes
+                in any chord.
+
+            lowest_midi_num : int (default 48)
+                The MIDI number of the lowest note any voice may play.
+
+            highest_midi_num : int (default 84)
+                The MIDI number of the highest note any voice may play.
+
+            max_spread : int (default 24)
+                The largest number of semitones allowed between the lowest and highest notes of a voicing.
+
+        Returns:
+            list
+                The voiced :attr:`~music_essentials.chord.Chord` objects, in order.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.chord.Chord` is given, or a chord holds a rest.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the range is invalid, a chord has more pitch classes than voices, or a chord can
+                not be voiced within the range and spread.
+
+        Examples:
+            >>> chords = Chord.build_progression(Note.from_note_string('C4'), 'I IV V7 I', 'major')
+            >>> print(' '.join(str(c) for c in Chord.voice_progression(chords)))
+            C3+E3+G3+C4 C3+F3+A3+C4 D3+F3+G3+B3 C3+E3+G3+C4
+        """
+        if (lowest_midi_num < 0) or (highest_midi_num > 127) or (lowest_midi_num > highest_midi_num):
+            raise ValueError('Invalid MIDI range [' + str(lowest_midi_num) + ', ' + str(highest_midi_num) + ']')
+
+        # spelling of each pitch class of each chord; key = pitch class; val = (pitch, accidental)
+        spellings = []
+        for c in chords:
+            if not isinstance(c, Chord):
+                raise TypeError('Expected Chord, got \'' + str(c) + '\'')
+            spelling = {}
+            for n in c.notes:
+                if n.is_rest:
+                    raise TypeError('Can not voice a chord holding a rest')
+                spelling.setdefault(n.midi_note_number() % 12, (n.pitch, n.accidental))
+            spellings.append(spelling)
+        if not spellings:
+            return []
+
+        if voices is None:
+            voices = max(len(spelling) for spelling in spellings)
+        candidates = []
+        for c, spelling in zip(chords, spellings):
+            if len(spelling) > voices:
+                raise ValueError('Can not voice chord ' + str(c) + ' with ' + str(voices) + ' voices')
+            voicings = _voicings(frozenset(spelling), voices, lowest_midi_num, highest_midi_num, max_spread)
+            if not voicings:
+                raise ValueError('Can not voice chord ' + str(c) + ' within the MIDI range [' + str(lowest_midi_num)
+                    + ', ' + str(highest_midi_num) + '] and a spread of ' + str(max_spread))
+            candidates.append(voicings)
+
+        best = _best_voicings(candidates)
+
+        voiced = []
+        for voicing, spelling in zip(best, spellings):
+            notes = []
+            for midi_num in voicing:
+                pitch, accidental = spelling[midi_num % 12]
+                octave = ((midi_num - _NATURAL_SEMITONES[_PITCH_INDEX[pitch]] - _ACCIDENTAL_OFFSETS[accidental]) // 12) - 1
+                # fall back to the default spelling where the chord's would be outside the octave range (e.g., B#-2)
+                notes.append(_NOTE_TABLE.get((pitch, octave, accidental), _NOTES_BY_MIDI_NUM[midi_num]))
+            voiced.append(Chord._from_sorted(sorted(notes, key=_SORT_KEY_GETTER)))
+
+        return voiced
+
+    @classmethod
+    def _parse_progression(cls, progression):
+        """Convert a progression to a tuple of (upper case) chord numbers.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the progression is not a string or list of strings.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any chord number is not supported.
+        """
+        if isinstance(progression, str):
+            progression = progression.split()
+
+        chord_numbers = []
+        for chord_number in progression:
+            if not isinstance(chord_number, str):
+                raise TypeError('Expected string for chord number, got \'' + str(chord_number) + '\'')
+            if not chord_number.upper() in _CHORD_NUMBERS:
+                raise ValueError('Unsupported chord number: ' + str(chord_number))
+            chord_numbers.append(chord_number.upper())
+
+        return tuple(chord_numbers)
+
+    @classmethod
+    def _built_chord_notes(cls, tonic_key, chord_number, chord_type):
+        """Get the (cached) notes of a chord from (already validated) arguments to :attr:`~music_essentials.chord.Chord.build_chord`."""
+        scale_pattern = Scale._SCALE_PATTERNS[chord_type]
+        key = (tonic_key.pitch, tonic_key.octave, tonic_key.accidental, chord_number, scale_pattern)
+        notes = Chord._BUILT_CHORDS.get(key)
+        if notes is None:
+            root_idx, index_diffs = _CHORD_NUMBERS[chord_number]
+            degrees = Chord._key_degrees(tonic_key, scale_pattern)
+            notes = tuple(_degree_note(degrees, root_idx + index_diff)
+                for index_diff in (0,) + Chord._CHORD_PATTERNS[chord_type] + index_diffs)
+            Chord._BUILT_CHORDS[key] = notes
+
+        return notes
+
+    @classmethod
+    def _key_degrees(cls, tonic_key, scale_pattern):
+        """Get the (cached) notes of each degree of a key, from the tonic up to the seventh degree."""
+        key = (tonic_key.pitch, tonic_key.octave, tonic_key.accidental, scale_pattern)
+        degrees = Chord._KEY_DEGREES.get(key)
+        if degrees is None:
+            degrees = tuple(Scale._build_pattern(tonic_key, scale_pattern)[:-1])
+            Chord._KEY_DEGREES[key] = degrees
+
+        return degrees
+
+    @classmethod
+    def _from_sorted(cls, notes):
+        """Create a new Chord from (already validated) notes in ascending order."""
+        chord = object.__new__(cls)
+        chord.notes = list(notes)
+        return chord
+
+    def identify(self):
+        """Name the chord by its root, quality, and inversion.
+
+        The notes are reduced to a set of pitch classes, which is looked up in a table built once
+        for all 4096 possible sets, so octave doublings and enharmonic spellings do not matter. If the
+        set matches more than one chord (e.g., ``C4+E4+G4+A4`` is both C major 6 and A minor 7), the
+        chord whose root is the lowest note is preferred.
+
+        Supported qualities are 'major', 'minor', 'diminished', 'augmented', 'sus4', 'sus2', 'power',
+        'dominant 7', 'major 7', 'minor 7', 'minor major 7', 'half-diminished 7', 'diminished 7',
+        'augmented 7', 'augmented major 7', '7sus4', 'major 6', 'minor 6', 'dominant 9', 'major 9',
+        'minor 9', 'add9', 'minor add9', 'dominant 11', 'minor 11', and 'dominant 13'.
+
+        Returns:
+            :attr:`~music_essentials.chord.ChordName`
+                A named tuple of ``(root, quality, inversion)``, where `root` is the lowest note of the
+                chord with the root's pitch class, and `inversion` is the position of the lowest note
+                in the stacked chord (0 for root position, 1 for first inversion, ...). `None` if the
+                notes do not form a supported chord.
+
+        Examples:
+            >>> name = Chord.from_string('E4+G4+C5').identify()
+            >>> print(name.root, name.quality, name.inversion)
+            C5 major 1
+            >>> print(Chord.from_string('G3+B3+D4+F4').identify().quality)
+            dominant 7
+        """
+        if self.root().is_rest:
+            return None
+
+        mask = 0
+        for n in self.notes:
+            mask |= 1 << (n.midi_note_number() % 12)
+
+        names = _CHORD_NAMES[mask]
+        if names is None:
+            return None
+
+        root_pitch_class, quality, inversion = names[self.root().midi_note_number() % 12]
+        for n in self.notes:
+            if n.midi_note_number() % 12 == root_pitch_class:
+                return ChordName(n, quality, inversion)
 
     def root(self):
         """Get the root (i.e., lowest) note of the chord.
@@ -164,18 +536,13 @@ class Chord(object):
             D4+E4+G4
         """
         if not isinstance(new_note, Note):
-            raise TypeError('Expected Note for new note, got \'' + str(new_note + '\''))
-
-        if new_note < self.root():
-            self.notes.insert(0, new_note)
-            return
-
-        for i in range(len(self.notes) - 1):
-            if (new_note >= self.notes[i]) and (new_note < self.notes[i + 1]):
-                self.notes.insert(i + 1, new_note)
-                return
+            raise TypeError('Expected Note for new note, got \'' + str(new_note) + '\'')
+        if new_note.is_rest or self.root().is_rest:
+            raise TypeError('Can not compare rests; rests can not be added to chords')
 
-        self.notes.append(new_note)
+        # keys are derived on each call, as the notes may have been changed directly; insert after any equal notes
+        i = bisect.bisect_right([n._sort_key for n in self.notes], new_note._sort_key)
+        self.notes.insert(i, new_note)
     
     def __str__(self):
         """Get a string representation of the chord.
@@ -189,4 +556,150 @@ class Chord(object):
             out += n.__str__() + '+'
         out = out [:-1]
         
-        return out
\ No newline at end of file
+        return out
+
+def _degree_note(degrees, index):
+    """Get the note at a scale index (which may be beyond the seventh degree) of a key.
+
+    Raises:
+        `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+            If the note is outside the MIDI range.
+    """
+    octave_diff, degree = divmod(index, len(degrees))
+    n = degrees[degree]
+    return _interned_note(n.pitch, n.octave + octave_diff, n.accidental)
+
+def _build_chord_numbers():
+    """Map every supported chord number, with and without an extension, to its scale index and extra pitch index differences."""
+    chord_numbers = {}
+    for number, root_idx in Chord._CHORD_NUM_SCALE_INDEX.items():
+        for suffix, index_diffs in Chord._CHORD_EXTENSIONS.items():
+            chord_numbers[number + suffix] = (root_idx, index_diffs)
+
+    return chord_numbers
+
+_CHORD_NUMBERS = _build_chord_numbers()
+
+def _build_chord_names():
+    """Name every set of pitch classes that forms a supported chord quality.
+
+    Returns:
+        list
+            Indexed by 12-bit pitch class mask. Each entry is `None` if the set is not a supported chord;
+            otherwise it is a tuple indexed by the pitch class of the lowest note, of
+            ``(root pitch class, quality, inversion)`` (`None` where the pitch class is not in the set).
+    """
+    # key = mask; val = list of (root pitch class, quality, semitones), in order of preference
+    matches = collections.defaultdict(list)
+    for quality, semitones in Chord._CHORD_QUALITIES:
+        for root_pitch_class in range(12):
+            mask = 0
+            for semitone in semitones:
+                mask |= 1 << ((root_pitch_class + semitone) % 12)
+            matches[mask].append((root_pitch_class, quality, semitones))
+
+    names = [None] * 4096
+    for mask, candidates in matches.items():
+        by_bass = [None] * 12
+        for bass in range(12):
+            if not (mask >> bass) & 1:
+                continue
+            # prefer the candidate rooted on the bass note, otherwise the first listed
+            root_pitch_class, quality, semitones = candidates[0]
+            for candidate in candidates:
+                if candidate[0] == bass:
+                    root_pitch_class, quality, semitones = candidate
+                    break
+            by_bass[bass] = (root_pitch_class, quality, semitones.index((bass - root_pitch_class) % 12))
+        names[mask] = tuple(by_bass)
+
+    return names
+
+_CHORD_NAMES = _build_chord_names()
+
+def _voicings(pitch_classes, voices, lowest_midi_num, highest_midi_num, max_spread):
+    """List every voicing of a set of pitch classes.
+
+    Returns:
+        list
+            Ascending tuples of `voices` distinct MIDI numbers in the range, no more than `max_spread`
+            semitones apart, that include every pitch class; in ascending order.
+    """
+    notes = [m for m in range(lowest_midi_num, highest_midi_num + 1) if (m % 12) in pitch_classes]
+    voicings = []
+
+    def extend(voicing, start, missing):
+        if len(voicing) == voices:
+            if not missing:
+                voicings.append(tuple(voicing))
+            return
+        if len(missing) > voices - len(voicing):
+            return # not enough voices left to cover every pitch class
+        for i in range(start, len(notes)):
+            if voicing and (notes[i] - voicing[0] > max_spread):
+                break
+            voicing.append(notes[i])
+            extend(voicing, i + 1, missing - set([notes[i] % 12]))
+            voicing.pop()
+
+    extend([], 0, set(pitch_classes))
+    return voicings
+
+def _movement(voicing_1, voicing_2):
+    """Calculate the total voice movement between two voicings, matching voices in sorted order."""
+    return sum(map(abs, map(operator.sub, voicing_1, voicing_2)))
+
+def _greedy_movement(candidates):
+    """Calculate the total movement when each voicing is the closest to the one before; an upper bound on the best total movement."""
+    previous = candidates[0][0]
+    total = 0
+    for voicings in candidates[1:]:
+        nearest = min(voicings, key=lambda v: _movement(previous, v))
+        total += _movement(previous, nearest)
+        previous = nearest
+
+    return total
+
+def _best_voicings(candidates):
+    """Find the sequence of voicings, one from each list of candidates, with the smallest total voice movement.
+
+    Uses dynamic programming over the candidates of each chord. Branches are pruned by a greedy upper bound
+    (states already costing more can not lead to a better sequence), and, for each voicing, previous states
+    are visited cheapest first so the search stops once no cheaper path is possible. The change in the sum
+    of the notes is a lower bound on the movement, used to skip most exact calculations.
+    """
+    bound = _greedy_movement(candidates)
+
+    # each state is (voicing, total movement so far, index of the previous state)
+    states = [(v, 0, None) for v in candidates[0]]
+    history = [states]
+    for voicings in candidates[1:]:
+        by_cost = sorted(range(len(states)), key=lambda i: states[i][1])
+        totals = [sum(states[i][0]) for i in by_cost]
+        next_states = []
+        for voicing in voicings:
+            total = sum(voicing)
+            best_cost, best_state = None, None
+            for i, previous_total in zip(by_cost, totals):
+                previous, cost, parent = states[i]
+                if best_cost is not None:
+                    if cost >= best_cost:
+                        break # movement is never negative, so no later state can do better
+                    if cost + abs(total - previous_total) >= best_cost:
+                        continue # the voices must move at least as far as their total changes
+                cost += _movement(previous, voicing)
+                if (best_cost is None) or (cost < best_cost):
+                    best_cost, best_state = cost, i
+            if best_cost <= bound:
+                next_states.append((voicing, best_cost, best_state))
+        states = next_states # never empty; the greedy sequence is always within the bound
+        history.append(states)
+
+    i = min(range(len(states)), key=lambda i: states[i][1])
+    path = []
+    for states in reversed(history):
+        voicing, cost, parent = states[i]
+        path.append(voicing)
+        i = parent
+
+    return path[::-1]
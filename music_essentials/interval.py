@@ -1,5 +1,16 @@
+import re
+
 class Interval(object):
-    """Representation of an interval (i.e., gap) between notes."""
+    """Representation of an interval (i.e., gap) between notes.
+
+    Intervals are immutable. :attr:`~music_essentials.interval.Interval.from_interval_string()` returns
+    shared, interned instances - one per interval type, size, and direction.
+
+    Intervals can be ascending (the default) or descending. Adding a descending interval to a
+    note transposes the note down.
+    """
+
+    __slots__ = ('interval_type', 'size', 'descending', '_semitones')
 
     NAMED_INTERVAL_TYPES = ('M', 'm', 'P', 'dim', 'aug')
     """Explicit interval types supported - major, minor, diminished, augmented."""
@@ -27,7 +38,7 @@ class Interval(object):
     _PERFECT_INTERVALS_SEMITONES = {1:0, 4:5, 5:7}
     _MAJOR_INTERVALS_SEMITONES = {2:2, 3:4, 6:9, 7:11}
 
-    def __init__(self, interval_type, size):
+    def __init__(self, interval_type, size, descending=False):
         """Create a new Interval.
 
         Args:
@@ -36,6 +47,10 @@ class Interval(object):
             distance : int
                 The size of the interval. Should be positive.
 
+        Kwargs:
+            descending : bool (default `False`)
+                If true, the interval moves downwards.
+
         Returns:
             :attr:`~music_essentials.interval.Interval`
                 A new interval of the given type and size.
@@ -54,6 +69,9 @@ class Interval(object):
             >>> i = Interval('dim', 13)
             >>> print(i)
             dim13
+            >>> i = Interval('M', 3, descending=True)
+            >>> print(i)
+            -M3
             >>> i = Interval('i', 6)
             ValueError: Unsupported interval type specified: i
             >>> i = Interval('m', -1)
@@ -75,23 +93,45 @@ class Interval(object):
         if int(size) <= 0:
             raise ValueError('Expected interval distance to be positive, got: ' + str(size))
 
-        # convert interval to base (i.e., non-compound equivalent)
-        interval_string = str(interval_type)
-        if int(size) >= 8:
-            base_size = int(size) - 7
-            while (base_size >= 8):
-                base_size -= 7
-            interval_string += str(base_size)
-        else:
-            interval_string += str(size)
-
-        # check if interval is possible (e.g., M4 is not a valid interval - it's P4)
-        if interval_string not in Interval.VALID_INTERVAL_TYPES:
+        # check if interval is possible (e.g., M4 is not a valid interval - it's P4), using the base (i.e., non-compound) size
+        if (interval_type, ((int(size) - 1) % 7) + 1) not in _INTERVAL_SEMITONES:
             raise ValueError('Impossible interval type specified: ' + str(interval_type) + str(size))
 
-        self.interval_type = interval_type
-        self.size = int(size)
+        object.__setattr__(self, 'interval_type', interval_type)
+        object.__setattr__(self, 'size', int(size))
+        object.__setattr__(self, 'descending', bool(descending))
+        object.__setattr__(self, '_semitones', _calculate_semitones(interval_type, int(size), bool(descending)))
     
+    @classmethod
+    def _from_trusted(cls, interval_type, size, descending=False):
+        """Create a new Interval without validating its parameters.
+
+        For internal use, where the interval type and size are already known to form a valid
+        interval. User code should use the validating constructor
+        :attr:`~music_essentials.interval.Interval.__init__()` instead.
+
+        Args:
+            interval_type : str
+                The type of interval; one of :attr:`~music_essentials.interval.Interval.NAMED_INTERVAL_TYPES`.
+            size : int
+                The size of the interval.
+
+        Kwargs:
+            descending : bool (default `False`)
+                If true, the interval moves downwards.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                A new interval of the given type and size.
+        """
+        interval = object.__new__(cls)
+        object.__setattr__(interval, 'interval_type', interval_type)
+        object.__setattr__(interval, 'size', size)
+        object.__setattr__(interval, 'descending', descending)
+        object.__setattr__(interval, '_semitones', _calculate_semitones(interval_type, size, descending))
+
+        return interval
+
     @classmethod
     def from_interval_string(cls, interval_string):
         """Create a new Interval.
@@ -102,6 +142,9 @@ class Interval(object):
             interval_string : str
                 A string representing the interval to create. Should be in the form:
                     ``<interval type><size>``
+
+                or, for a descending interval:
+                    ``-<interval type><size>``
                 
                 The interval type should be one of :attr:`~music_essentials.interval.Interval.NAMED_INTERVAL_TYPES`.
 
@@ -125,6 +168,9 @@ class Interval(object):
             >>> i = Interval.from_interval_string('dim13')
             >>> print(i)
             dim13
+            >>> i = Interval.from_interval_string('-P5')
+            >>> print(i.descending)
+            True
             >>> i = Interval.from_interval_string('i6')
             ValueError: Unsupported interval type specified: i
             >>> i = Interval.from_interval_string('m-1')
@@ -135,15 +181,345 @@ class Interval(object):
         if not isinstance(interval_string, str):
             raise TypeError('Expected string for interval string, got \'' + str(interval_string + '\''))
 
+        if cls is Interval:
+            interval = _INTERVALS_BY_STRING.get(interval_string)
+            if interval is not None:
+                return interval
+
+            match = _INTERVAL_STRING_PATTERN.match(interval_string)
+            if match is not None:
+                interval_type, size = match.group(2), int(match.group(3))
+                if (size > 0) and ((interval_type, ((size - 1) % 7) + 1) in _INTERVAL_SEMITONES):
+                    return _interned_interval(interval_type, size, match.group(1) == '-')
+
+        # slow path - reports the reason the interval string is invalid
+        descending = interval_string.startswith('-')
+        if descending:
+            interval_string = interval_string[1:]
         for i in Interval.NAMED_INTERVAL_TYPES:
             if interval_string.startswith(i):
                 interval_type = i
                 size = interval_string.replace(i, '')
 
-                return cls(interval_type, size)
+                return cls(interval_type, size, descending)
 
         raise ValueError('Invalid interval string: ' + str(interval_string))
 
+    @classmethod
+    def between(cls, note_1, note_2, signed=False):
+        """Calculate the interval between two notes.
+
+        By default, the interval is measured from the lower to the higher note, where lower and
+        higher are decided by written pitch (e.g., the interval between ``B3#`` and ``C4`` is a
+        diminished second). Compound intervals are returned for notes more than an octave apart.
+
+        Args:
+            note_1 : :attr:`~music_essentials.note.Note`
+                The first note.
+
+            note_2 : :attr:`~music_essentials.note.Note`
+                The second note.
+
+        Kwargs:
+            signed : bool (default `False`)
+                If true, measure from `note_1` to `note_2`, giving a descending interval if
+                `note_2` is written lower than `note_1`.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The interval between the two notes, such that adding it to the lower note
+                gives the higher note (or, if signed, adding it to `note_1` gives `note_2`).
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If either argument is not a :attr:`~music_essentials.note.Note`, or is a :attr:`~music_essentials.note.Rest`.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the interval can not be named by a supported interval type (e.g., a doubly augmented interval).
+
+        Examples:
+            >>> i = Interval.between(Note.from_note_string('C4'), Note.from_note_string('E4b'))
+            >>> print(i)
+            m3
+            >>> i = Interval.between(Note.from_note_string('G5'), Note.from_note_string('C4'))
+            >>> print(i)
+            P12
+            >>> i = Interval.between(Note.from_note_string('G5'), Note.from_note_string('C4'), signed=True)
+            >>> print(i)
+            -P12
+            >>> i = Interval.between(Note.from_note_string('C4'), Note.from_note_string('A5#'))
+            >>> print(i)
+            aug13
+        """
+        if _Note is None:
+            _import_note()
+
+        if (not isinstance(note_1, _Note)) or (not isinstance(note_2, _Note)) or note_1.is_rest or note_2.is_rest:
+            raise TypeError('Can not calculate interval between \'' + str(note_1) + '\' and \'' + str(note_2) + '\'')
+
+        steps = ((note_2.octave * 7) + _PITCH_INDEX[note_2.pitch]) - ((note_1.octave * 7) + _PITCH_INDEX[note_1.pitch])
+        semitones = note_2.midi_note_number() - note_1.midi_note_number()
+        if (steps < 0) and not signed:
+            steps = -steps
+            semitones = -semitones
+
+        interval = _interval_from_steps(steps, semitones)
+        if interval is None:
+            raise ValueError('Can not name the interval between \'' + str(note_1) + '\' and \'' + str(note_2) + '\'')
+
+        return interval
+
+    def semitones(self):
+        """Get the number of semitones spanned by the interval.
+
+        Returns:
+            int
+                The number of semitones in the interval; negative for descending intervals.
+
+        Examples:
+            >>> Interval.from_interval_string('m3').semitones()
+            3
+            >>> Interval.from_interval_string('P12').semitones()
+            19
+            >>> Interval.from_interval_string('dim1').semitones()
+            -1
+            >>> Interval.from_interval_string('-M3').semitones()
+            -4
+        """
+        return self._semitones
+
+    def is_compound(self):
+        """Check if the interval is a `compound interval <https://en.wikipedia.org/wiki/Interval_(music)#Simple_and_compound>`_
+        (i.e., larger than an octave).
+
+        Returns:
+            bool
+                True if the interval is larger than an octave, otherwise false.
+        """
+        return self.size > 8
+
+    def simple(self):
+        """Get the simple equivalent of the interval, by removing whole octaves.
+
+        Intervals up to and including an octave are already simple, and are returned unchanged.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The interval reduced to at most an octave.
+
+        Examples:
+            >>> print(Interval.from_interval_string('M10').simple())
+            M3
+            >>> print(Interval.from_interval_string('P15').simple())
+            P8
+        """
+        if self.size <= 8:
+            return self
+
+        return _interned_interval(self.interval_type, ((self.size - 2) % 7) + 2, self.descending)
+
+    def compound(self, octaves=1):
+        """Get the interval widened by a number of octaves.
+
+        Kwargs:
+            octaves : int (default 1)
+                The number of octaves to add. Should not be negative.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The compound interval.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the number of octaves is negative.
+
+        Examples:
+            >>> print(Interval.from_interval_string('M3').compound())
+            M10
+        """
+        if octaves < 0:
+            raise ValueError('Expected non-negative number of octaves, got: ' + str(octaves))
+
+        return _interned_interval(self.interval_type, self.size + (7 * octaves), self.descending)
+
+    def inversion(self):
+        """Get the `inversion <https://en.wikipedia.org/wiki/Interval_(music)#Inversion>`_ of the interval.
+
+        Compound intervals are reduced to simple intervals before being inverted. The inversion
+        of a descending interval is also descending.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The inverted interval - the interval that, added to this interval, makes an octave.
+
+        Examples:
+            >>> print(Interval.from_interval_string('M3').inversion())
+            m6
+            >>> print(Interval.from_interval_string('aug4').inversion())
+            dim5
+            >>> print(Interval.from_interval_string('P8').inversion())
+            P1
+        """
+        simple = abs(self.simple())
+        inversion = _interval_from_steps(7 - (simple.size - 1), 12 - simple.semitones())
+        if self.descending:
+            return -inversion
+        return inversion
+
+    def __neg__(self):
+        """Get the interval of the same type and size, moving in the opposite direction.
+
+        Examples:
+            >>> print(-Interval.from_interval_string('M3'))
+            -M3
+        """
+        return _interned_interval(self.interval_type, self.size, not self.descending)
+
+    def __abs__(self):
+        """Get the ascending interval of the same type and size.
+
+        Examples:
+            >>> print(abs(Interval.from_interval_string('-M3')))
+            M3
+        """
+        return _interned_interval(self.interval_type, self.size)
+
+    def __add__(self, other):
+        """Add two intervals together.
+
+        Args:
+            other : :attr:`~music_essentials.interval.Interval`
+                The interval to add.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The interval spanning both intervals, stacked on top of each other.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to add is not an :attr:`~music_essentials.interval.Interval`.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the result can not be named by a supported interval type.
+
+        Examples:
+            >>> print(Interval.from_interval_string('M3') + Interval.from_interval_string('m3'))
+            P5
+            >>> print(Interval.from_interval_string('P5') + Interval.from_interval_string('P5'))
+            M9
+        """
+        if not isinstance(other, Interval):
+            raise TypeError('unsupported operand type(s) for +: \'Interval\' and \'' + str(other.__class__.__name__) + '\'')
+
+        interval = _interval_from_steps(self._steps() + other._steps(), self._semitones + other._semitones)
+        if interval is None:
+            raise ValueError('Can not name the interval ' + str(self) + ' + ' + str(other))
+
+        return interval
+
+    def __sub__(self, other):
+        """Subtract an interval from this interval.
+
+        Args:
+            other : :attr:`~music_essentials.interval.Interval`
+                The interval to subtract.
+
+        Returns:
+            :attr:`~music_essentials.interval.Interval`
+                The interval that, added to `other`, gives this interval. Descending if `other`
+                is larger than this interval.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to subtract is not an :attr:`~music_essentials.interval.Interval`.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the result can not be named by a supported interval type.
+
+        Examples:
+            >>> print(Interval.from_interval_string('P5') - Interval.from_interval_string('M3'))
+            m3
+            >>> print(Interval.from_interval_string('M3') - Interval.from_interval_string('P5'))
+            -m3
+        """
+        if not isinstance(other, Interval):
+            raise TypeError('unsupported operand type(s) for -: \'Interval\' and \'' + str(other.__class__.__name__) + '\'')
+
+        interval = _interval_from_steps(self._steps() - other._steps(), self._semitones - other._semitones)
+        if interval is None:
+            raise ValueError('Can not name the interval ' + str(self) + ' - ' + str(other))
+
+        return interval
+
+    def __eq__(self, other):
+        """Check if this interval is equal to another interval.
+
+        Intervals are equal if they have the same type, size, and direction; `enharmonically equivalent
+        <https://en.wikipedia.org/wiki/Enharmonic>`_ intervals (e.g., ``aug4`` and ``dim5``) are not equal.
+
+        Returns:
+            bool
+                True if the intervals have the same type, size, and direction, otherwise false.
+        """
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        """Check if this interval is not equal to another interval."""
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        """Check if this interval is smaller than another interval.
+
+        Intervals are ordered by size, then by number of semitones (e.g., ``m3 < M3 < aug3 < dim4``).
+        Descending intervals are smaller than ascending intervals, and larger descending intervals
+        are smaller than smaller descending intervals (e.g., ``-P5 < -M3 < M3``).
+        """
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return self._key() < other._key()
+
+    def __gt__(self, other):
+        """Check if this interval is larger than another interval; see :attr:`~music_essentials.interval.Interval.__lt__()`."""
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return self._key() > other._key()
+
+    def __le__(self, other):
+        """Check if this interval is smaller than or equal to another interval."""
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return self._key() <= other._key()
+
+    def __ge__(self, other):
+        """Check if this interval is larger than or equal to another interval."""
+        if not isinstance(other, Interval):
+            return NotImplemented
+
+        return self._key() >= other._key()
+
+    def __hash__(self):
+        """Get a hash value for the interval, consistent with :attr:`~music_essentials.interval.Interval.__eq__()`."""
+        return hash(self._key())
+
+    def _steps(self):
+        """Get the signed number of letter-name steps spanned by the interval."""
+        if self.descending:
+            return 1 - self.size
+        return self.size - 1
+
+    def _key(self):
+        """Get a tuple that orders intervals by signed size, then signed semitones."""
+        return (self._steps(), self._semitones, self.descending)
+
     def __str__(self):
         """Create a string representation of the interval in the form ``<interval type><size>``
         
@@ -153,10 +529,130 @@ class Interval(object):
             >>> i = Interval.from_interval_string('m7')
             >>> print(i)
             m7
+            >>> i = Interval.from_interval_string('-m7')
+            >>> print(i)
+            -m7
         """
+        if self.descending:
+            return '-' + self.interval_type + str(self.size)
         return self.interval_type + str(self.size)
 
+    def __setattr__(self, name, value):
+        """Prevent modification of the interval; intervals are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not modify attribute \'' + str(name) + '\' of immutable Interval')
+
+    def __delattr__(self, name):
+        """Prevent deletion of interval attributes; intervals are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not delete attribute \'' + str(name) + '\' of immutable Interval')
+
+    def __reduce__(self):
+        """Support pickling and copying by re-creating the interval from its type, size, and direction."""
+        return (self.__class__, (self.interval_type, self.size, self.descending))
+
+
+def _build_interval_semitones():
+    """Map every ``(interval type, base size)`` in :attr:`~music_essentials.interval.Interval.VALID_INTERVAL_TYPES`
+    to the number of semitones it spans."""
+    semitones = {}
+    for size, base in Interval._PERFECT_INTERVALS_SEMITONES.items():
+        semitones[('dim', size)] = base - 1
+        semitones[('P', size)] = base
+        semitones[('aug', size)] = base + 1
+    for size, base in Interval._MAJOR_INTERVALS_SEMITONES.items():
+        semitones[('dim', size)] = base - 2
+        semitones[('m', size)] = base - 1
+        semitones[('M', size)] = base
+        semitones[('aug', size)] = base + 1
+
+    return semitones
+
+# keys = (interval type, base size in the range [1, 7]); values = number of semitones
+_INTERVAL_SEMITONES = _build_interval_semitones()
+
+def _calculate_semitones(interval_type, size, descending=False):
+    """Calculate the (signed) number of semitones in an (already validated) interval."""
+    octaves, base_steps = divmod(size - 1, 7)
+    semitones = _INTERVAL_SEMITONES[(interval_type, base_steps + 1)] + (octaves * 12)
+    if descending:
+        return -semitones
+    return semitones
+
+def _interval_from_steps(steps, semitones):
+    """Get the interval spanning a (signed) number of letter-name steps and semitones.
+
+    A negative number of steps gives a descending interval.
+
+    Returns:
+        :attr:`~music_essentials.interval.Interval`
+            The interned interval, or `None` if the interval can not be named by a supported
+            interval type.
+    """
+    descending = steps < 0
+    if descending:
+        steps = -steps
+        semitones = -semitones
+
+    octaves, base_steps = divmod(steps, 7)
+    interval_type = _INTERVAL_TYPES_BY_SEMITONES.get((base_steps + 1, semitones - (octaves * 12)))
+    if interval_type is None:
+        return None
+
+    return _interned_interval(interval_type, steps + 1, descending)
+
+# keys = (base size in the range [1, 7], number of semitones); values = interval type
+_INTERVAL_TYPES_BY_SEMITONES = dict(((size, semitones), interval_type) for (interval_type, size), semitones in _INTERVAL_SEMITONES.items())
+
+_INTERVAL_STRING_PATTERN = re.compile(r'(-?)(M|m|P|dim|aug)([0-9]+)\Z')
+
+# key = (interval type, size, descending); val = interned interval
+_INTERVALS = {}
+
+# key = interval string; val = interned interval
+_INTERVALS_BY_STRING = {}
+
+def _interned_interval(interval_type, size, descending=False):
+    """Get the shared instance of an (already validated) interval.
+
+    Only intervals up to two octaves are interned; larger intervals are created on each call,
+    so that arbitrarily large sizes can not grow the tables without bound.
+    """
+    interval = _INTERVALS.get((interval_type, size, descending))
+    if interval is None:
+        interval = Interval._from_trusted(interval_type, size, descending)
+
+    return interval
+
+def _intern_common_intervals():
+    """Create the shared instances of all simple and compound intervals up to two octaves, in both directions."""
+    for interval_type, size in _INTERVAL_SEMITONES:
+        for octaves in (0, 1, 2):
+            for descending in (False, True):
+                interval = Interval._from_trusted(interval_type, size + (octaves * 7), descending)
+                _INTERVALS[(interval_type, interval.size, descending)] = interval
+                _INTERVALS_BY_STRING[str(interval)] = interval
+
+_intern_common_intervals()
+
+# the note module imports this one, so these are set by _import_note() on first use rather than at load time
+_Note = None
+_PITCH_INDEX = None
+
+def _import_note():
+    """Import the note class and pitch index table used by :attr:`~music_essentials.interval.Interval.between()`."""
+    global _Note, _PITCH_INDEX
+    from .note import Note, _PITCH_INDEX
+    _Note = Note
 
-_TONE = Interval.from_interval_string('M2')
-_SEMITONE = Interval.from_interval_string('m2')
-_TONE_AND_HALF = Interval.from_interval_string('aug2')
\ No newline at end of file
+_TONE = _interned_interval('M', 2)
+_SEMITONE = _interned_interval('m', 2)
+_TONE_AND_HALF = _interned_interval('aug', 2)
\ No newline at end of file
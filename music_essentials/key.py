@@ -0,0 +1,499 @@
+import collections
+import itertools
+import operator
+
+import numpy as np
+
+from .note import Note, _NOTE_TABLE
+from .note_array import NoteArray
+from .scale import Scale
+
+# Krumhansl-Kessler key profiles, indexed by semitones above the tonic
+_MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+_MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+# index = tonic pitch class; val = (pitch, accidental) of the conventional key signature spelling
+_MAJOR_TONICS = (('C', None), ('D', 'b'), ('D', None), ('E', 'b'), ('E', None), ('F', None),
+    ('F', '#'), ('G', None), ('A', 'b'), ('A', None), ('B', 'b'), ('B', None))
+_MINOR_TONICS = (('C', None), ('C', '#'), ('D', None), ('E', 'b'), ('E', None), ('F', None),
+    ('F', '#'), ('G', None), ('G', '#'), ('A', None), ('B', 'b'), ('B', None))
+
+# number of notes read at a time from a list or generator
+_CHUNK_SIZE = 65536
+
+_MIDI_NUM_GETTER = operator.attrgetter('_midi_note_number')
+
+class Key(object):
+    """A major or minor key, as found by `Krumhansl-Schmuckler key finding
+    <http://rnhart.net/articles/key-finding/>`_.
+
+    The pitch classes of a collection of notes are counted (optionally weighted by duration), and
+    the counts are correlated against the Krumhansl-Kessler profile of all 24 major and minor keys
+    in a single matrix multiplication. The key with the highest correlation is the best match.
+
+    Keys are immutable. Major keys use the 'major' scale type, and minor keys the 'minor' (harmonic
+    minor) scale type, of :attr:`~music_essentials.scale.Scale`.
+    """
+
+    __slots__ = ('tonic', 'scale_type', 'correlation')
+
+    KEY_TYPES = ('major', 'minor')
+    """Supported key types."""
+
+    def __init__(self, tonic, scale_type, correlation=None):
+        """Create a new Key.
+
+        Args:
+            tonic : :attr:`~music_essentials.note.Note`
+                The tonic of the key.
+
+            scale_type : str
+                Either 'major' or 'minor'.
+
+        Kwargs:
+            correlation : float (default `None`)
+                How well the key matched the analysed notes, in the range [-1, 1].
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the tonic is not a :attr:`~music_essentials.note.Note`, or is a rest.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the key type is not supported.
+
+        Examples:
+            >>> k = Key(Note.from_note_string('E4b'), 'minor')
+            >>> print(k)
+            Eb minor
+        """
+        if (not isinstance(tonic, Note)) or tonic.is_rest:
+            raise TypeError('Expected Note for tonic, got ' + str(tonic))
+        if scale_type not in Key.KEY_TYPES:
+            raise ValueError('Unknown key type \'' + str(scale_type) + '\'')
+
+        object.__setattr__(self, 'tonic', tonic)
+        object.__setattr__(self, 'scale_type', scale_type)
+        object.__setattr__(self, 'correlation', correlation)
+
+    @classmethod
+    def detect(cls, notes, durations=None):
+        """Find the key that best matches a collection of notes.
+
+        Args:
+            notes : list, :attr:`~music_essentials.note_array.NoteArray`, or iterable
+                The notes to analyse. Rests are ignored. Iterables (e.g., generators) are read
+                in chunks, so long streams are never held in memory at once.
+
+        Kwargs:
+            durations : array_like or iterable (default `None`)
+                The duration of each note, used to weight its pitch class. If `None`, every note
+                has equal weight.
+
+        Returns:
+            :attr:`~music_essentials.key.Key`
+                The best matching key (with tonic in octave 4), or `None` if there are no notes
+                or every pitch class is equally common.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is given.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the number of durations does not match the number of notes, or any duration is negative.
+
+        Examples:
+            >>> notes = Note.parse_many(['C4', 'E4', 'G4', 'C5', 'D4', 'F4', 'B3', 'C4'])
+            >>> print(Key.detect(notes))
+            C major
+        """
+        correlations = _key_correlations(_pitch_class_histogram(notes, durations))
+        if correlations is None:
+            return None
+
+        index = int(np.argmax(correlations))
+        return _key_at(index, float(correlations[index]))
+
+    @classmethod
+    def rank(cls, notes, durations=None):
+        """Rank all 24 major and minor keys by how well they match a collection of notes.
+
+        Args:
+            notes : list, :attr:`~music_essentials.note_array.NoteArray`, or iterable
+                The notes to analyse; see :attr:`~music_essentials.key.Key.detect()`.
+
+        Kwargs:
+            durations : array_like or iterable (default `None`)
+                The duration of each note; see :attr:`~music_essentials.key.Key.detect()`.
+
+        Returns:
+            list
+                The :attr:`~music_essentials.key.Key` objects, best match first. Empty if there are
+                no notes or every pitch class is equally common.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is given.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the number of durations does not match the number of notes, or any duration is negative.
+        """
+        correlations = _key_correlations(_pitch_class_histogram(notes, durations))
+        if correlations is None:
+            return []
+
+        order = np.argsort(-correlations, kind='stable')
+        return [_key_at(index, correlation) for index, correlation in zip(order.tolist(), correlations[order].tolist())]
+
+    def scale(self):
+        """Build the scale of the key.
+
+        Returns:
+            :attr:`~music_essentials.scale.Scale`
+                The scale starting on the tonic of the key.
+        """
+        return Scale(self.tonic, self.scale_type)
+
+    def __eq__(self, other):
+        """Check if two keys have the same tonic spelling and key type; correlations are ignored."""
+        if not isinstance(other, Key):
+            return NotImplemented
+
+        return (self.tonic == other.tonic) and (self.scale_type == other.scale_type)
+
+    def __ne__(self, other):
+        """Check if two keys differ in tonic spelling or key type; correlations are ignored."""
+        if not isinstance(other, Key):
+            return NotImplemented
+
+        return not self == other
+
+    def __hash__(self):
+        """Hash the key by its tonic and key type."""
+        return hash((self.tonic, self.scale_type))
+
+    def __setattr__(self, name, value):
+        """Prevent modification of the key; keys are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not modify attribute \'' + str(name) + '\' of immutable Key')
+
+    def __delattr__(self, name):
+        """Prevent deletion of key attributes; keys are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not delete attribute \'' + str(name) + '\' of immutable Key')
+
+    def __reduce__(self):
+        """Support pickling and copying by re-creating the key from its tonic, type, and correlation."""
+        return (self.__class__, (self.tonic, self.scale_type, self.correlation))
+
+    def __str__(self):
+        """Create a string representation of the key in the form ``<pitch><accidental> <key type>``.
+
+        Examples:
+            >>> print(Key(Note.from_note_string('F4#'), 'major'))
+            F# major
+        """
+        return self.tonic.pitch + (self.tonic.accidental or '') + ' ' + self.scale_type
+
+class KeyTracker(object):
+    """Follow the key of a stream of notes as they arrive.
+
+    The tracker keeps a running pitch class profile of the notes seen so far, so each new note
+    costs a constant amount of work regardless of how long the stream is. To follow modulations,
+    old notes can be forgotten either with a sliding window (only the most recent notes count) or
+    with exponential decay (each new note scales down the weight of everything before it).
+    Rests are ignored.
+    """
+
+    def __init__(self, window=None, decay=None):
+        """Create a new KeyTracker.
+
+        If neither a window nor a decay is given, every note seen is weighted equally.
+
+        Kwargs:
+            window : int (default `None`)
+                The number of most recent notes to consider. Should be positive.
+
+            decay : float (default `None`)
+                The factor, in the range (0, 1), that existing weights are multiplied by
+                whenever a note is added.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If both a window and a decay are given, the window is not positive, or the decay
+                is not in the range (0, 1).
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the window is not an integer.
+
+        Examples:
+            >>> tracker = KeyTracker(window=32)
+            >>> for n in Note.parse_many(['C4', 'E4', 'G4', 'F4', 'D4', 'B3', 'C4']):
+            ...     k = tracker.update(n)
+            >>> print(tracker.key())
+            C major
+        """
+        if (window is not None) and (decay is not None):
+            raise ValueError('Expected either a window or a decay, not both')
+        if window is not None:
+            if isinstance(window, bool) or not isinstance(window, int):
+                raise TypeError('Expected integer for window size, got: ' + str(window))
+            if window < 1:
+                raise ValueError('Window size must be positive, got: ' + str(window))
+        if (decay is not None) and not (0 < decay < 1):
+            raise ValueError('Decay must be in the range (0, 1), got: ' + str(decay))
+
+        self.window = window
+        self.decay = decay
+        self.reset()
+
+    def reset(self):
+        """Forget every note seen so far."""
+        self._histogram = np.zeros(12)
+        self._recent = collections.deque() # (pitch class, weight) of the notes in the window
+        self._removed = 0 # notes dropped from the window since the histogram was last recalculated
+
+    def update(self, note, duration=1):
+        """Add a single note to the profile.
+
+        Args:
+            note : :attr:`~music_essentials.note.Note`
+                The note to add. Rests are ignored.
+
+        Kwargs:
+            duration : float (default 1)
+                The weight of the note. Should not be negative.
+
+        Returns:
+            :attr:`~music_essentials.key.Key`
+                The best matching key after adding the note; see :attr:`~music_essentials.key.KeyTracker.key()`.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the note is not a :attr:`~music_essentials.note.Note`.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the duration is negative.
+        """
+        if not isinstance(note, Note):
+            raise TypeError('Expected Note, got: ' + str(note))
+        if duration < 0:
+            raise ValueError('Note durations must not be negative')
+
+        if not note.is_rest:
+            pitch_class = note.midi_note_number() % 12
+            if self.decay is not None:
+                self._histogram *= self.decay
+            self._histogram[pitch_class] += duration
+            if self.window is not None:
+                self._recent.append((pitch_class, duration))
+                self._trim_window()
+
+        return self.key()
+
+    def extend(self, notes, durations=None):
+        """Add a collection of notes to the profile, in order.
+
+        Equivalent to calling :attr:`~music_essentials.key.KeyTracker.update()` for each note, but
+        the notes are counted in bulk.
+
+        Args:
+            notes : list, :attr:`~music_essentials.note_array.NoteArray`, or iterable
+                The notes to add. Rests are ignored.
+
+        Kwargs:
+            durations : array_like or iterable (default `None`)
+                The duration of each note. If `None`, every note has weight 1.
+
+        Returns:
+            :attr:`~music_essentials.key.Key`
+                The best matching key after adding the notes; see :attr:`~music_essentials.key.KeyTracker.key()`.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is given.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the number of durations does not match the number of notes, or any duration is negative.
+        """
+        for pitch_classes, weights in _pitch_class_chunks(notes, durations):
+            if self.decay is not None:
+                # the newest note keeps its full weight; each older note is decayed once per later note
+                factors = self.decay ** np.arange(len(pitch_classes) - 1, -1, -1, dtype=np.float64)
+                self._histogram *= self.decay ** len(pitch_classes)
+                self._histogram += np.bincount(pitch_classes, weights=weights * factors, minlength=12)
+            else:
+                self._histogram += np.bincount(pitch_classes, weights=weights, minlength=12)
+                if self.window is not None:
+                    self._recent.extend(zip(pitch_classes.tolist(), weights.tolist()))
+                    self._trim_window()
+
+        return self.key()
+
+    def key(self):
+        """Get the key that best matches the current profile.
+
+        Returns:
+            :attr:`~music_essentials.key.Key`
+                The best matching key (with tonic in octave 4), or `None` if no notes have been
+                seen or every pitch class is equally common.
+        """
+        correlations = _key_correlations(self._histogram)
+        if correlations is None:
+            return None
+
+        index = int(np.argmax(correlations))
+        return _key_at(index, float(correlations[index]))
+
+    def histogram(self):
+        """Get the current pitch class profile.
+
+        Returns:
+            `numpy.ndarray`
+                A copy of the 12 pitch class weights, indexed by ``midi_num % 12``.
+        """
+        return self._histogram.copy()
+
+    def _trim_window(self):
+        """Drop the oldest notes until the window holds at most `window` notes."""
+        while len(self._recent) > self.window:
+            pitch_class, weight = self._recent.popleft()
+            self._histogram[pitch_class] -= weight
+            self._removed += 1
+
+        # recalculate now and then, so rounding errors from subtraction do not build up
+        if self._removed >= self.window:
+            pitch_classes = np.fromiter((pitch_class for pitch_class, weight in self._recent), dtype=np.int64, count=len(self._recent))
+            weights = np.fromiter((weight for pitch_class, weight in self._recent), dtype=np.float64, count=len(self._recent))
+            self._histogram = np.bincount(pitch_classes, weights=weights, minlength=12)
+            self._removed = 0
+
+def _build_key_profiles():
+    """Create the matrix of key profiles, centred and scaled to unit length.
+
+    Returns:
+        `numpy.ndarray`
+            A 24 x 12 array; rows 0-11 are the major keys and rows 12-23 the minor keys, by tonic pitch class.
+    """
+    profiles = np.empty((24, 12))
+    for pitch_class in range(12):
+        profiles[pitch_class] = np.roll(_MAJOR_PROFILE, pitch_class)
+        profiles[12 + pitch_class] = np.roll(_MINOR_PROFILE, pitch_class)
+    profiles -= profiles.mean(axis=1, keepdims=True)
+    profiles /= np.linalg.norm(profiles, axis=1, keepdims=True)
+
+    return profiles
+
+_KEY_PROFILES = _build_key_profiles()
+
+def _key_correlations(histogram):
+    """Correlate a pitch class histogram against every key profile.
+
+    Returns:
+        `numpy.ndarray`
+            The correlation of the histogram with each of the 24 keys (ordered as in
+            :attr:`~music_essentials.key._build_key_profiles()`), or `None` if every pitch class
+            has the same weight.
+    """
+    centred = histogram - histogram.mean()
+    norm = np.linalg.norm(centred)
+    if norm == 0:
+        return None
+
+    return _KEY_PROFILES.dot(centred) / norm
+
+def _key_at(index, correlation):
+    """Create the key for a row of the key profile matrix."""
+    if index < 12:
+        pitch, accidental = _MAJOR_TONICS[index]
+        return Key(_NOTE_TABLE[(pitch, 4, accidental)], 'major', correlation)
+
+    pitch, accidental = _MINOR_TONICS[index - 12]
+    return Key(_NOTE_TABLE[(pitch, 4, accidental)], 'minor', correlation)
+
+def _weights_for(durations, count):
+    """Convert durations to an array of note weights, checking there is one non-negative duration per note."""
+    weights = np.asarray(durations, dtype=np.float64)
+    if weights.shape != (count,):
+        raise ValueError('Expected one duration per note; got ' + str(weights.size) + ' durations for ' + str(count) + ' notes')
+    if np.any(weights < 0):
+        raise ValueError('Note durations must not be negative')
+
+    return weights
+
+def _midi_nums_of(notes):
+    """Get the MIDI numbers (-1 for rests) of a list of notes, as an array."""
+    try:
+        return np.fromiter(map(_MIDI_NUM_GETTER, notes), dtype=np.int16, count=len(notes))
+    except AttributeError:
+        for n in notes:
+            if not isinstance(n, Note):
+                raise TypeError('Expected Note, got: ' + str(n))
+        raise
+
+def _pitch_class_chunks(notes, durations=None):
+    """Generate the pitch classes and weights of a collection of notes, in chunks, skipping rests.
+
+    Args:
+        notes : list, :attr:`~music_essentials.note_array.NoteArray`, or iterable
+            The notes to read. Iterables are read in chunks of ``_CHUNK_SIZE`` notes.
+
+    Kwargs:
+        durations : array_like or iterable (default `None`)
+            The weight of each note. If `None`, every note has weight 1.
+
+    Returns:
+        generator
+            ``(pitch classes, weights)`` pairs of `numpy.ndarray`, in note order.
+    """
+    if isinstance(notes, NoteArray):
+        pitched = ~notes.rest_mask
+        weights = np.ones(len(notes)) if durations is None else _weights_for(durations, len(notes))
+        yield notes.midi[pitched] % 12, weights[pitched]
+        return
+
+    notes = iter(notes)
+    if durations is not None:
+        durations = iter(durations)
+    while True:
+        chunk = list(itertools.islice(notes, _CHUNK_SIZE))
+        if not chunk:
+            break
+        midi_nums = _midi_nums_of(chunk)
+        pitched = midi_nums >= 0
+        if durations is None:
+            weights = np.ones(len(chunk))
+        else:
+            weights = _weights_for(list(itertools.islice(durations, len(chunk))), len(chunk))
+        yield midi_nums[pitched] % 12, weights[pitched]
+
+    if (durations is not None) and (next(durations, None) is not None):
+        raise ValueError('Expected one duration per note; got more durations than notes')
+
+def _pitch_class_histogram(notes, durations=None):
+    """Total the durations of the notes in each pitch class, ignoring rests.
+
+    Args:
+        notes : list, :attr:`~music_essentials.note_array.NoteArray`, or iterable
+            The notes to count; see :attr:`~music_essentials.key._pitch_class_chunks()`.
+
+    Kwargs:
+        durations : array_like or iterable (default `None`)
+            The weight of each note. If `None`, every note has weight 1.
+
+    Returns:
+        `numpy.ndarray`
+            The 12 pitch class weights, indexed by ``midi_num % 12``.
+    """
+    histogram = np.zeros(12)
+    for pitch_classes, weights in _pitch_class_chunks(notes, durations):
+        histogram += np.bincount(pitch_classes, weights=weights, minlength=12)
+
+    return histogram
@@ -1,10 +1,40 @@
 import random
 import math
+import collections
+import operator
 
+from .cache import LRUCache
 from .interval import Interval
+from .interval import _INTERVAL_SEMITONES
+
+# index = midi_num % 12; val = (pitch, accidental)
+_MIDI_PITCH_ACCIDENTALS = (('C', None), ('C', '#'), ('D', None), ('D', '#'), ('E', None), ('F', None),
+    ('F', '#'), ('G', None), ('G', '#'), ('A', None), ('A', '#'), ('B', None))
+
+# key = pitch; val = index in Note.VALID_PITCHES
+_PITCH_INDEX = {'C': 0, 'D': 1, 'E': 2, 'F': 3, 'G': 4, 'A': 5, 'B': 6}
+
+# index = index in Note.VALID_PITCHES; val = semitones above C
+_NATURAL_SEMITONES = (0, 2, 4, 5, 7, 9, 11)
+
+# key = accidental; val = semitone offset
+_ACCIDENTAL_OFFSETS = {None: 0, '#': 1, '##': 2, 'b': -1, 'bb': -2}
+_OFFSET_ACCIDENTALS = dict((offset, accidental) for accidental, offset in _ACCIDENTAL_OFFSETS.items())
 
 class Note(object):
-    """A single note, defined by a pitch, octave, and (optional) accidentals."""
+    """A single note, defined by a pitch, octave, and (optional) accidentals.
+
+    The factory methods (:attr:`~music_essentials.note.Note.from_note_string()`,
+    :attr:`~music_essentials.note.Note.from_midi_num()`) and note + interval addition
+    return shared, interned instances - one per valid spelling in the MIDI range [0, 127].
+
+    Notes are immutable and hashable, so they can be used as dictionary keys and set members.
+    """
+
+    __slots__ = ('pitch', 'octave', 'accidental', '_midi_note_number', '_sort_key')
+
+    is_rest = False
+    """True if this note is a :attr:`~music_essentials.note.Rest`."""
 
     VALID_PITCHES = ('C', 'D', 'E', 'F', 'G', 'A', 'B')
     """List of valid pitch characters."""
@@ -12,7 +42,7 @@ class Note(object):
     VALID_ACCIDENTALS = ('#', '##', 'b', 'bb', None)
     """List of valid accidental representors."""
 
-    def __init__(self, pitch, octave, accidental=None, random_instance=random.Random()):
+    def __init__(self, pitch, octave, accidental=None, random_instance=None):
         """Create a new Note.
 
         Args:
@@ -26,6 +56,9 @@ class Note(object):
             accidental : str (default `None`)
                 The accidental to apply to the note. Should be one of :attr:`~music_essentials.note.Note.VALID_ACCIDENTALS`.
 
+            random_instance : random.Random (default `None`)
+                Unused; retained for backwards compatibility.
+
             duration : float (default `None`)
                 The duration of the note, in terms of how many would fit into one bar in common time.
                 For example, a semibreve has a duration of 1; a quaver has a duration of 8.
@@ -72,20 +105,56 @@ class Note(object):
             if accidental.lower() not in Note.VALID_ACCIDENTALS:
                 raise ValueError('Invalid accidental: ' + str(accidental))
 
-        self.pitch = pitch.upper()
-        self.octave = int(octave)
-        self.accidental = accidental
-        self.is_rest = False
-        self.random_instance = random_instance
-
+        pitch = pitch.upper()
+        octave = int(octave)
         if accidental is not None:
-            self.accidental = self.accidental.lower()
+            accidental = accidental.lower()
+
+        midi_num = _calculate_midi_note_number(pitch, octave, accidental)
+        if (midi_num < 0) or (midi_num > 127):
+            raise ValueError('Invalid Note parameters \'' + str(pitch) + str(octave) + str(accidental) + '\', results in MIDI note number: ' + str(midi_num))
+
+        object.__setattr__(self, 'pitch', pitch)
+        object.__setattr__(self, 'octave', octave)
+        object.__setattr__(self, 'accidental', accidental)
+        object.__setattr__(self, '_midi_note_number', midi_num)
+        object.__setattr__(self, '_sort_key', _calculate_sort_key(midi_num, octave, Note.VALID_PITCHES.index(pitch)))
+
+    @classmethod
+    def _from_trusted(cls, pitch, octave, accidental=None):
+        """Create a new Note without validating its parameters.
+
+        For internal use, where the pitch, octave, and accidental are already known to be valid
+        and normalised (upper case pitch, integer octave, lower case accidental). The MIDI note
+        number is not range-checked. User code should use the validating constructor
+        :attr:`~music_essentials.note.Note.__init__()` instead.
+
+        Args:
+            pitch : str
+                The pitch of the note; one of :attr:`~music_essentials.note.Note.VALID_PITCHES`.
+            octave : int
+                The octave of the note.
+
+        Kwargs:
+            accidental : str (default `None`)
+                The accidental of the note; one of :attr:`~music_essentials.note.Note.VALID_ACCIDENTALS`.
+
+        Returns:
+            :attr:`~music_essentials.note.Note`
+                A new note with the given pitch, octave, and accidental.
+        """
+        note = object.__new__(cls)
+        midi_num = _calculate_midi_note_number(pitch, octave, accidental)
+        object.__setattr__(note, 'pitch', pitch)
+        object.__setattr__(note, 'octave', octave)
+        object.__setattr__(note, 'accidental', accidental)
+        object.__setattr__(note, '_midi_note_number', midi_num)
+        object.__setattr__(note, '_sort_key', _calculate_sort_key(midi_num, octave, Note.VALID_PITCHES.index(pitch)))
 
-        if (self.midi_note_number() < 0) or (self.midi_note_number() > 127):
-            raise ValueError('Invalid Note parameters \'' + str(self.pitch) + str(self.octave) + str(self.accidental) + '\', results in MIDI note number: ' + str(self.midi_note_number()))
+        return note
 
     @classmethod
-    def from_note_string(cls, note_string, random_instance=random.Random()):
+    def from_note_string(cls, note_string, random_instance=None):
         """Create a new Note.
 
         Processes the note string then uses the constructor :attr:`~music_essentials.note.Note.__init__()`.
@@ -127,8 +196,13 @@ class Note(object):
         if not isinstance(note_string, str):
             raise TypeError('Expected string for note string, got \'' + str(note_string + '\''))
 
+        if cls is Note:
+            note = _NOTES_BY_STRING.get(note_string)
+            if note is not None:
+                return note
+
         if note_string == 'r':
-            return Rest()
+            return _REST
 
         pitch = note_string[0]
         octave = note_string[1]
@@ -142,10 +216,65 @@ class Note(object):
         if len(accidental) == 0:
             accidental = None
 
-        return cls(pitch, octave, accidental, random_instance)
+        note = cls(pitch, octave, accidental, random_instance)
+        if cls is Note:
+            return _NOTE_TABLE[(note.pitch, note.octave, note.accidental)]
+        return note
 
     @classmethod
-    def from_midi_num(cls, midi_num, random_instance=random.Random()):
+    def parse_many(cls, note_strings, as_array=False):
+        """Create a sequence of notes from many note strings at once.
+
+        Every string is processed in the same way as :attr:`~music_essentials.note.Note.from_note_string()`,
+        including ``'r'`` for rests. Parsing does not stop at the first invalid string; all invalid
+        strings are reported together.
+
+        Args:
+            note_strings : iterable of str
+                The note strings to parse, e.g., a list or NumPy array of strings.
+
+        Kwargs:
+            as_array : bool (default `False`)
+                If true, return a :attr:`~music_essentials.note_array.NoteArray` (requires NumPy)
+                instead of a list.
+
+        Returns:
+            list or :attr:`~music_essentials.note_array.NoteArray`
+                The parsed notes, in order.
+
+        Raises:
+            :attr:`~music_essentials.note.NoteParseError`
+                If any of the note strings are invalid. The error lists the index of every invalid string.
+
+        Examples:
+            >>> notes = Note.parse_many(['C4', 'r', 'e5b', 'C-1'])
+            >>> print([str(n) for n in notes])
+            ['C4', 'r', 'E5b', 'C-1']
+            >>> Note.parse_many(['C4', 'x6', 'C#'])
+            NoteParseError: Invalid note strings at indices [1, 2]: 1: Invalid pitch: x; 2: Expected integer for octave, got: #
+        """
+        notes = []
+        errors = []
+        for idx, note_string in enumerate(note_strings):
+            note = _NOTES_BY_STRING.get(note_string) if isinstance(note_string, str) else None
+            if note is None:
+                try:
+                    note = Note.from_note_string(note_string)
+                except (ValueError, TypeError, IndexError) as e:
+                    errors.append((idx, note_string, str(e)))
+                    continue
+            notes.append(note)
+
+        if len(errors) > 0:
+            raise NoteParseError(errors)
+
+        if as_array:
+            from .note_array import NoteArray
+            return NoteArray.from_notes(notes)
+        return notes
+
+    @classmethod
+    def from_midi_num(cls, midi_num, random_instance=None):
         """Create a new note.
         
         Uses the provided MIDI number to set the note parameters.
@@ -159,6 +288,9 @@ class Note(object):
                 A new note with a pitch, octave, and accidental corresponding to the
                 given MIDI note number.
         """
+        if (cls is Note) and (type(midi_num) is int) and (0 <= midi_num <= 127):
+            return _NOTES_BY_MIDI_NUM[midi_num]
+
         try:
             int(midi_num) # test if octave value is a number
         except:
@@ -168,28 +300,65 @@ class Note(object):
         if (int(midi_num) < 0) or (int(midi_num) > 127):
             raise ValueError('MIDI number needs to be in the range [0, 127], got: ' + str(midi_num))
 
-        # key = midi_num % 12; val = (pitch, accidental)
-        pitch_accidental_mappings = {
-            0 : ('C', None),
-            1 : ('C', '#'),
-            2 : ('D', None),
-            3 : ('D', '#'),
-            4 : ('E', None),
-            5 : ('F', None),
-            6 : ('F', '#'),
-            7 : ('G', None),
-            8 : ('G', '#'),
-            9 : ('A', None),
-            10 : ('A', '#'),
-            11 : ('B', None)
-        }
+        if cls is Note:
+            return _NOTES_BY_MIDI_NUM[int(midi_num)]
 
         octave = int(math.floor(midi_num / 12) - 1)
-        pitch, accidental = pitch_accidental_mappings[midi_num % 12]
-        return cls(pitch, octave, accidental, random_instance)
+        pitch, accidental = _MIDI_PITCH_ACCIDENTALS[midi_num % 12]
+        return cls._from_trusted(pitch, octave, accidental)
+
+    @classmethod
+    def from_midi_nums(cls, midi_nums, as_array=False, spelling=None):
+        """Create notes from many MIDI numbers at once.
+
+        Requires `NumPy <http://www.numpy.org/>`_. Notes are found through a precomputed
+        128-entry lookup table rather than being created one at a time.
+
+        Args:
+            midi_nums : array_like of int
+                The MIDI numbers, each in the range [0, 127]. Can be a NumPy integer array, a list,
+                or any object supporting the buffer protocol (``bytes`` are read as unsigned 8-bit integers).
+
+        Kwargs:
+            as_array : bool (default `False`)
+                If true, return a :attr:`~music_essentials.note_array.NoteArray` instead of a list.
+
+            spelling : sequence (default `None`)
+                Twelve ``(pitch, accidental)`` pairs, indexed by ``midi_num % 12``, giving the spelling
+                to use for each pitch class - for example, from :attr:`~music_essentials.scale.Scale.build_spelling()`.
+                If `None`, the same spelling as :attr:`~music_essentials.note.Note.from_midi_num()` is used
+                (naturals and sharps). Where a spelling would fall outside the MIDI range (e.g., ``B#`` for
+                MIDI number 0) the default spelling is used instead.
+
+        Returns:
+            list or :attr:`~music_essentials.note_array.NoteArray`
+                The notes corresponding to the MIDI numbers, in order.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any MIDI number is outside the range [0, 127], or the spelling table is invalid.
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the MIDI numbers are not integers.
+
+        Examples:
+            >>> notes = Note.from_midi_nums(numpy.array([60, 61, 62]))
+            >>> print([str(n) for n in notes])
+            ['C4', 'C4#', 'D4']
+            >>> notes = Note.from_midi_nums([60, 61, 62], spelling=Scale.build_spelling(Note('F', 4), 'major'))
+            >>> print([str(n) for n in notes])
+            ['C4', 'D4b', 'D4']
+        """
+        midi_nums = _as_midi_num_array(midi_nums)
+        if as_array:
+            from .note_array import NoteArray
+            return NoteArray.from_midi_nums(midi_nums, spelling)
+
+        table = _spelled_notes_by_midi_num(spelling)
+        return list(map(table.__getitem__, midi_nums.tolist()))
 
     @classmethod
-    def random_note(cls, lowest_midi_num=0, highest_midi_num=127, method='rand', chance_for_rest=0.01, random_instance=random.Random()):
+    def random_note(cls, lowest_midi_num=0, highest_midi_num=127, method='rand', chance_for_rest=0.01, random_instance=None):
         """Create and return a random Note within the MIDI note
         number range [lowest_midi_num, highest_midi_num].
 
@@ -205,13 +374,24 @@ class Note(object):
                 If 'rand', a uniform distribution will be used.
                 If 'gauss', a gaussian distribution will be used.
 
+            chance_for_rest : float (default 0.01)
+                The probability of returning a :attr:`~music_essentials.note.Rest`.
+
+            random_instance : random.Random (default `None`)
+                The random number generator to use. If `None`, the global generator of Python's
+                `random <https://docs.python.org/3/library/random.html>`_ module is used.
+                For reproducible generation across threads or processes, give each worker its own
+                instance from :attr:`~music_essentials.random_streams.RandomStreams.random_instance()`.
+
         Returns:
             :attr:`~music_essentials.note.Note`
                 A new note with a randomly selected pitch, octave, and accidental.
         """
+        if random_instance is None:
+            random_instance = random
 
         if random_instance.random() <= chance_for_rest:
-            return Rest()
+            return _REST
 
         midi_num = -1
         if method == 'rand':
@@ -224,6 +404,82 @@ class Note(object):
 
         return cls.from_midi_num(midi_num)
 
+    @classmethod
+    def random_notes(cls, count, lowest_midi_num=0, highest_midi_num=127, method='rand', chance_for_rest=0.01, generator=None, as_array=False):
+        """Create many random notes at once, within the MIDI note number range [lowest_midi_num, highest_midi_num].
+
+        Requires `NumPy <http://www.numpy.org/>`_. Uses the same distributions as
+        :attr:`~music_essentials.note.Note.random_note()`, but draws every note in a single vectorized
+        call. The 'gauss' method samples the rounded normal distribution truncated to the MIDI
+        number range directly, rather than re-drawing out-of-range values.
+
+        Args:
+            count : int
+                The number of notes to create.
+
+        Kwargs:
+            lowest_midi_num : int (default 0)
+                The lowest MIDI number allowed.
+
+            highest_midi_num : int (default 127)
+                The highest MIDI number allowed.
+
+            method : str (default 'rand')
+                The method of random selection to use.
+                If 'rand', a uniform distribution will be used.
+                If 'gauss', a gaussian distribution will be used.
+
+            chance_for_rest : float (default 0.01)
+                The probability of each note being a :attr:`~music_essentials.note.Rest`.
+
+            generator : `numpy.random.Generator` or int (default `None`)
+                The random number generator to use, or a seed for a new one. If `None`, a
+                new generator is seeded from the operating system. For reproducible generation
+                across threads or processes, give each worker its own generator from
+                :attr:`~music_essentials.random_streams.RandomStreams.generator()`.
+
+            as_array : bool (default `False`)
+                If true, return a :attr:`~music_essentials.note_array.NoteArray` instead of a list.
+
+        Returns:
+            list or :attr:`~music_essentials.note_array.NoteArray`
+                The randomly selected notes.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the count is negative, the MIDI number range is invalid, or the method is unknown.
+
+        Examples:
+            >>> notes = Note.random_notes(4, 60, 72, generator=42)
+            >>> print([str(n) for n in notes])
+            ['D4', 'C4#', 'F4#', 'C5']
+        """
+        import numpy as np
+
+        if count < 0:
+            raise ValueError('Expected a non-negative number of notes, got: ' + str(count))
+        if (lowest_midi_num < 0) or (highest_midi_num > 127) or (lowest_midi_num > highest_midi_num):
+            raise ValueError('Invalid MIDI number range [' + str(lowest_midi_num) + ', ' + str(highest_midi_num) + ']')
+        if method not in ('rand', 'gauss'):
+            raise ValueError('Unknown random selection method: ' + str(method))
+
+        if not isinstance(generator, np.random.Generator):
+            generator = np.random.default_rng(generator)
+
+        rests = generator.random(count) <= chance_for_rest
+        if method == 'rand':
+            midi_nums = generator.integers(lowest_midi_num, highest_midi_num + 1, size=count)
+        else:
+            midi_nums = generator.choice(np.arange(lowest_midi_num, highest_midi_num + 1), size=count,
+                p=_rounded_gauss_probabilities(lowest_midi_num, highest_midi_num))
+
+        if as_array:
+            from .note_array import NoteArray
+            return NoteArray.from_midi_nums(midi_nums, rest_mask=rests)
+
+        table = _NOTES_BY_MIDI_NUM
+        return [_REST if is_rest else table[m] for m, is_rest in zip(midi_nums.tolist(), rests.tolist())]
+
     def midi_note_number(self):
         """Get the MIDI note number equivalent to this pitch.
 
@@ -245,23 +501,80 @@ class Note(object):
             >>> print(n.midi_note_number())
             22
         """
-        # calculate number based on octave and pitch
-        midi_num = self.octave * 12
-        midi_num += Note.VALID_PITCHES.index(self.pitch) * 2
-        if self.pitch not in ('C', 'D', 'E'):
-            midi_num -= 1
-        midi_num += 12
-
-        # adjust for accidentals
-        if self.accidental is not None:
-            midi_num -= self.accidental.count('b')
-            midi_num += self.accidental.count('#')
+        return self._midi_note_number
+
+    def sort_key(self):
+        """Get an integer that orders notes in the same way as the comparison operators.
+
+        Notes are ordered by MIDI note number. `Enharmonic notes <https://en.wikipedia.org/wiki/Enharmonic>`_
+        are ordered by octave, then by written pitch. Every spelling has a unique key in the range [0, 32767].
+
+        Returns:
+            int
+                The sort key for this note.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the note is a :attr:`~music_essentials.note.Rest`.
+
+        Examples:
+            >>> notes = [Note.from_note_string('C4#'), Note.from_note_string('B3#'), Note.from_note_string('C4')]
+            >>> print([str(n) for n in sorted(notes, key=Note.sort_key)])
+            ['B3#', 'C4', 'C4#']
+        """
+        if self._sort_key is None:
+            raise TypeError('Can not get sort key for rest')
+
+        return self._sort_key
+
+    @classmethod
+    def sort_notes(cls, notes, reverse=False):
+        """Sort a collection of notes.
+
+        Gives the same order as sorting with the comparison operators, but uses a counting sort
+        over :attr:`~music_essentials.note.Note.sort_key()`, so runs in linear time. Equal notes are
+        returned as the same shared instance.
+
+        Args:
+            notes : iterable of :attr:`~music_essentials.note.Note`
+                The notes to sort.
+
+        Kwargs:
+            reverse : bool (default `False`)
+                If true, sort in descending order.
+
+        Returns:
+            list
+                The notes, in ascending (or descending) order.
 
-        return midi_num
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is given, or any note is a
+                :attr:`~music_essentials.note.Rest`.
+
+        Examples:
+            >>> notes = Note.parse_many(['G4', 'C4', 'B3#', 'C4'])
+            >>> print([str(n) for n in Note.sort_notes(notes)])
+            ['B3#', 'C4', 'C4', 'G4']
+        """
+        try:
+            counts = collections.Counter(map(_SORT_KEY_GETTER, notes))
+        except AttributeError:
+            raise TypeError('Expected only Notes to sort')
+        if None in counts:
+            raise TypeError('Can not sort rests')
+
+        out = []
+        for key in sorted(counts, reverse=reverse):
+            out.extend([_NOTES_BY_SORT_KEY[key]] * counts[key])
+
+        return out
 
     def __add__(self, other):
         """Calculate and return the note found when adding an interval to this note.
 
+        Adding a descending interval transposes the note down.
+
         Args:
             other : :attr:`~music_essentials.interval.Interval`
                 The interval to add to this note.
@@ -287,56 +600,67 @@ class Note(object):
             >>> i = Interval.from_interval_string('aug13')
             >>> print(n + i)
             A5#
+            >>> i = Interval.from_interval_string('-M3')
+            >>> print(n + i)
+            A3b
         """
         if not isinstance(other, Interval):
             raise TypeError('unsupported operand type(s) for +: \'Note\' and \'' + str(other.__class__.__name__) + '\'')
 
-        # calculate new pitch
-        note_pitch_idx = Note.VALID_PITCHES.index(self.pitch)
-        pitch_diff = (other.size % 7) - 1
-        if (note_pitch_idx + pitch_diff) > (len(Note.VALID_PITCHES) - 1):
-            pitch_diff = -7 + pitch_diff
-        new_pitch = Note.VALID_PITCHES[note_pitch_idx + pitch_diff]
-
-        # calculate new octave
-        base_size = int(other.size)
-        octave_diff = 0
-        is_compound = False
-        while (base_size >= 8):
-            base_size -= 7
-            octave_diff += 1
-            is_compound = True
-        if Note.VALID_PITCHES.index(new_pitch) < Note.VALID_PITCHES.index(self.pitch):
-            octave_diff += 1
-        new_octave = self.octave + octave_diff
-
-        # find appropriate accidental
-        goal_semitone_diff = octave_diff * 12
-        if not is_compound and octave_diff > 0:
-            goal_semitone_diff -= 12
-        if base_size in Interval._PERFECT_INTERVALS_SEMITONES.keys():
-            goal_semitone_diff += Interval._PERFECT_INTERVALS_SEMITONES[base_size]
-            if other.interval_type == 'dim':
-                goal_semitone_diff -= 1
-            elif other.interval_type == 'aug':
-                goal_semitone_diff += 1
-        elif base_size in Interval._MAJOR_INTERVALS_SEMITONES.keys():
-            goal_semitone_diff += Interval._MAJOR_INTERVALS_SEMITONES[base_size]
-            if other.interval_type == 'dim':
-                goal_semitone_diff -= 2
-            elif other.interval_type == 'm':
-                goal_semitone_diff -= 1
-            elif other.interval_type == 'aug':
-                goal_semitone_diff += 1
-
-        for a in Note.VALID_ACCIDENTALS:
-            new_note = Note(new_pitch, new_octave, a)
-            diff = new_note.midi_note_number() - self.midi_note_number()
-
-            if diff == goal_semitone_diff:
-                return new_note
-
-        raise RuntimeError('FATAL ERROR: Could not complete note + interval operation: ' + str(self) + ' + ' + str(other))
+        if self.is_rest:
+            raise TypeError('unsupported operand type(s) for +: \'Rest\' and \'Interval\'')
+
+        # transpose within one octave, then add octaves for compound intervals
+        size = other.size
+        if other.descending:
+            table = _DOWNWARD_TRANSPOSITION_TABLE
+            compound_octaves = -((size - 1) // 7)
+        else:
+            table = _TRANSPOSITION_TABLE
+            compound_octaves = (size - 1) // 7
+        transposition = table.get((self.pitch, self.accidental, other.interval_type, ((size - 1) % 7) + 1))
+        if transposition is None:
+            raise RuntimeError('FATAL ERROR: Could not complete note + interval operation: ' + str(self) + ' + ' + str(other))
+        new_pitch, new_accidental, octave_diff = transposition
+        new_octave = self.octave + octave_diff + compound_octaves
+
+        return _interned_note(new_pitch, new_octave, new_accidental)
+
+    def __sub__(self, other):
+        """Subtract an interval from this note, or calculate the interval between another note and this note.
+
+        Args:
+            other : :attr:`~music_essentials.interval.Interval` or :attr:`~music_essentials.note.Note`
+                The interval to transpose down by, or the note to measure from.
+
+        Returns:
+            :attr:`~music_essentials.note.Note` or :attr:`~music_essentials.interval.Interval`
+                The note found by subtracting the interval from this note; or the interval from
+                the other note to this note, which is descending if this note is written lower
+                (see :attr:`~music_essentials.interval.Interval.between()`).
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to subtract is not an :attr:`~music_essentials.interval.Interval` or
+                :attr:`~music_essentials.note.Note`, or either note is a rest.
+
+        Examples:
+            >>> print(Note.from_note_string('G4') - Note.from_note_string('C4'))
+            P5
+            >>> print(Note.from_note_string('C4') - Note.from_note_string('G4'))
+            -P5
+            >>> print(Note.from_note_string('C4') - Interval.from_interval_string('M3'))
+            A3b
+        """
+        if isinstance(other, Interval):
+            if self.is_rest:
+                raise TypeError('unsupported operand type(s) for -: \'Rest\' and \'Interval\'')
+            return self + (-other)
+
+        if not isinstance(other, Note):
+            raise TypeError('unsupported operand type(s) for -: \'Note\' and \'' + str(other.__class__.__name__) + '\'')
+
+        return Interval.between(other, self, signed=True)
 
     def is_enharmonic(self, other):
         """Check if two notes are `enharmonic <https://en.wikipedia.org/wiki/Enharmonic>`_.
@@ -410,7 +734,7 @@ class Note(object):
         if not isinstance(other, Note) or (isinstance(other, Rest) or isinstance(self, Rest)):
             raise TypeError('Can not check equality between Note and \'' + str(other) + '\'')
 
-        return (self.pitch == other.pitch) and (self.octave == other.octave) and (self.accidental == other.accidental)
+        return self._sort_key == other._sort_key
 
     def __ne__(self, other):
         """Check if this note is note equal to another note.
@@ -474,15 +798,7 @@ class Note(object):
         if not isinstance(other, Note) or (isinstance(other, Rest) or isinstance(self, Rest)):
             raise TypeError('Can not check equality between Note and \'' + str(other) + '\'')
 
-        if self.__eq__(other):
-            return False
-
-        if self.is_enharmonic(other):
-            if self.octave != other.octave:
-                return self.octave < other.octave
-            return Note.VALID_PITCHES.index(self.pitch) < Note.VALID_PITCHES.index(other.pitch)
-
-        return self.midi_note_number() < other.midi_note_number()
+        return self._sort_key < other._sort_key
 
     def __gt__(self, other):
         """Check if this note is greater than another note.
@@ -517,15 +833,7 @@ class Note(object):
         if not isinstance(other, Note) or (isinstance(other, Rest) or isinstance(self, Rest)):
             raise TypeError('Can not check equality between Note and \'' + str(other) + '\'')
 
-        if self.__eq__(other):
-            return False
-
-        if self.is_enharmonic(other):
-            if self.octave != other.octave:
-                return self.octave > other.octave
-            return Note.VALID_PITCHES.index(self.pitch) > Note.VALID_PITCHES.index(other.pitch)
-
-        return self.midi_note_number() > other.midi_note_number()
+        return self._sort_key > other._sort_key
 
     def __le__(self, other):
         """Check if this note is less than or equal to another note.
@@ -585,6 +893,36 @@ class Note(object):
         """
         return not self.__lt__(other)
 
+    def __hash__(self):
+        """Get a hash value for the note, consistent with :attr:`~music_essentials.note.Note.__eq__()`.
+
+        Enharmonic notes with different spellings have different hash values. The hash value differs
+        from that of the integer sort key, so notes and integers can be used as keys of the same dictionary.
+        """
+        return hash((Note, self._sort_key))
+
+    def __setattr__(self, name, value):
+        """Prevent modification of the note; notes are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not modify attribute \'' + str(name) + '\' of immutable Note')
+
+    def __delattr__(self, name):
+        """Prevent deletion of note attributes; notes are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not delete attribute \'' + str(name) + '\' of immutable Note')
+
+    def __reduce__(self):
+        """Support pickling and copying by re-creating the note from its pitch, octave, and accidental."""
+        return (self.__class__, (self.pitch, self.octave, self.accidental))
+
     def __str__(self):
         """Create a string representation of the note in the form ``<pitch><octave><accidental>``.
 
@@ -611,12 +949,17 @@ class Note(object):
 class Rest(Note):
     """A single note, defined as a period of silence."""
 
+    __slots__ = ()
+
+    is_rest = True
+
     def __init__(self):
         """Create a rest note. Sets the note's pitch, octave, and accidental as `None`."""
-        self.pitch = None
-        self.octave = None
-        self.accidental = None
-        self.is_rest = True
+        object.__setattr__(self, 'pitch', None)
+        object.__setattr__(self, 'octave', None)
+        object.__setattr__(self, 'accidental', None)
+        object.__setattr__(self, '_midi_note_number', -1)
+        object.__setattr__(self, '_sort_key', None)
 
     def midi_note_number(self):
         """Override the MIDI note number method from the parent class.
@@ -626,6 +969,40 @@ class Rest(Note):
 
         return -1
 
+    def __eq__(self, other):
+        """Check if this rest is equal to another rest.
+
+        All rests are equal to each other, so separate rests can be stored together in sets and as dictionary keys.
+
+        Args:
+            other : :attr:`~music_essentials.note.Rest`
+                The rest to compare this rest to.
+
+        Returns:
+            bool
+                Always true.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to compare to is not a :attr:`~music_essentials.note.Rest`.
+
+        Examples:
+            >>> Rest() == Rest()
+            True
+        """
+        if not isinstance(other, Rest):
+            raise TypeError('Can not check equality between Rest and \'' + str(other) + '\'')
+
+        return True
+
+    def __hash__(self):
+        """Get a hash value for the rest; all rests have the same hash value."""
+        return hash((Rest, None))
+
+    def __reduce__(self):
+        """Support pickling and copying of rests."""
+        return (Rest, ())
+
     def __str__(self):
         """Create a string representation of the rest.
         
@@ -636,3 +1013,179 @@ class Rest(Note):
         """
 
         return 'r'
+
+
+
+class NoteParseError(ValueError):
+    """Error raised by :attr:`~music_essentials.note.Note.parse_many()` when one or more note strings are invalid."""
+
+    def __init__(self, errors):
+        """Create a new NoteParseError.
+
+        Args:
+            errors : list
+                A ``(index, note string, message)`` tuple for each invalid note string.
+        """
+        self.errors = errors
+        ValueError.__init__(self, 'Invalid note strings at indices ' + str([e[0] for e in errors]) + ': ' +
+            '; '.join(str(idx) + ': ' + message for idx, note_string, message in errors))
+
+
+def _calculate_midi_note_number(pitch, octave, accidental):
+    """Calculate the MIDI note number for an (already validated) pitch, octave, and accidental."""
+    # calculate number based on octave and pitch
+    midi_num = octave * 12
+    midi_num += Note.VALID_PITCHES.index(pitch) * 2
+    if pitch not in ('C', 'D', 'E'):
+        midi_num -= 1
+    midi_num += 12
+
+    # adjust for accidentals
+    if accidental is not None:
+        midi_num -= accidental.count('b')
+        midi_num += accidental.count('#')
+
+    return midi_num
+
+def _rounded_gauss_probabilities(lowest_midi_num, highest_midi_num):
+    """Get the probability of each MIDI number in [lowest_midi_num, highest_midi_num] when rounding
+    the gaussian used by :attr:`~music_essentials.note.Note.random_note()`, truncated to that range."""
+    mean = lowest_midi_num + math.floor(((highest_midi_num - lowest_midi_num) / 2))
+    std_dev = math.floor((mean - lowest_midi_num) / 3)
+    if std_dev == 0:
+        return [1.0 if m == mean else 0.0 for m in range(lowest_midi_num, highest_midi_num + 1)]
+
+    def cdf(x):
+        return 0.5 * (1 + math.erf((x - mean) / (std_dev * math.sqrt(2))))
+
+    weights = [cdf(m + 0.5) - cdf(m - 0.5) for m in range(lowest_midi_num, highest_midi_num + 1)]
+    total = sum(weights)
+    return [w / total for w in weights]
+
+def _interned_note(pitch, octave, accidental):
+    """Get the interned note for an (already normalised) spelling.
+
+    Raises:
+        `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+            If the note is outside the MIDI range [0, 127].
+    """
+    note = _NOTE_TABLE.get((pitch, octave, accidental))
+    if note is None:
+        raise ValueError('Invalid Note parameters \'' + str(pitch) + str(octave) + str(accidental) + '\', results in a note outside the MIDI range [0, 127]')
+
+    return note
+
+def _as_midi_num_array(midi_nums):
+    """Convert the given MIDI numbers to a validated NumPy integer array."""
+    import numpy as np
+
+    if isinstance(midi_nums, (bytes, bytearray)):
+        midi_nums = np.frombuffer(midi_nums, dtype=np.uint8)
+    else:
+        midi_nums = np.asarray(midi_nums)
+    if midi_nums.size == 0:
+        return midi_nums.reshape(0).astype(np.int16)
+
+    if not np.issubdtype(midi_nums.dtype, np.integer):
+        raise TypeError('Expected integers for MIDI numbers, got array of type: ' + str(midi_nums.dtype))
+    midi_nums = midi_nums.ravel()
+    if (midi_nums.min() < 0) or (midi_nums.max() > 127):
+        raise ValueError('MIDI numbers need to be in the range [0, 127], got values in the range [' + str(midi_nums.min()) + ', ' + str(midi_nums.max()) + ']')
+
+    return midi_nums.astype(np.int16)
+
+# key = spelling table; val = tuple of 128 notes
+_SPELLED_NOTES_BY_MIDI_NUM = LRUCache(64)
+
+def _spelled_notes_by_midi_num(spelling):
+    """Get the notes for every MIDI number, spelled according to the given table of ``(pitch, accidental)`` pairs."""
+    if spelling is None:
+        return _NOTES_BY_MIDI_NUM
+
+    spelling = tuple(tuple(p) for p in spelling)
+    return _SPELLED_NOTES_BY_MIDI_NUM.get(spelling, lambda: _build_spelled_notes(spelling))
+
+def _build_spelled_notes(spelling):
+    """Validate a table of 12 ``(pitch, accidental)`` pairs and spell every MIDI number with it."""
+    if len(spelling) != 12:
+        raise ValueError('Expected 12 (pitch, accidental) pairs for spelling, got ' + str(len(spelling)))
+    for pitch_class, (pitch, accidental) in enumerate(spelling):
+        if (pitch not in Note.VALID_PITCHES) or (accidental not in _ACCIDENTAL_OFFSETS):
+            raise ValueError('Invalid spelling for pitch class ' + str(pitch_class) + ': ' + str((pitch, accidental)))
+        if (_NATURAL_SEMITONES[Note.VALID_PITCHES.index(pitch)] + _ACCIDENTAL_OFFSETS[accidental]) % 12 != pitch_class:
+            raise ValueError('Spelling ' + str((pitch, accidental)) + ' does not match pitch class ' + str(pitch_class))
+
+    table = []
+    for midi_num in range(128):
+        pitch, accidental = spelling[midi_num % 12]
+        natural = _NATURAL_SEMITONES[Note.VALID_PITCHES.index(pitch)] + _ACCIDENTAL_OFFSETS[accidental]
+        octave = ((midi_num - natural) // 12) - 1
+        table.append(_NOTE_TABLE.get((pitch, octave, accidental), _NOTES_BY_MIDI_NUM[midi_num]))
+
+    return tuple(table)
+
+def _build_transposition_table(descending=False):
+    """Map every note spelling and simple interval to the spelling of the transposed note.
+
+    Kwargs:
+        descending : bool (default `False`)
+            If true, map each spelling to the note found by transposing down rather than up.
+
+    Returns:
+        dict
+            Keyed by ``(pitch, accidental, interval type, base interval size)``, with values
+            ``(pitch, accidental, octave difference)``. Transpositions that would need more than
+            two accidentals (e.g., ``B## + aug2``) are not included.
+    """
+    direction = -1 if descending else 1
+    table = {}
+    for pitch_idx, pitch in enumerate(Note.VALID_PITCHES):
+        for accidental in Note.VALID_ACCIDENTALS:
+            for (interval_type, size), semitones in _INTERVAL_SEMITONES.items():
+                semitones *= direction
+                octave_diff, new_pitch_idx = divmod(pitch_idx + (direction * (size - 1)), 7)
+                natural_diff = (_NATURAL_SEMITONES[new_pitch_idx] + (octave_diff * 12)) - _NATURAL_SEMITONES[pitch_idx]
+                offset = _ACCIDENTAL_OFFSETS[accidental] + semitones - natural_diff
+                if offset in _OFFSET_ACCIDENTALS:
+                    table[(pitch, accidental, interval_type, size)] = (Note.VALID_PITCHES[new_pitch_idx], _OFFSET_ACCIDENTALS[offset], octave_diff)
+
+    return table
+
+def _calculate_sort_key(midi_num, octave, pitch_idx):
+    """Calculate the integer sort key for an (already validated) note."""
+    return (midi_num << 8) | ((octave + 1) << 3) | pitch_idx
+
+_SORT_KEY_GETTER = operator.attrgetter('_sort_key')
+
+def _build_note_tables():
+    """Create the interned note instances for every valid spelling in the MIDI range [0, 127].
+
+    Returns:
+        tuple
+            A dictionary keyed by ``(pitch, octave, accidental)``, a dictionary keyed by
+            note string, and a tuple indexed by MIDI number (using sharps for black keys).
+    """
+    by_spelling = {}
+    by_string = {}
+    for octave in range(-1, 10):
+        for pitch in Note.VALID_PITCHES:
+            for accidental in Note.VALID_ACCIDENTALS:
+                note = Note._from_trusted(pitch, octave, accidental)
+                if (note.midi_note_number() < 0) or (note.midi_note_number() > 127):
+                    continue # no MIDI number for this spelling
+                by_spelling[(pitch, octave, accidental)] = note
+                by_string[str(note)] = note
+
+    by_midi_num = []
+    for midi_num in range(128):
+        pitch, accidental = _MIDI_PITCH_ACCIDENTALS[midi_num % 12]
+        by_midi_num.append(by_spelling[(pitch, (midi_num // 12) - 1, accidental)])
+
+    return by_spelling, by_string, tuple(by_midi_num)
+
+_NOTE_TABLE, _NOTES_BY_STRING, _NOTES_BY_MIDI_NUM = _build_note_tables()
+_TRANSPOSITION_TABLE = _build_transposition_table()
+_DOWNWARD_TRANSPOSITION_TABLE = _build_transposition_table(descending=True)
+_NOTES_BY_SORT_KEY = dict((n.sort_key(), n) for n in _NOTE_TABLE.values())
+_REST = Rest()
+_NOTES_BY_STRING['r'] = _REST
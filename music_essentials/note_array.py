@@ -0,0 +1,503 @@
+import numpy as np
+
+from .note import Note
+from .note import _NOTE_TABLE, _REST, _TRANSPOSITION_TABLE, _DOWNWARD_TRANSPOSITION_TABLE
+from .note import _as_midi_num_array, _spelled_notes_by_midi_num
+from .note import _NATURAL_SEMITONES, _ACCIDENTAL_OFFSETS, _PITCH_INDEX
+from .cache import LRUCache
+from .interval import Interval
+from .interval import _INTERVAL_TYPES_BY_SEMITONES, _interned_interval
+
+
+_NATURAL_SEMITONES_ARRAY = np.array(_NATURAL_SEMITONES, dtype=np.int16)
+
+class NoteArray(object):
+    """A columnar collection of notes, stored as parallel `NumPy <http://www.numpy.org/>`_ arrays.
+
+    Each note is stored as an index into :attr:`~music_essentials.note.Note.VALID_PITCHES`, an octave,
+    an accidental offset (in semitones, in the range [-2, 2]), and a MIDI note number. Rests are
+    represented by a mask; the other arrays hold placeholder values (and a MIDI number of -1) at
+    rest positions.
+
+    Comparisons and transpositions operate on the whole collection at once. Comparisons involving
+    a rest are always false.
+    """
+
+    __hash__ = None
+
+    def __init__(self, pitch_index, octave, accidental, rest_mask=None):
+        """Create a new NoteArray.
+
+        Args:
+            pitch_index : array_like of int
+                The index of each note's pitch in :attr:`~music_essentials.note.Note.VALID_PITCHES`.
+
+            octave : array_like of int
+                The octave of each note.
+
+            accidental : array_like of int
+                The accidental of each note, as a semitone offset in the range [-2, 2].
+
+        Kwargs:
+            rest_mask : array_like of bool (default `None`)
+                True at positions that are rests. If `None`, no notes are rests.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the arrays have different lengths, or any note has an invalid pitch, octave,
+                accidental, or MIDI note number.
+
+        Examples:
+            >>> a = NoteArray([0, 2, 4], [4, 4, 4], [0, -1, 0])
+            >>> print(a)
+            C4 E4b G4
+        """
+        pitch_index = np.atleast_1d(pitch_index)
+        octave = np.atleast_1d(octave)
+        accidental = np.atleast_1d(accidental)
+        if rest_mask is None:
+            self.rest_mask = np.zeros(len(pitch_index), dtype=bool)
+        else:
+            self.rest_mask = np.array(rest_mask, dtype=bool, ndmin=1)
+
+        n = len(pitch_index)
+        if (len(octave) != n) or (len(accidental) != n) or (len(self.rest_mask) != n):
+            raise ValueError('Expected arrays of equal length for pitch index, octave, accidental, and rest mask')
+
+        # check the ranges before narrowing to int8, so out of range values can not wrap around
+        notes = ~self.rest_mask
+        if np.any((pitch_index[notes] < 0) | (pitch_index[notes] > 6)):
+            raise ValueError('Pitch index needs to be in the range [0, 6]')
+        if np.any((accidental[notes] < -2) | (accidental[notes] > 2)):
+            raise ValueError('Accidental offset needs to be in the range [-2, 2]')
+        if np.any((octave[notes] < -1) | (octave[notes] > 9)):
+            raise ValueError('Octave needs to be in the range [-1, 9]')
+
+        self.pitch_index = np.where(notes, pitch_index, 0).astype(np.int8)
+        self.octave = np.where(notes, octave, 0).astype(np.int8)
+        self.accidental = np.where(notes, accidental, 0).astype(np.int8)
+
+        self.midi = ((self.octave.astype(np.int16) + 1) * 12) + _NATURAL_SEMITONES_ARRAY[self.pitch_index] + self.accidental
+        self.midi[self.rest_mask] = -1
+        if np.any((self.midi < 0) & notes) or np.any(self.midi > 127):
+            raise ValueError('Invalid Note parameters, results in MIDI note numbers outside the range [0, 127]')
+
+    @classmethod
+    def from_notes(cls, notes):
+        """Create a new NoteArray from a sequence of notes.
+
+        Args:
+            notes : iterable of :attr:`~music_essentials.note.Note`
+                The notes (or rests) to store.
+
+        Returns:
+            :attr:`~music_essentials.note_array.NoteArray`
+                A new array holding the given notes, in order.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is provided.
+
+        Examples:
+            >>> a = NoteArray.from_notes([Note.from_note_string('C4'), Rest(), Note.from_note_string('A3#')])
+            >>> print(a)
+            C4 r A3#
+        """
+        pitch_index = []
+        octave = []
+        accidental = []
+        rest_mask = []
+        for n in notes:
+            if not isinstance(n, Note):
+                raise TypeError('Expected Note, got \'' + str(n) + '\'')
+            if n.is_rest:
+                pitch_index.append(0)
+                octave.append(0)
+                accidental.append(0)
+                rest_mask.append(True)
+            else:
+                pitch_index.append(_PITCH_INDEX[n.pitch])
+                octave.append(n.octave)
+                accidental.append(_ACCIDENTAL_OFFSETS[n.accidental])
+                rest_mask.append(False)
+
+        return cls(pitch_index, octave, accidental, rest_mask)
+
+    @classmethod
+    def from_midi_nums(cls, midi_nums, spelling=None, rest_mask=None):
+        """Create a new NoteArray from many MIDI numbers at once.
+
+        See :attr:`~music_essentials.note.Note.from_midi_nums()` for a description of the arguments.
+        If a rest mask is given, positions marked as rests become rests; their MIDI numbers must
+        still be in the range [0, 127], but are otherwise ignored.
+
+        Returns:
+            :attr:`~music_essentials.note_array.NoteArray`
+                A new array holding the notes corresponding to the MIDI numbers, in order.
+
+        Examples:
+            >>> a = NoteArray.from_midi_nums(numpy.array([60, 63, 67]))
+            >>> print(a)
+            C4 D4# G4
+        """
+        midi_nums = _as_midi_num_array(midi_nums)
+        pitch_index, octave, accidental = _spelled_columns_by_midi_num(spelling)
+
+        return cls(pitch_index[midi_nums], octave[midi_nums], accidental[midi_nums], rest_mask)
+
+    def to_notes(self):
+        """Convert the array to a list of notes.
+
+        Returns:
+            list
+                The :attr:`~music_essentials.note.Note`/:attr:`~music_essentials.note.Rest` objects
+                in the array, in order.
+        """
+        return [self._note_at(i) for i in range(len(self))]
+
+    def midi_note_number(self):
+        """Get the MIDI note number of every note in the array.
+
+        Returns:
+            `numpy.ndarray`
+                The MIDI note numbers, with -1 at the positions of rests.
+
+        Examples:
+            >>> a = NoteArray.from_notes([Note.from_note_string('C-1'), Note.from_note_string('G9')])
+            >>> a.midi_note_number()
+            array([  0, 127], dtype=int16)
+        """
+        return self.midi.copy()
+
+    def is_enharmonic(self, other):
+        """Check which notes are `enharmonic <https://en.wikipedia.org/wiki/Enharmonic>`_ to another note,
+        or to the corresponding notes of another array.
+
+        Args:
+            other : :attr:`~music_essentials.note.Note` or :attr:`~music_essentials.note_array.NoteArray`
+                The note(s) to compare to.
+
+        Returns:
+            `numpy.ndarray`
+                Boolean array, true where the notes represent the same pitch.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to compare to is not a note or note array.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the arrays have different lengths.
+        """
+        other_midi, other_rests = self._comparison_operands(other)[1:]
+        return (self.midi == other_midi) & ~(self.rest_mask | other_rests)
+
+    def sort_key(self):
+        """Get the sort key of every note in the array; see :attr:`~music_essentials.note.Note.sort_key()`.
+
+        Returns:
+            `numpy.ndarray`
+                The 16-bit integer sort keys, with -1 at the positions of rests.
+        """
+        keys = (self.midi << 8) | ((self.octave.astype(np.int16) + 1) << 3) | self.pitch_index
+        keys[self.rest_mask] = -1
+        return keys
+
+    def argsort(self, reverse=False):
+        """Get the indices that would sort the array.
+
+        Uses a stable radix sort over the 16-bit :attr:`~music_essentials.note_array.NoteArray.sort_key()`.
+        Rests are placed at the end, in their original order.
+
+        Kwargs:
+            reverse : bool (default `False`)
+                If true, sort the notes in descending order.
+
+        Returns:
+            `numpy.ndarray`
+                The indices of the notes, in sorted order.
+        """
+        keys = self.sort_key()
+        if reverse:
+            keys = 32766 - keys
+        keys[self.rest_mask] = 32767
+
+        return np.argsort(keys, kind='stable')
+
+    def sorted(self, reverse=False):
+        """Get a sorted copy of the array; see :attr:`~music_essentials.note_array.NoteArray.argsort()`.
+
+        Kwargs:
+            reverse : bool (default `False`)
+                If true, sort the notes in descending order.
+
+        Returns:
+            :attr:`~music_essentials.note_array.NoteArray`
+                A new array holding the notes in sorted order.
+
+        Examples:
+            >>> a = Note.parse_many(['G4', 'r', 'C4', 'B3#'], as_array=True)
+            >>> print(a.sorted())
+            B3# C4 G4 r
+        """
+        return self[self.argsort(reverse)]
+
+    def transpose(self, interval):
+        """Add an interval to every note in the array.
+
+        Rests are left unchanged. Adding a descending interval transposes every note down.
+
+        Args:
+            interval : :attr:`~music_essentials.interval.Interval`
+                The interval to add to each note.
+
+        Returns:
+            :attr:`~music_essentials.note_array.NoteArray`
+                A new array of the transposed notes.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object to add is not an :attr:`~music_essentials.interval.Interval`.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any transposed note falls outside the MIDI range.
+
+            `RuntimeError: <https://docs.python.org/2/library/exceptions.html#exceptions.RuntimeError>`_
+                If any transposed note can not be spelled with at most two accidentals.
+
+        Examples:
+            >>> a = NoteArray.from_notes([Note.from_note_string('C4'), Note.from_note_string('E4')])
+            >>> print(a + Interval.from_interval_string('m3'))
+            E4b G4
+        """
+        if not isinstance(interval, Interval):
+            raise TypeError('unsupported operand type(s) for +: \'NoteArray\' and \'' + str(interval.__class__.__name__) + '\'')
+
+        size = interval.size
+        new_pitch, new_accidental, octave_diff, valid = _TRANSPOSITION_ARRAYS[(interval.interval_type, ((size - 1) % 7) + 1, interval.descending)]
+        compound_octaves = -((size - 1) // 7) if interval.descending else (size - 1) // 7
+        accidental_idx = self.accidental + 2
+        if not np.all(valid[self.pitch_index, accidental_idx] | self.rest_mask):
+            raise RuntimeError('FATAL ERROR: Could not complete note + interval operation for every note: + ' + str(interval))
+
+        # any note moved more than 11 octaves is out of range, so larger shifts are capped to keep the
+        # octave arithmetic from overflowing; the constructor rejects the resulting octaves
+        compound_octaves = max(-12, min(12, compound_octaves))
+        return NoteArray(new_pitch[self.pitch_index, accidental_idx],
+            self.octave.astype(np.int16) + octave_diff[self.pitch_index, accidental_idx] + compound_octaves,
+            new_accidental[self.pitch_index, accidental_idx],
+            self.rest_mask)
+
+    def interval_profile(self, signed=False):
+        """Calculate the interval between each pair of consecutive notes.
+
+        Each interval is calculated as in :attr:`~music_essentials.interval.Interval.between()`,
+        for the whole array at once.
+
+        Kwargs:
+            signed : bool (default `False`)
+                If true, give a descending interval wherever the melody moves down.
+
+        Returns:
+            list
+                One :attr:`~music_essentials.interval.Interval` per pair of consecutive notes (so one
+                fewer than the number of notes), with `None` where either note is a rest.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If any interval can not be named by a supported interval type.
+
+        Examples:
+            >>> a = Note.parse_many(['C4', 'E4', 'r', 'G4', 'C4'], as_array=True)
+            >>> print([str(i) for i in a.interval_profile()])
+            ['M3', 'None', 'None', 'P5']
+            >>> print([str(i) for i in a.interval_profile(signed=True)])
+            ['M3', 'None', 'None', '-P5']
+        """
+        positions = (self.octave.astype(np.int16) * 7) + self.pitch_index
+        steps = np.diff(positions)
+        semitones = np.diff(self.midi)
+        descending = steps < 0
+        steps[descending] = -steps[descending]
+        semitones[descending] = -semitones[descending]
+
+        octaves, base_steps = np.divmod(steps, 7)
+        simple_semitones = semitones - (octaves * 12) - _SIMPLE_SEMITONES_OFFSET
+        valid = (simple_semitones >= 0) & (simple_semitones < _INTERVAL_TYPE_CODES.shape[1])
+        codes = np.where(valid, _INTERVAL_TYPE_CODES[base_steps, np.clip(simple_semitones, 0, _INTERVAL_TYPE_CODES.shape[1] - 1)], -1)
+
+        rests = self.rest_mask[:-1] | self.rest_mask[1:]
+        if np.any((codes < 0) & ~rests):
+            raise ValueError('Can not name the interval at positions ' + str(np.nonzero((codes < 0) & ~rests)[0].tolist()))
+
+        if not signed:
+            descending = np.zeros(len(steps), dtype=bool)
+        return [None if is_rest else _interned_interval(Interval.NAMED_INTERVAL_TYPES[code], size, down)
+            for code, size, down, is_rest in zip(codes.tolist(), (steps + 1).tolist(), descending.tolist(), rests.tolist())]
+
+    def __add__(self, other):
+        """Add an interval to every note in the array; see :attr:`~music_essentials.note_array.NoteArray.transpose()`."""
+        return self.transpose(other)
+
+    def __len__(self):
+        """Get the number of notes (including rests) in the array."""
+        return len(self.pitch_index)
+
+    def __iter__(self):
+        """Iterate over the notes in the array, as :attr:`~music_essentials.note.Note` objects."""
+        for i in range(len(self)):
+            yield self._note_at(i)
+
+    def __getitem__(self, key):
+        """Get a single note, or a new array holding a subset of the notes.
+
+        Args:
+            key : int, slice, or array_like
+                An integer returns a single :attr:`~music_essentials.note.Note`; anything else
+                (a slice, index array, or boolean mask) returns a new :attr:`~music_essentials.note_array.NoteArray`.
+        """
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if (key < 0) or (key >= len(self)):
+                raise IndexError('NoteArray index out of range')
+            return self._note_at(key)
+
+        return NoteArray(self.pitch_index[key], self.octave[key], self.accidental[key], self.rest_mask[key])
+
+    def __eq__(self, other):
+        """Check which notes are equal to another note, or to the corresponding notes of another array.
+
+        Does not consider `enharmonic notes <https://en.wikipedia.org/wiki/Enharmonic>`_ to be equal.
+
+        Returns:
+            `numpy.ndarray`
+                Boolean array, true where the notes have the same pitch, octave, and accidentals.
+        """
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys == other_keys) & not_rests
+
+    def __ne__(self, other):
+        """Check which notes are not equal to another note, or to the corresponding notes of another array."""
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys != other_keys) & not_rests
+
+    def __lt__(self, other):
+        """Check which notes are less than another note, or the corresponding notes of another array.
+
+        Uses the same ordering as :attr:`~music_essentials.note.Note.__lt__()`.
+        """
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys < other_keys) & not_rests
+
+    def __gt__(self, other):
+        """Check which notes are greater than another note, or the corresponding notes of another array.
+
+        Uses the same ordering as :attr:`~music_essentials.note.Note.__gt__()`.
+        """
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys > other_keys) & not_rests
+
+    def __le__(self, other):
+        """Check which notes are less than or equal to another note, or the corresponding notes of another array."""
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys <= other_keys) & not_rests
+
+    def __ge__(self, other):
+        """Check which notes are greater than or equal to another note, or the corresponding notes of another array."""
+        keys, other_keys, not_rests = self._comparison_keys(other)
+        return (keys >= other_keys) & not_rests
+
+    def __str__(self):
+        """Create a string representation of the array, in the form ``<note_1> <note_2> ... <note_n>``.
+
+        Examples:
+            >>> a = NoteArray.from_notes([Note.from_note_string('C4'), Rest()])
+            >>> print(a)
+            C4 r
+        """
+        return ' '.join(str(n) for n in self)
+
+    def _note_at(self, idx):
+        """Get the interned :attr:`~music_essentials.note.Note` at the given position."""
+        if self.rest_mask[idx]:
+            return _REST
+        accidental = _OFFSET_ACCIDENTALS_BY_INDEX[self.accidental[idx] + 2]
+        return _NOTE_TABLE[(Note.VALID_PITCHES[self.pitch_index[idx]], int(self.octave[idx]), accidental)]
+
+
+    def _comparison_operands(self, other):
+        """Get the sort keys, MIDI numbers, and rest mask of the note(s) being compared to."""
+        if isinstance(other, NoteArray):
+            if len(other) != len(self):
+                raise ValueError('Can not compare NoteArrays of different lengths: ' + str(len(self)) + ' and ' + str(len(other)))
+            return other.sort_key(), other.midi, other.rest_mask
+        if isinstance(other, Note):
+            if other.is_rest:
+                return -1, -1, True
+            return other.sort_key(), other.midi_note_number(), False
+
+        raise TypeError('Can not compare NoteArray and \'' + str(other) + '\'')
+
+    def _comparison_keys(self, other):
+        """Get the sort keys on both sides of a comparison, and a mask of positions without rests."""
+        other_keys, other_midi, other_rests = self._comparison_operands(other)
+        return self.sort_key(), other_keys, ~(self.rest_mask | other_rests)
+
+
+# index = accidental offset + 2; val = accidental
+_OFFSET_ACCIDENTALS_BY_INDEX = ('bb', 'b', None, '#', '##')
+
+# key = spelling table; val = (pitch index, octave, accidental offset) arrays of length 128
+_SPELLED_COLUMNS_BY_MIDI_NUM = LRUCache(64)
+
+def _spelled_columns_by_midi_num(spelling):
+    """Get lookup arrays of pitch index, octave, and accidental offset for every MIDI number."""
+    key = None if spelling is None else tuple(tuple(p) for p in spelling)
+    return _SPELLED_COLUMNS_BY_MIDI_NUM.get(key, lambda: _build_spelled_columns(key))
+
+def _build_spelled_columns(spelling):
+    """Convert the notes for every MIDI number into lookup arrays."""
+    notes = _spelled_notes_by_midi_num(spelling)
+    return (np.array([_PITCH_INDEX[n.pitch] for n in notes], dtype=np.int8),
+        np.array([n.octave for n in notes], dtype=np.int8),
+        np.array([_ACCIDENTAL_OFFSETS[n.accidental] for n in notes], dtype=np.int8))
+
+def _build_transposition_arrays():
+    """Convert the note transposition tables into lookup arrays, indexed by ``[pitch index, accidental offset + 2]``.
+
+    Returns:
+        dict
+            Keyed by ``(interval type, base interval size, descending)``, with values ``(new pitch index,
+            new accidental offset, octave difference, valid)``.
+    """
+    arrays = {}
+    transpositions = [(key + (False,), val) for key, val in _TRANSPOSITION_TABLE.items()]
+    transpositions.extend((key + (True,), val) for key, val in _DOWNWARD_TRANSPOSITION_TABLE.items())
+    for (pitch, accidental, interval_type, size, descending), (new_pitch, new_accidental, octave_diff) in transpositions:
+        key = (interval_type, size, descending)
+        if key not in arrays:
+            arrays[key] = (np.zeros((7, 5), dtype=np.int8), np.zeros((7, 5), dtype=np.int8),
+                np.zeros((7, 5), dtype=np.int8), np.zeros((7, 5), dtype=bool))
+        idx = (_PITCH_INDEX[pitch], _ACCIDENTAL_OFFSETS[accidental] + 2)
+        arrays[key][0][idx] = _PITCH_INDEX[new_pitch]
+        arrays[key][1][idx] = _ACCIDENTAL_OFFSETS[new_accidental]
+        arrays[key][2][idx] = octave_diff
+        arrays[key][3][idx] = True
+
+    return arrays
+
+_TRANSPOSITION_ARRAYS = _build_transposition_arrays()
+
+def _build_interval_type_codes():
+    """Convert the interval naming table into a lookup array, indexed by
+    ``[base size - 1, semitones - _SIMPLE_SEMITONES_OFFSET]``, of indices into
+    :attr:`~music_essentials.interval.Interval.NAMED_INTERVAL_TYPES` (-1 where there is no interval)."""
+    max_semitones = max(semitones for size, semitones in _INTERVAL_TYPES_BY_SEMITONES)
+    codes = np.full((7, max_semitones - _SIMPLE_SEMITONES_OFFSET + 1), -1, dtype=np.int8)
+    for (size, semitones), interval_type in _INTERVAL_TYPES_BY_SEMITONES.items():
+        codes[size - 1, semitones - _SIMPLE_SEMITONES_OFFSET] = Interval.NAMED_INTERVAL_TYPES.index(interval_type)
+
+    return codes
+
+_SIMPLE_SEMITONES_OFFSET = min(semitones for size, semitones in _INTERVAL_TYPES_BY_SEMITONES)
+_INTERVAL_TYPE_CODES = _build_interval_type_codes()
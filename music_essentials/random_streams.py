@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+
+class RandomStreams(object):
+    """Independent, reproducible random number streams derived from a single root seed.
+
+    Each stream is identified by a key (e.g., a worker or chunk index) and is derived from the
+    root seed using a `NumPy SeedSequence <https://numpy.org/doc/stable/reference/random/bit_generators/generated/numpy.random.SeedSequence.html>`_.
+    Streams depend only on the root seed and their key - not on the order in which they are
+    requested - so work can be split across threads or processes and still produce identical
+    output for a given root seed.
+    """
+
+    def __init__(self, seed=None, spawn_key=()):
+        """Create a new set of random streams.
+
+        Kwargs:
+            seed : int (default `None`)
+                The root seed. If `None`, a seed is drawn from the operating system; it is
+                available afterwards as :attr:`~music_essentials.random_streams.RandomStreams.seed`.
+
+            spawn_key : tuple of int (default ``()``)
+                The position of these streams below the root seed. Normally left empty; use
+                :attr:`~music_essentials.random_streams.RandomStreams.child()` instead.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the seed is not an integer.
+
+        Examples:
+            >>> streams = RandomStreams(1234)
+            >>> notes = [Note.random_note(random_instance=streams.random_instance(0)) for i in range(10)]
+        """
+        if (seed is not None) and not isinstance(seed, (int, np.integer)):
+            raise TypeError('Expected integer for seed, got: ' + str(seed))
+
+        self._seed_sequence = np.random.SeedSequence(seed, spawn_key=tuple(spawn_key))
+        self.seed = self._seed_sequence.entropy
+        self.spawn_key = self._seed_sequence.spawn_key
+
+    def child(self, key):
+        """Get the independent streams identified by a key.
+
+        Args:
+            key : int
+                The key identifying the child, e.g., a worker index. Should be non-negative.
+
+        Returns:
+            :attr:`~music_essentials.random_streams.RandomStreams`
+                The child streams. Asking for the same key always returns equivalent streams.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the key is negative.
+        """
+        if key < 0:
+            raise ValueError('Expected non-negative stream key, got: ' + str(key))
+
+        return RandomStreams(self.seed, self.spawn_key + (int(key),))
+
+    def children(self, count):
+        """Get the streams for keys ``0`` to ``count - 1``.
+
+        Args:
+            count : int
+                The number of children, e.g., the number of workers.
+
+        Returns:
+            list
+                The child :attr:`~music_essentials.random_streams.RandomStreams`, in key order.
+        """
+        return [self.child(key) for key in range(count)]
+
+    def generator(self, key=None):
+        """Create a NumPy random number generator for a stream.
+
+        Suitable for :attr:`~music_essentials.note.Note.random_notes()`.
+
+        Kwargs:
+            key : int (default `None`)
+                The key of the child stream to use. If `None`, uses this stream itself.
+
+        Returns:
+            `numpy.random.Generator`
+                A new generator, always producing the same sequence for the same root seed and key.
+
+        Examples:
+            >>> streams = RandomStreams(1234)
+            >>> notes = Note.random_notes(1000, generator=streams.generator(3))
+        """
+        if key is not None:
+            return self.child(key).generator()
+
+        return np.random.Generator(np.random.PCG64(self._seed_sequence))
+
+    def random_instance(self, key=None):
+        """Create a Python random number generator for a stream.
+
+        Suitable for :attr:`~music_essentials.note.Note.random_note()`. Each thread should use its own instance.
+
+        Kwargs:
+            key : int (default `None`)
+                The key of the child stream to use. If `None`, uses this stream itself.
+
+        Returns:
+            `random.Random <https://docs.python.org/3/library/random.html#random.Random>`_
+                A new generator, always producing the same sequence for the same root seed and key.
+        """
+        if key is not None:
+            return self.child(key).random_instance()
+
+        state = self._seed_sequence.generate_state(8, np.uint32)
+        return random.Random(int.from_bytes(state.astype('<u4').tobytes(), 'little'))
@@ -1,11 +1,26 @@
-# TODO: specify number of octaves
-# TODO: specify direction
-
 from .note import Note
+from .note import _MIDI_PITCH_ACCIDENTALS, _NOTE_TABLE
 from .interval import Interval
+from .cache import LRUCache
+
+# index = midi_num % 12; val = (pitch, accidental)
+_FLAT_PITCH_ACCIDENTALS = (('C', None), ('D', 'b'), ('D', None), ('E', 'b'), ('E', None), ('F', None),
+    ('G', 'b'), ('G', None), ('A', 'b'), ('A', None), ('B', 'b'), ('B', None))
 
 class Scale(object):
-    """Static class methods for building lists of notes according to pre-defined patterns."""
+    """A scale, built from a tonic according to a pre-defined pattern.
+
+    A scale holds its spelled notes along with a 12-bit pitch class mask (bit ``n`` is set if
+    the scale contains pitch class ``n``, where ``n = midi_num % 12``), so membership tests
+    and set operations between scales are integer bit operations. Membership is decided by
+    pitch class, so `enharmonically equivalent <https://en.wikipedia.org/wiki/Enharmonic>`_
+    notes in any octave are in the scale.
+
+    Scales are immutable. The class methods (e.g., :attr:`~music_essentials.scale.Scale.build_scale()`)
+    can also be used without creating a scale.
+    """
+
+    __slots__ = ('tonic', 'scale_type', 'notes', 'mask', '_degrees')
     _MAJOR            = ('M2', 'M3', 'P4', 'P5', 'M6', 'M7', 'P8')
     _HARMONIC_MINOR   = ('M2', 'm3', 'P4', 'P5', 'm6', 'M7', 'P8')
     _NATURAL_MINOR    = ('M2', 'm3', 'P4', 'P5', 'm6', 'm7', 'P8')
@@ -37,6 +52,75 @@ class Scale(object):
         'chromatic'        : _CHROMATIC,
     }
 
+    # memoized build_scale results; None while caching is disabled
+    _cache = None
+
+    # list of (pitch class mask, (pitch, accidental, scale type)); built on first use by find_scales
+    _SCALE_INDEX = None
+
+    # key = pitch class mask; val = find_scales result
+    _FOUND_SCALES = {}
+
+    @classmethod
+    def enable_cache(cls, maxsize=128):
+        """Memoize :attr:`~music_essentials.scale.Scale.build_scale()` in a bounded LRU cache.
+
+        Scales are cached by tonic spelling and scale pattern (so aliases such as 'major' and 'maj'
+        share an entry). While the cache is enabled, :attr:`~music_essentials.scale.Scale.build_scale()`
+        returns shared, immutable tuples rather than new lists. Enabling the cache again replaces
+        the existing cache with an empty one.
+
+        Kwargs:
+            maxsize : int (default 128)
+                The maximum number of scales to hold. Should be positive.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the maximum size is not an integer.
+
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the maximum size is not positive.
+
+        Examples:
+            >>> Scale.enable_cache(256)
+            >>> s = Scale.build_scale(Note.from_note_string('C4'), 'major')
+            >>> s is Scale.build_scale(Note.from_note_string('C4'), 'maj')
+            True
+        """
+        Scale._cache = LRUCache(maxsize)
+
+    @classmethod
+    def disable_cache(cls):
+        """Stop memoizing :attr:`~music_essentials.scale.Scale.build_scale()`, discarding any cached scales."""
+        Scale._cache = None
+
+    @classmethod
+    def clear_cache(cls):
+        """Discard all cached scales and reset the cache statistics. Does nothing if caching is disabled."""
+        if Scale._cache is not None:
+            Scale._cache.clear()
+
+    @classmethod
+    def cache_info(cls):
+        """Get the statistics of the :attr:`~music_essentials.scale.Scale.build_scale()` cache.
+
+        Returns:
+            :attr:`~music_essentials.cache.CacheInfo`
+                A named tuple of ``(hits, misses, evictions, maxsize, currsize)``, or `None` if
+                caching is disabled.
+
+        Examples:
+            >>> Scale.enable_cache()
+            >>> s = Scale.build_scale(Note.from_note_string('C4'), 'major')
+            >>> s = Scale.build_scale(Note.from_note_string('C4'), 'major')
+            >>> print(Scale.cache_info())
+            CacheInfo(hits=1, misses=1, evictions=0, maxsize=128, currsize=1)
+        """
+        if Scale._cache is None:
+            return None
+
+        return Scale._cache.info()
+
     @classmethod
     def build_scale(cls, tonic, scale_type):
         """Build a scale.
@@ -58,7 +142,8 @@ class Scale(object):
 
         Returns:
             list
-                The notes in the specified scale, in ascending order.
+                The notes in the specified scale, in ascending order. If caching is enabled (see
+                :attr:`~music_essentials.scale.Scale.enable_cache()`), a shared tuple is returned instead.
 
         Raises:
             `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
@@ -75,9 +160,440 @@ class Scale(object):
             raise ValueError('Unknown scale type \'' + str(scale_type) + '\'')
 
         scale_pattern = Scale._SCALE_PATTERNS[scale_type]
+        cache = Scale._cache
+        if (cache is None) or tonic.is_rest:
+            return Scale._build_pattern(tonic, scale_pattern)
+
+        return cache.get((tonic.pitch, tonic.octave, tonic.accidental, scale_pattern),
+            lambda: tuple(Scale._build_pattern(tonic, scale_pattern)))
+
+    @classmethod
+    def find_scales(cls, notes):
+        """Find every scale that contains all of the given notes.
+
+        Notes are matched by pitch class, so octave and enharmonic spelling are ignored, and rests
+        are skipped. Every scale pattern (under its first listed name, e.g., 'major' rather than
+        'maj') is considered from every tonic with at most one accidental, and results are memoized
+        by the set of pitch classes - repeated queries are a single dictionary lookup.
+
+        Args:
+            notes : iterable
+                The :attr:`~music_essentials.note.Note` objects that each scale must contain.
+
+        Returns:
+            tuple
+                A ``(pitch, accidental, scale type)`` tuple for each matching scale, ordered by scale
+                type, then tonic.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If anything other than a :attr:`~music_essentials.note.Note` is given.
+
+        Examples:
+            >>> notes = [Note.from_note_string(s) for s in ('C4', 'E4', 'F4#', 'B4')]
+            >>> Scale.find_scales(notes)[:3]
+            (('G', None, 'major'), ('E', None, 'minor'), ('F', 'b', 'minor'))
+        """
+        mask = 0
+        for n in notes:
+            if not isinstance(n, Note):
+                raise TypeError('Expected Note, got: ' + str(n))
+            if not n.is_rest:
+                mask |= 1 << (n.midi_note_number() % 12)
+
+        found = Scale._FOUND_SCALES.get(mask)
+        if found is None:
+            if Scale._SCALE_INDEX is None:
+                Scale._SCALE_INDEX = _build_scale_index()
+            found = tuple(scale for scale_mask, scale in Scale._SCALE_INDEX if (scale_mask & mask) == mask)
+            Scale._FOUND_SCALES[mask] = found
+
+        return found
+
+    @classmethod
+    def _build_pattern(cls, tonic, scale_pattern):
+        """Build the list of notes found by adding each interval in a scale pattern to the tonic."""
         scale = [tonic]
         for diff in scale_pattern:
             new = scale[0] + Interval.from_interval_string(diff)
             scale.append(new)
 
         return scale
+
+    @classmethod
+    def build_spelling(cls, tonic, scale_type):
+        """Build a table of note spellings that follows a key.
+
+        Each pitch class in the scale is spelled as it appears in the scale. The remaining pitch classes
+        are spelled with flats if the scale contains flats, and with sharps otherwise.
+        The table can be passed to :attr:`~music_essentials.note.Note.from_midi_nums()`.
+
+        Args:
+            tonic : :attr:`~music_essentials.note.Note`
+                The tonic note of the scale.
+
+            scale_type : str
+                The type of scale; see :attr:`~music_essentials.scale.Scale.build_scale()`.
+
+        Returns:
+            tuple
+                Twelve ``(pitch, accidental)`` pairs, indexed by pitch class (``midi_num % 12``).
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If an invalid scale type is provided.
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the tonic is not a :attr:`~music_essentials.note.Note`, or scale type is not a string.
+
+        Examples:
+            >>> spelling = Scale.build_spelling(Note.from_note_string('F4'), 'major')
+            >>> print(spelling[10])
+            ('B', 'b')
+        """
+        scale = Scale.build_scale(tonic, scale_type)
+
+        spelling = [None] * 12
+        for n in scale:
+            pitch_class = n.midi_note_number() % 12
+            if spelling[pitch_class] is None:
+                spelling[pitch_class] = (n.pitch, n.accidental)
+
+        default = _MIDI_PITCH_ACCIDENTALS
+        if any((n.accidental is not None) and ('b' in n.accidental) for n in scale):
+            default = _FLAT_PITCH_ACCIDENTALS
+        for pitch_class in range(12):
+            if spelling[pitch_class] is None:
+                spelling[pitch_class] = default[pitch_class]
+
+        return tuple(spelling)
+
+    def __init__(self, tonic, scale_type):
+        """Create a new Scale.
+
+        Args:
+            tonic : :attr:`~music_essentials.note.Note`
+                The tonic note of the scale.
+
+            scale_type : str
+                The type of scale; see :attr:`~music_essentials.scale.Scale.build_scale()`.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If an invalid scale type is provided.
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the tonic is not a :attr:`~music_essentials.note.Note`, or scale type is not a string.
+
+        Examples:
+            >>> s = Scale(Note.from_note_string('D4'), 'major')
+            >>> print(s)
+            D4 E4 F4# G4 A4 B4 C5# D5
+            >>> Note.from_note_string('G5b') in s
+            True
+        """
+        notes = tuple(Scale.build_scale(tonic, scale_type))
+
+        # degrees are numbered from 1 (the tonic); the first note of each pitch class wins
+        degrees = [None] * 12
+        mask = 0
+        for degree, n in enumerate(notes, 1):
+            pitch_class = n.midi_note_number() % 12
+            if degrees[pitch_class] is None:
+                degrees[pitch_class] = degree
+            mask |= 1 << pitch_class
+
+        object.__setattr__(self, 'tonic', notes[0])
+        object.__setattr__(self, 'scale_type', scale_type)
+        object.__setattr__(self, 'notes', notes)
+        object.__setattr__(self, 'mask', mask)
+        object.__setattr__(self, '_degrees', tuple(degrees))
+
+    def degree(self, note):
+        """Get the scale degree of a note.
+
+        Degrees are numbered from 1 (the tonic), and are found by pitch class, so the note may be
+        in any octave and may be spelled enharmonically.
+
+        Args:
+            note : :attr:`~music_essentials.note.Note`
+                The note to find.
+
+        Returns:
+            int
+                The degree of the note in the scale, or `None` if the note is not in the scale or is a rest.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the note is not a :attr:`~music_essentials.note.Note`.
+
+        Examples:
+            >>> s = Scale(Note.from_note_string('D4'), 'major')
+            >>> s.degree(Note.from_note_string('A2'))
+            5
+        """
+        if not isinstance(note, Note):
+            raise TypeError('Expected Note, got: ' + str(note))
+        if note.is_rest:
+            return None
+
+        return self._degrees[note.midi_note_number() % 12]
+
+    def common_tones(self, other):
+        """Get the notes of this scale whose pitch classes are also in another scale.
+
+        Args:
+            other : :attr:`~music_essentials.scale.Scale`
+                The scale to compare to.
+
+        Returns:
+            list
+                The notes of this scale (in this scale's spelling) that share a pitch class with
+                the other scale, in ascending order. Each pitch class is listed once.
+
+        Examples:
+            >>> c = Scale(Note.from_note_string('C4'), 'major')
+            >>> a = Scale(Note.from_note_string('A4'), 'major')
+            >>> print([str(n) for n in c.common_tones(a)])
+            ['D4', 'E4', 'A4', 'B4']
+        """
+        common = self & other
+        tones = []
+        for n in self.notes:
+            bit = 1 << (n.midi_note_number() % 12)
+            if common & bit:
+                tones.append(n)
+                common &= ~bit # list each pitch class once, skipping the octave
+
+        return tones
+
+    def note_at(self, index):
+        """Get the note at any position of the scale, extended up and down by octaves.
+
+        Index 0 is the tonic, positive indices count up the scale, and negative indices count down
+        from the tonic (unlike :attr:`~music_essentials.scale.Scale.__getitem__()`, which counts
+        back from the last note). The note is looked up directly, so any index costs the same.
+
+        Args:
+            index : int
+                The position of the note, counted in scale steps from the tonic.
+
+        Returns:
+            :attr:`~music_essentials.note.Note`
+                The note at that position.
+
+        Raises:
+            `IndexError: <https://docs.python.org/2/library/exceptions.html#exceptions.IndexError>`_
+                If the note falls outside the MIDI range.
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the index is not an integer.
+
+        Examples:
+            >>> s = Scale(Note.from_note_string('D4'), 'dorian')
+            >>> print(s.note_at(16))
+            F6
+            >>> print(s.note_at(-1))
+            C4
+        """
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise TypeError('Expected integer for scale index, got: ' + str(index))
+
+        # the last note of every pattern is the octave, so the notes before it repeat each octave
+        octaves, step = divmod(index, len(self.notes) - 1)
+        base = self.notes[step]
+        note = _NOTE_TABLE.get((base.pitch, base.octave + octaves, base.accidental))
+        if note is None:
+            raise IndexError('Scale index ' + str(index) + ' is outside the MIDI range')
+
+        return note
+
+    def walk(self, direction='ascending', octaves=None):
+        """Generate the notes of the scale, starting from the tonic.
+
+        Notes are created as they are needed, so long walks do not build lists.
+
+        Kwargs:
+            direction : str (default 'ascending')
+                Either 'ascending' or 'descending'.
+
+            octaves : int (default `None`)
+                The number of octaves to walk; the walk ends on the tonic this many octaves away.
+                If `None`, walk until the end of the MIDI range. The walk always stops early at
+                the end of the MIDI range.
+
+        Returns:
+            generator
+                The :attr:`~music_essentials.note.Note` objects of the scale, in order.
+
+        Raises:
+            `ValueError: <https://docs.python.org/2/library/exceptions.html#exceptions.ValueError>`_
+                If the direction is not supported, or the number of octaves is not positive.
+
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the number of octaves is not an integer.
+
+        Examples:
+            >>> s = Scale(Note.from_note_string('A4'), 'minor pentatonic')
+            >>> print(' '.join(str(n) for n in s.walk('descending', octaves=1)))
+            A4 G4 E4 D4 C4 A3
+        """
+        if direction not in ('ascending', 'descending'):
+            raise ValueError('Unknown scale direction \'' + str(direction) + '\'')
+        if octaves is not None:
+            if isinstance(octaves, bool) or not isinstance(octaves, int):
+                raise TypeError('Expected integer for number of octaves, got: ' + str(octaves))
+            if octaves < 1:
+                raise ValueError('Number of octaves must be positive, got: ' + str(octaves))
+
+        return self._walk(-1 if direction == 'descending' else 1, octaves)
+
+    def _walk(self, step, octaves):
+        """Generate notes by index from the tonic, stopping after a number of octaves or at the end of the MIDI range."""
+        count = None if octaves is None else (octaves * (len(self.notes) - 1)) + 1
+        index = 0
+        while (count is None) or (abs(index) < count):
+            try:
+                note = self.note_at(index)
+            except IndexError:
+                return
+            yield note
+            index += step
+
+    def __contains__(self, note):
+        """Check if a note's pitch class is in the scale.
+
+        Rests are never in a scale.
+
+        Raises:
+            `TypeError: <https://docs.python.org/2/library/exceptions.html#exceptions.TypeError>`_
+                If the object is not a :attr:`~music_essentials.note.Note`.
+        """
+        if not isinstance(note, Note):
+            raise TypeError('Expected Note, got: ' + str(note))
+        if note.is_rest:
+            return False
+
+        return bool((self.mask >> (note.midi_note_number() % 12)) & 1)
+
+    def __and__(self, other):
+        """Get the pitch class mask of the notes in both scales.
+
+        Args:
+            other : :attr:`~music_essentials.scale.Scale` or int
+                The scale (or pitch class mask) to intersect with.
+
+        Returns:
+            int
+                A 12-bit pitch class mask.
+        """
+        if isinstance(other, Scale):
+            return self.mask & other.mask
+        if isinstance(other, int):
+            return self.mask & other
+        return NotImplemented
+
+    __rand__ = __and__
+
+    def __or__(self, other):
+        """Get the pitch class mask of the notes in either scale.
+
+        Args:
+            other : :attr:`~music_essentials.scale.Scale` or int
+                The scale (or pitch class mask) to combine with.
+
+        Returns:
+            int
+                A 12-bit pitch class mask.
+        """
+        if isinstance(other, Scale):
+            return self.mask | other.mask
+        if isinstance(other, int):
+            return self.mask | other
+        return NotImplemented
+
+    __ror__ = __or__
+
+    def __len__(self):
+        """Get the number of notes in the scale, including the octave above the tonic."""
+        return len(self.notes)
+
+    def __iter__(self):
+        """Iterate over the notes in the scale, in ascending order."""
+        return iter(self.notes)
+
+    def __getitem__(self, key):
+        """Get a note (or, for a slice, a tuple of notes) of the scale; index 0 is the tonic."""
+        return self.notes[key]
+
+    def __eq__(self, other):
+        """Check if two scales contain the same spelled notes."""
+        if not isinstance(other, Scale):
+            return NotImplemented
+
+        return self.notes == other.notes
+
+    def __ne__(self, other):
+        """Check if two scales do not contain the same spelled notes."""
+        if not isinstance(other, Scale):
+            return NotImplemented
+
+        return self.notes != other.notes
+
+    def __hash__(self):
+        """Hash the scale by its spelled notes."""
+        return hash(self.notes)
+
+    def __setattr__(self, name, value):
+        """Prevent modification of the scale; scales are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not modify attribute \'' + str(name) + '\' of immutable Scale')
+
+    def __delattr__(self, name):
+        """Prevent deletion of scale attributes; scales are immutable.
+
+        Raises:
+            `AttributeError: <https://docs.python.org/2/library/exceptions.html#exceptions.AttributeError>`_
+                Always.
+        """
+        raise AttributeError('Can not delete attribute \'' + str(name) + '\' of immutable Scale')
+
+    def __reduce__(self):
+        """Support pickling and copying by re-creating the scale from its tonic and scale type."""
+        return (self.__class__, (self.tonic, self.scale_type))
+
+    def __str__(self):
+        """Create a string representation of the scale, as its notes separated by spaces."""
+        return ' '.join(str(n) for n in self.notes)
+
+def _build_scale_index():
+    """Calculate the pitch class mask of every scale pattern from every tonic with at most one accidental.
+
+    Returns:
+        list
+            ``(pitch class mask, (pitch, accidental, scale type))`` tuples, ordered by scale type,
+            then tonic. Scales that can not be spelled (e.g., needing triple sharps) are not included.
+    """
+    scale_types = []
+    for scale_type, scale_pattern in Scale._SCALE_PATTERNS.items():
+        if scale_pattern not in [Scale._SCALE_PATTERNS[t] for t in scale_types]:
+            scale_types.append(scale_type)
+
+    index = []
+    for scale_type in scale_types:
+        for pitch in Note.VALID_PITCHES:
+            for accidental in (None, '#', 'b'):
+                try:
+                    notes = Scale._build_pattern(Note(pitch, 4, accidental), Scale._SCALE_PATTERNS[scale_type])
+                except RuntimeError:
+                    continue # can not be spelled with at most two accidentals
+                mask = 0
+                for n in notes:
+                    mask |= 1 << (n.midi_note_number() % 12)
+                index.append((mask, (pitch, accidental, scale_type)))
+
+    return index
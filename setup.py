@@ -8,5 +8,8 @@ setup(
     author='Charlotte Pierce',
     author_email='charlotte@malformed-bits.com',
     license='MIT',
-    packages=['music_essentials']
+    packages=['music_essentials'],
+    extras_require={
+        'numpy': ['numpy']
+    }
 )
\ No newline at end of file
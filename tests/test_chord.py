@@ -1,6 +1,6 @@
 import pytest
 
-from music_essentials import Chord, Note
+from music_essentials import Chord, Note, Rest
 
 # Test constructor
 def test_correct_note_list_length():
@@ -146,4 +146,318 @@ def test_over_octave_chord_build():
     c = Chord.build_chord(Note.from_note_string('G4'), 'II', 'minor')
     expected = [Note.from_note_string('A4'), Note.from_note_string('C5'), Note.from_note_string('E5b')]
 
-    assert c.notes == expected
\ No newline at end of file
+    assert c.notes == expected
+
+def test_seventh_chord_build():
+    c = Chord.build_chord(Note.from_note_string('C4'), 'V7', 'major')
+    assert str(c) == 'G4+B4+D5+F5'
+
+def test_seventh_chord_build_minor():
+    c = Chord.build_chord(Note.from_note_string('A3'), 'VII7', 'minor')
+    assert str(c) == 'G4#+B4+D5+F5'
+
+def test_ninth_chord_build():
+    c = Chord.build_chord(Note.from_note_string('C4'), 'II9', 'major')
+    assert str(c) == 'D4+F4+A4+C5+E5'
+
+def test_thirteenth_chord_build():
+    c = Chord.build_chord(Note.from_note_string('C4'), 'I13', 'major')
+    assert str(c) == 'C4+E4+G4+B4+D5+F5+A5'
+
+def test_extended_chord_identified():
+    assert Chord.build_chord(Note.from_note_string('F4'), 'V7', 'major').identify().quality == 'dominant 7'
+
+def test_octave_chord_number_build():
+    c = Chord.build_chord(Note.from_note_string('C4'), 'VIII', 'major')
+    assert str(c) == 'C5+E5+G5'
+
+def test_chord_build_repeated():
+    c1 = Chord.build_chord(Note.from_note_string('E4b'), 'IV', 'minor')
+    c2 = Chord.build_chord(Note.from_note_string('E4b'), 'IV', 'min')
+    assert (str(c1) == str(c2) == 'A4b+C5b+E5b') and (c1.notes is not c2.notes)
+
+def test_chord_build_result_independent():
+    c1 = Chord.build_chord(Note.from_note_string('C4'), 'I', 'major')
+    c1.add_note(Note.from_note_string('B4'))
+    assert str(Chord.build_chord(Note.from_note_string('C4'), 'I', 'major')) == 'C4+E4+G4'
+
+def test_chord_build_out_of_range():
+    with pytest.raises(ValueError):
+        Chord.build_chord(Note.from_note_string('C9'), 'V', 'major')
+
+def test_chord_build_unsupported_extension():
+    with pytest.raises(ValueError):
+        Chord.build_chord(Note.from_note_string('C4'), 'V8', 'major')
+
+def test_chord_build_rest():
+    with pytest.raises(TypeError):
+        Chord.build_chord(Rest(), 'I', 'major')
+
+# Test creating chords from several notes
+def test_from_notes_sorted():
+    c = Chord.from_notes([Note.from_note_string(s) for s in ('G4', 'C4', 'E4')])
+    assert str(c) == 'C4+E4+G4'
+
+def test_from_notes_matches_add_note():
+    notes = [Note.from_note_string(s) for s in ('E4', 'B3#', 'C4', 'D4bb', 'G2', 'C4', 'F5#')]
+    c = Chord(notes[0])
+    for n in notes[1:]:
+        c.add_note(n)
+    assert [str(n) for n in Chord.from_notes(notes).notes] == [str(n) for n in c.notes]
+
+def test_from_notes_generator():
+    c = Chord.from_notes(Note.from_note_string(s) for s in ('E4', 'C4'))
+    assert str(c) == 'C4+E4'
+
+def test_from_notes_empty():
+    with pytest.raises(ValueError):
+        Chord.from_notes([])
+
+def test_from_notes_non_note():
+    with pytest.raises(TypeError):
+        Chord.from_notes([Note.from_note_string('C4'), 'E4'])
+
+def test_from_notes_rest():
+    with pytest.raises(TypeError):
+        Chord.from_notes([Note.from_note_string('C4'), Rest()])
+
+def test_from_notes_add_note():
+    c = Chord.from_notes([Note.from_note_string('C4'), Note.from_note_string('G4')])
+    c.add_note(Note.from_note_string('E4'))
+    assert str(c) == 'C4+E4+G4'
+
+def test_from_string():
+    assert str(Chord.from_string('G4+C4+E4')) == 'C4+E4+G4'
+
+def test_from_string_round_trip():
+    c = Chord.from_string('C4+E4b+G4+B4bb')
+    assert str(Chord.from_string(str(c))) == str(c)
+
+def test_from_string_invalid_note():
+    with pytest.raises(ValueError):
+        Chord.from_string('C4+H4')
+
+def test_from_string_non_string():
+    with pytest.raises(TypeError):
+        Chord.from_string(7)
+
+# Test bisection in add_note
+def test_add_note_enharmonic_order():
+    c = Chord(Note.from_note_string('C4'))
+    c.add_note(Note.from_note_string('B3#'))
+    c.add_note(Note.from_note_string('D4bb'))
+    assert str(c) == 'B3#+C4+D4bb'
+
+def test_add_note_duplicate():
+    c = Chord.from_string('C4+E4')
+    c.add_note(Note.from_note_string('C4'))
+    assert str(c) == 'C4+C4+E4'
+
+def test_add_note_after_direct_change():
+    c = Chord.from_string('C4+G4')
+    c.notes.append(Note.from_note_string('C5'))
+    c.add_note(Note.from_note_string('E5'))
+    assert str(c) == 'C4+G4+C5+E5'
+
+def test_add_note_after_direct_replace():
+    c = Chord.from_string('C4+G4')
+    c.notes[1] = Note.from_note_string('C5')
+    c.add_note(Note.from_note_string('A4'))
+    assert str(c) == 'C4+A4+C5'
+
+def test_add_note_rest():
+    with pytest.raises(TypeError):
+        Chord.from_string('C4+G4').add_note(Rest())
+
+# Test chord identification
+def test_identify_major():
+    name = Chord.from_string('C4+E4+G4').identify()
+    assert (str(name.root) == 'C4') and (name.quality == 'major') and (name.inversion == 0)
+
+def test_identify_first_inversion():
+    name = Chord.from_string('E4+G4+C5').identify()
+    assert (str(name.root) == 'C5') and (name.quality == 'major') and (name.inversion == 1)
+
+def test_identify_second_inversion_minor():
+    name = Chord.from_string('E3+A3+C4').identify()
+    assert (str(name.root) == 'A3') and (name.quality == 'minor') and (name.inversion == 2)
+
+def test_identify_spelling_kept():
+    name = Chord.from_string('D4b+F4+A4b').identify()
+    assert str(name.root) == 'D4b'
+
+def test_identify_enharmonic_spelling():
+    assert Chord.from_string('C4+F4b+G4').identify().quality == 'major'
+
+def test_identify_doubled_notes():
+    name = Chord.from_string('G2+D3+G3+B3+D4+G4').identify()
+    assert (str(name.root) == 'G2') and (name.quality == 'major') and (name.inversion == 0)
+
+def test_identify_qualities():
+    expected = {
+        'C4+E4b+G4b': 'diminished',
+        'C4+E4+G4#': 'augmented',
+        'C4+F4+G4': 'sus4',
+        'C4+D4+G4': 'sus2',
+        'C4+G4': 'power',
+        'G3+B3+D4+F4': 'dominant 7',
+        'C4+E4+G4+B4': 'major 7',
+        'D4+F4+A4+C5': 'minor 7',
+        'C4+E4b+G4+B4': 'minor major 7',
+        'B3+D4+F4+A4': 'half-diminished 7',
+        'B3+D4+F4+A4b': 'diminished 7',
+        'C4+E4+G4+B4b+D5': 'dominant 9',
+        'C4+E4+G4+D5': 'add9',
+    }
+    for chord_string, quality in expected.items():
+        assert Chord.from_string(chord_string).identify().quality == quality
+
+def test_identify_prefers_bass_root():
+    assert str(Chord.from_string('C4+E4+G4+A4').identify().root) == 'C4'
+    assert str(Chord.from_string('A3+C4+E4+G4').identify().root) == 'A3'
+
+def test_identify_symmetric_chord_uses_bass():
+    name = Chord.from_string('E4+G4#+C5').identify()
+    assert (str(name.root) == 'E4') and (name.quality == 'augmented') and (name.inversion == 0)
+
+def test_identify_seventh_inversion():
+    assert Chord.from_string('F3+G3+B3+D4').identify().inversion == 3
+
+def test_identify_unknown():
+    assert Chord.from_string('C4+C4#+D4').identify() is None
+
+def test_identify_single_note():
+    assert Chord.from_string('C4').identify() is None
+
+def test_identify_built_chords():
+    for chord_number in ('I', 'II', 'III', 'IV', 'V', 'VI', 'VII'):
+        name = Chord.build_chord(Note.from_note_string('C4'), chord_number, 'major').identify()
+        assert (name.inversion == 0) and (name.quality in ('major', 'minor', 'diminished'))
+
+# Test building progressions
+def test_build_progression():
+    chords = Chord.build_progression(Note.from_note_string('C4'), 'I IV V I', 'major')
+    assert [str(c) for c in chords] == ['C4+E4+G4', 'F4+A4+C5', 'G4+B4+D5', 'C4+E4+G4']
+
+def test_build_progression_matches_build_chord():
+    tonic = Note.from_note_string('E4b')
+    chords = Chord.build_progression(tonic, 'I VI II V7 I', 'minor')
+    expected = [Chord.build_chord(tonic, number, 'minor') for number in ('I', 'VI', 'II', 'V7', 'I')]
+    assert [str(c) for c in chords] == [str(c) for c in expected]
+
+def test_build_progression_lower_case():
+    tonic = Note.from_note_string('C4')
+    assert [str(c) for c in Chord.build_progression(tonic, 'vi ii V7', 'major')] == \
+        [str(c) for c in Chord.build_progression(tonic, 'VI II V7', 'major')]
+
+def test_build_progression_list():
+    chords = Chord.build_progression(Note.from_note_string('G4'), ['I', 'v'], 'maj')
+    assert [str(c) for c in chords] == ['G4+B4+D5', 'D5+F5#+A5']
+
+def test_build_progression_extra_whitespace():
+    assert len(Chord.build_progression(Note.from_note_string('C4'), '  I\tIV\n V ', 'major')) == 3
+
+def test_build_progression_empty():
+    assert Chord.build_progression(Note.from_note_string('C4'), '', 'major') == []
+
+def test_build_progression_chords_independent():
+    chords = Chord.build_progression(Note.from_note_string('C4'), 'I I', 'major')
+    chords[0].add_note(Note.from_note_string('B4'))
+    assert str(chords[1]) == 'C4+E4+G4'
+
+def test_build_progression_unsupported_number():
+    with pytest.raises(ValueError):
+        Chord.build_progression(Note.from_note_string('C4'), 'I IV X I', 'major')
+
+def test_build_progression_unsupported_type():
+    with pytest.raises(ValueError):
+        Chord.build_progression(Note.from_note_string('C4'), 'I IV V I', 'dorian')
+
+def test_build_progression_invalid_tonic():
+    with pytest.raises(TypeError):
+        Chord.build_progression('C4', 'I IV V I', 'major')
+
+def test_build_progression_invalid_number_type():
+    with pytest.raises(TypeError):
+        Chord.build_progression(Note.from_note_string('C4'), ['I', 4], 'major')
+
+def test_build_progression_as_array():
+    np = pytest.importorskip('numpy')
+    midi_nums = Chord.build_progression(Note.from_note_string('C4'), 'I V7', 'major', as_array=True)
+    assert midi_nums.tolist() == [[60, 64, 67, -1], [67, 71, 74, 77]]
+
+def test_build_progression_as_array_empty():
+    np = pytest.importorskip('numpy')
+    assert Chord.build_progression(Note.from_note_string('C4'), '', 'major', as_array=True).shape == (0, 0)
+
+# Test voice leading
+def _movement(chords):
+    return sum(sum(abs(a.midi_note_number() - b.midi_note_number()) for a, b in zip(c1.notes, c2.notes))
+        for c1, c2 in zip(chords, chords[1:]))
+
+def test_voice_progression():
+    chords = Chord.build_progression(Note.from_note_string('C4'), 'I IV V7 I', 'major')
+    voiced = Chord.voice_progression(chords)
+    assert [str(c) for c in voiced] == ['C3+E3+G3+C4', 'C3+F3+A3+C4', 'D3+F3+G3+B3', 'C3+E3+G3+C4']
+
+def test_voice_progression_minimal_movement():
+    import itertools
+    chords = Chord.build_progression(Note.from_note_string('G4'), 'I VI II V', 'major')
+    voiced = Chord.voice_progression(chords, voices=3, lowest_midi_num=55, highest_midi_num=74, max_spread=12)
+    # compare to every combination of voicings
+    options = []
+    for c in chords:
+        pitch_classes = set(n.midi_note_number() % 12 for n in c.notes)
+        options.append([v for v in itertools.combinations(range(55, 75), 3)
+            if (v[-1] - v[0] <= 12) and (set(m % 12 for m in v) == pitch_classes)])
+    best = min(sum(sum(abs(a - b) for a, b in zip(v1, v2)) for v1, v2 in zip(p, p[1:])) for p in itertools.product(*options))
+    assert _movement(voiced) == best
+
+def test_voice_progression_covers_pitch_classes():
+    chords = Chord.build_progression(Note.from_note_string('E4b'), 'I IV VI II7 V7 I', 'minor')
+    for c, v in zip(chords, Chord.voice_progression(chords, voices=5)):
+        assert len(v.notes) == 5
+        assert set(n.midi_note_number() % 12 for n in v.notes) == set(n.midi_note_number() % 12 for n in c.notes)
+
+def test_voice_progression_keeps_spelling():
+    chords = [Chord.from_string('D4b+F4+A4b'), Chord.from_string('C4#+E4#+G4#')]
+    voiced = Chord.voice_progression(chords)
+    assert (set(str(n)[0] for n in voiced[0].notes) == set('DFA')) and (set(str(n)[0] for n in voiced[1].notes) == set('CEG'))
+
+def test_voice_progression_range_and_spread():
+    chords = Chord.build_progression(Note.from_note_string('C4'), 'I vi IV V7', 'major')
+    for v in Chord.voice_progression(chords, voices=4, lowest_midi_num=60, highest_midi_num=84, max_spread=14):
+        midi_nums = [n.midi_note_number() for n in v.notes]
+        assert (min(midi_nums) >= 60) and (max(midi_nums) <= 84) and (max(midi_nums) - min(midi_nums) <= 14)
+        assert len(set(midi_nums)) == 4
+
+def test_voice_progression_common_tone_held():
+    voiced = Chord.voice_progression([Chord.from_string('C4+E4+G4'), Chord.from_string('C4+E4+A4')], voices=3)
+    assert _movement(voiced) == 2
+
+def test_voice_progression_long():
+    chords = Chord.build_progression(Note.from_note_string('C4'), ' '.join(['I vi ii V7'] * 25), 'major')
+    assert len(Chord.voice_progression(chords, voices=5)) == 100
+
+def test_voice_progression_empty():
+    assert Chord.voice_progression([]) == []
+
+def test_voice_progression_too_few_voices():
+    with pytest.raises(ValueError):
+        Chord.voice_progression([Chord.from_string('G4+B4+D5+F5')], voices=3)
+
+def test_voice_progression_impossible_range():
+    with pytest.raises(ValueError):
+        Chord.voice_progression([Chord.from_string('C4+E4+G4')], lowest_midi_num=60, highest_midi_num=64)
+
+def test_voice_progression_invalid_range():
+    with pytest.raises(ValueError):
+        Chord.voice_progression([Chord.from_string('C4+E4+G4')], lowest_midi_num=80, highest_midi_num=40)
+
+def test_voice_progression_non_chord():
+    with pytest.raises(TypeError):
+        Chord.voice_progression(['C4+E4+G4'])
+
+def test_voice_progression_bottom_of_range():
+    voiced = Chord.voice_progression([Chord.from_string('B3#+E4+G4#')], lowest_midi_num=0, highest_midi_num=12)
+    assert [str(n) for n in voiced[0].notes] == ['C-1', 'E-1', 'G-1#']
@@ -1,6 +1,7 @@
 import pytest
 
-from music_essentials import Interval
+from music_essentials import Interval, Note, Rest
+from music_essentials.interval import _INTERVALS, _INTERVALS_BY_STRING
 
 # Manual interval creation - correct values
 def test_manual_interval_creation_correct_interval_major():
@@ -113,4 +114,294 @@ def test_manual_interval_creation_incorrect_interval_combination():
 # Test __str__
 def test_simple_interval_string():
     i = Interval('M', 7)
-    assert i.__str__() == 'M7'
\ No newline at end of file
+    assert i.__str__() == 'M7'
+
+# Test trusted construction
+def test_trusted_interval():
+    i = Interval._from_trusted('m', 10)
+    assert (i.interval_type == 'm') and (i.size == 10)
+
+# Test interning and immutability
+def test_interval_string_interned():
+    assert Interval.from_interval_string('M3') is Interval.from_interval_string('M3')
+
+def test_interval_string_interned_compound():
+    assert Interval.from_interval_string('P15') is Interval.from_interval_string('P15')
+
+def test_interval_string_interned_two_octaves():
+    i = Interval.from_interval_string('-m21')
+    assert (i is Interval.from_interval_string('-m21')) and (i.size == 21)
+
+def test_interval_string_large_not_interned():
+    i = Interval.from_interval_string('m101')
+    assert (i == Interval.from_interval_string('m101')) and (i.size == 101) and (i.semitones() == 171)
+    assert ('m101' not in _INTERVALS_BY_STRING) and (('m', 101, False) not in _INTERVALS)
+
+def test_interval_string_leading_zero():
+    i = Interval.from_interval_string('P08')
+    assert (i.interval_type == 'P') and (i.size == 8)
+
+def test_interval_immutable():
+    i = Interval.from_interval_string('M3')
+    with pytest.raises(AttributeError):
+        i.size = 4
+
+def test_interval_no_dict():
+    assert not hasattr(Interval('M', 3), '__dict__')
+
+def test_interval_pickle():
+    import pickle
+    i = pickle.loads(pickle.dumps(Interval('aug', 11)))
+    assert (i.interval_type == 'aug') and (i.size == 11)
+
+# Test calculating the interval between two notes
+def test_between_simple():
+    i = Interval.between(Note.from_note_string('C4'), Note.from_note_string('E4b'))
+    assert str(i) == 'm3'
+
+def test_between_reversed_order():
+    i = Interval.between(Note.from_note_string('E4b'), Note.from_note_string('C4'))
+    assert str(i) == 'm3'
+
+def test_between_compound():
+    i = Interval.between(Note.from_note_string('C4'), Note.from_note_string('A5#'))
+    assert str(i) == 'aug13'
+
+def test_between_octave():
+    i = Interval.between(Note.from_note_string('D3'), Note.from_note_string('D4'))
+    assert str(i) == 'P8'
+
+def test_between_unison():
+    i = Interval.between(Note.from_note_string('D3'), Note.from_note_string('D3'))
+    assert str(i) == 'P1'
+
+def test_between_enharmonic_spelling():
+    i = Interval.between(Note.from_note_string('B3#'), Note.from_note_string('C4'))
+    assert str(i) == 'dim2'
+
+def test_between_interned():
+    i = Interval.between(Note.from_note_string('C4'), Note.from_note_string('G4'))
+    assert i is Interval.from_interval_string('P5')
+
+def test_between_inverse_of_addition():
+    notes = [Note.from_note_string(s) for s in ('C4', 'B3#', 'D4bb', 'F2#', 'A5b', 'E1', 'G0')]
+    for n in notes:
+        for interval_string in Interval.VALID_INTERVAL_TYPES + ('P8', 'M10', 'dim12', 'aug15', 'm21'):
+            i = Interval.from_interval_string(interval_string)
+            try:
+                upper = n + i
+            except RuntimeError:
+                continue
+            assert Interval.between(n, upper) is i
+
+def test_between_unnamed_interval():
+    with pytest.raises(ValueError):
+        Interval.between(Note.from_note_string('B3#'), Note.from_note_string('C4b'))
+
+def test_between_rest():
+    with pytest.raises(TypeError):
+        Interval.between(Note.from_note_string('C4'), Rest())
+
+def test_between_non_note():
+    with pytest.raises(TypeError):
+        Interval.between(Note.from_note_string('C4'), 'E4')
+
+def test_note_subtraction():
+    assert str(Note.from_note_string('G4') - Note.from_note_string('C4')) == 'P5'
+
+def test_note_subtraction_descending():
+    assert str(Note.from_note_string('C4') - Note.from_note_string('G4')) == '-P5'
+
+def test_between_signed():
+    assert str(Interval.between(Note.from_note_string('G5'), Note.from_note_string('C4'), signed=True)) == '-P12'
+
+def test_between_signed_ascending():
+    assert str(Interval.between(Note.from_note_string('C4'), Note.from_note_string('G5'), signed=True)) == 'P12'
+
+def test_note_subtraction_invalid_type():
+    with pytest.raises(TypeError):
+        Note.from_note_string('G4') - 7
+
+# Test semitones
+def test_semitones_simple():
+    assert Interval.from_interval_string('m3').semitones() == 3
+
+def test_semitones_compound():
+    assert Interval.from_interval_string('P12').semitones() == 19
+
+def test_semitones_diminished_unison():
+    assert Interval.from_interval_string('dim1').semitones() == -1
+
+def test_semitones_manual_creation():
+    assert Interval('aug', 4).semitones() == 6
+
+def test_semitones_match_note_addition():
+    n = Note.from_note_string('C2')
+    for interval_string in Interval.VALID_INTERVAL_TYPES + ('P8', 'M10', 'dim12', 'aug15', 'm21'):
+        i = Interval.from_interval_string(interval_string)
+        assert (n + i).midi_note_number() - n.midi_note_number() == i.semitones()
+
+# Test interval arithmetic
+def test_interval_addition():
+    assert Interval.from_interval_string('M3') + Interval.from_interval_string('m3') == Interval.from_interval_string('P5')
+
+def test_interval_addition_compound():
+    assert str(Interval.from_interval_string('P5') + Interval.from_interval_string('P5')) == 'M9'
+
+def test_interval_addition_matches_notes():
+    n = Note.from_note_string('D3')
+    for s1 in ('m2', 'M3', 'P4', 'aug4', 'm6', 'M7', 'P8'):
+        for s2 in ('m2', 'M2', 'm3', 'P5', 'M6'):
+            i1 = Interval.from_interval_string(s1)
+            i2 = Interval.from_interval_string(s2)
+            assert n + (i1 + i2) == (n + i1) + i2
+
+def test_interval_addition_unnamed():
+    with pytest.raises(ValueError):
+        Interval.from_interval_string('aug2') + Interval.from_interval_string('aug2')
+
+def test_interval_addition_invalid_type():
+    with pytest.raises(TypeError):
+        Interval.from_interval_string('M3') + 3
+
+def test_interval_subtraction():
+    assert str(Interval.from_interval_string('P5') - Interval.from_interval_string('M3')) == 'm3'
+
+def test_interval_subtraction_to_unison():
+    assert str(Interval.from_interval_string('M3') - Interval.from_interval_string('M3')) == 'P1'
+
+def test_interval_subtraction_negative():
+    assert str(Interval.from_interval_string('M3') - Interval.from_interval_string('P5')) == '-m3'
+
+# Test inversion and simple/compound conversion
+def test_inversion_major():
+    assert str(Interval.from_interval_string('M3').inversion()) == 'm6'
+
+def test_inversion_augmented():
+    assert str(Interval.from_interval_string('aug4').inversion()) == 'dim5'
+
+def test_inversion_octave():
+    assert str(Interval.from_interval_string('P8').inversion()) == 'P1'
+
+def test_inversion_unison():
+    assert str(Interval.from_interval_string('P1').inversion()) == 'P8'
+
+def test_inversion_compound():
+    assert str(Interval.from_interval_string('M10').inversion()) == 'm6'
+
+def test_inversion_sums_to_octave():
+    for interval_string in Interval.VALID_INTERVAL_TYPES:
+        i = Interval.from_interval_string(interval_string)
+        assert str(i + i.inversion()) == 'P8'
+
+def test_simple():
+    assert str(Interval.from_interval_string('M10').simple()) == 'M3'
+
+def test_simple_already_simple():
+    assert str(Interval.from_interval_string('P8').simple()) == 'P8'
+
+def test_simple_double_octave():
+    assert str(Interval.from_interval_string('P15').simple()) == 'P8'
+
+def test_compound():
+    assert str(Interval.from_interval_string('m3').compound(2)) == 'm17'
+
+def test_compound_negative():
+    with pytest.raises(ValueError):
+        Interval.from_interval_string('m3').compound(-1)
+
+def test_is_compound():
+    assert Interval.from_interval_string('M9').is_compound() and not Interval.from_interval_string('P8').is_compound()
+
+# Test comparison and hashing
+def test_interval_equality_manual_creation():
+    assert Interval('M', 3) == Interval.from_interval_string('M3')
+
+def test_interval_equality_enharmonic():
+    assert Interval('aug', 4) != Interval('dim', 5)
+
+def test_interval_equality_other_type():
+    assert not (Interval('M', 3) == 'M3')
+
+def test_interval_ordering():
+    intervals = [Interval.from_interval_string(s) for s in ('dim4', 'M3', 'P8', 'm3', 'aug3', 'M2')]
+    assert [str(i) for i in sorted(intervals)] == ['M2', 'm3', 'M3', 'aug3', 'dim4', 'P8']
+
+def test_interval_ordering_other_type():
+    with pytest.raises(TypeError):
+        Interval('M', 3) < 4
+
+def test_interval_hash():
+    assert len(set([Interval('M', 3), Interval.from_interval_string('M3'), Interval('m', 3)])) == 2
+
+# Test descending intervals
+def test_descending_manual_creation():
+    i = Interval('M', 3, descending=True)
+    assert (i.interval_type == 'M') and (i.size == 3) and i.descending
+
+def test_descending_from_string():
+    i = Interval.from_interval_string('-dim13')
+    assert (i.interval_type == 'dim') and (i.size == 13) and i.descending
+
+def test_descending_from_string_interned():
+    assert Interval.from_interval_string('-M3') is Interval.from_interval_string('-M3')
+
+def test_descending_from_string_invalid_size():
+    with pytest.raises(ValueError):
+        Interval.from_interval_string('-M4')
+
+def test_descending_from_string_double_sign():
+    with pytest.raises(ValueError):
+        Interval.from_interval_string('--M3')
+
+def test_descending_from_string_negative_size():
+    with pytest.raises(ValueError):
+        Interval.from_interval_string('m-1')
+
+def test_descending_str():
+    assert str(Interval('P', 5, descending=True)) == '-P5'
+
+def test_descending_semitones():
+    assert Interval.from_interval_string('-M10').semitones() == -16
+
+def test_negation():
+    assert -Interval.from_interval_string('M3') is Interval.from_interval_string('-M3')
+
+def test_double_negation():
+    assert -(-Interval.from_interval_string('M3')) is Interval.from_interval_string('M3')
+
+def test_abs():
+    assert abs(Interval.from_interval_string('-aug4')) is Interval.from_interval_string('aug4')
+
+def test_descending_equality():
+    assert Interval('M', 3, descending=True) != Interval('M', 3)
+
+def test_descending_unison_equality():
+    assert Interval('P', 1, descending=True) != Interval('P', 1)
+
+def test_descending_ordering():
+    intervals = [Interval.from_interval_string(s) for s in ('M3', '-M3', 'P1', '-P5')]
+    assert [str(i) for i in sorted(intervals)] == ['-P5', '-M3', 'P1', 'M3']
+
+def test_descending_addition():
+    assert str(Interval.from_interval_string('-P5') + Interval.from_interval_string('M3')) == '-m3'
+
+def test_descending_addition_both():
+    assert str(Interval.from_interval_string('-P5') + Interval.from_interval_string('-M3')) == '-M7'
+
+def test_descending_subtraction():
+    assert str(Interval.from_interval_string('M3') - Interval.from_interval_string('-P5')) == 'M7'
+
+def test_descending_inversion():
+    assert str(Interval.from_interval_string('-M3').inversion()) == '-m6'
+
+def test_descending_simple():
+    assert str(Interval.from_interval_string('-M10').simple()) == '-M3'
+
+def test_descending_compound():
+    assert str(Interval.from_interval_string('-m3').compound()) == '-m10'
+
+def test_descending_pickle():
+    import pickle
+    i = Interval.from_interval_string('-M3')
+    assert pickle.loads(pickle.dumps(i)) == i
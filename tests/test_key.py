@@ -0,0 +1,229 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from music_essentials import Note, Rest, Scale, NoteArray, Key, KeyTracker
+
+def _notes(*note_strings):
+    return [Note.from_note_string(s) for s in note_strings]
+
+# Test key creation
+def test_key_creation():
+    k = Key(Note('E', 4, 'b'), 'minor')
+    assert (str(k.tonic) == 'E4b') and (k.scale_type == 'minor') and (k.correlation is None)
+
+def test_key_invalid_type():
+    with pytest.raises(ValueError):
+        Key(Note('C', 4), 'dorian')
+
+def test_key_invalid_tonic():
+    with pytest.raises(TypeError):
+        Key('C4', 'major')
+
+def test_key_rest_tonic():
+    with pytest.raises(TypeError):
+        Key(Rest(), 'major')
+
+def test_key_str():
+    assert str(Key(Note('F', 4, '#'), 'major')) == 'F# major'
+
+def test_key_equality_ignores_correlation():
+    assert Key(Note('C', 4), 'major', 0.5) == Key(Note('C', 4), 'major')
+
+def test_key_hash():
+    assert len(set([Key(Note('C', 4), 'major'), Key(Note('C', 4), 'major', 0.9), Key(Note('C', 4), 'minor')])) == 2
+
+def test_key_immutable():
+    with pytest.raises(AttributeError):
+        Key(Note('C', 4), 'major').scale_type = 'minor'
+
+def test_key_scale():
+    assert Key(Note('A', 4), 'minor').scale() == Scale(Note('A', 4), 'minor')
+
+# Test key detection
+def test_detect_c_major():
+    k = Key.detect(_notes('C4', 'E4', 'G4', 'C5', 'D4', 'F4', 'B3', 'C4'))
+    assert str(k) == 'C major'
+
+def test_detect_correlation():
+    k = Key.detect(_notes('C4', 'E4', 'G4', 'C5', 'D4', 'F4', 'B3', 'C4'))
+    assert 0.8 < k.correlation <= 1
+
+def test_detect_tonic_interned():
+    k = Key.detect(_notes('C4', 'E4', 'G4', 'C5', 'D4', 'F4', 'B3', 'C4'))
+    assert k.tonic is Note.from_note_string('C4')
+
+def test_detect_every_major_scale():
+    for pitch_class in range(12):
+        notes = Note.from_midi_nums([60 + pitch_class + i for i in (0, 2, 4, 5, 7, 9, 11, 12, 0, 7, 4)])
+        k = Key.detect(notes)
+        assert (k.scale_type == 'major') and (k.tonic.midi_note_number() % 12 == pitch_class)
+
+def test_detect_minor_with_durations():
+    notes = Scale(Note('A', 4), 'natural minor').notes
+    k = Key.detect(notes, durations=[4, 1, 1, 1, 2, 1, 1, 1])
+    assert str(k) == 'A minor'
+
+def test_detect_flat_key_spelling():
+    notes = Note.from_midi_nums([63, 65, 67, 68, 70, 72, 74, 75, 63, 70])
+    assert str(Key.detect(notes)) == 'Eb major'
+
+def test_detect_ignores_rests():
+    notes = _notes('C4', 'E4', 'G4', 'C5', 'D4', 'F4', 'B3', 'C4')
+    assert Key.detect(notes + [Rest()] * 20) == Key.detect(notes)
+
+def test_detect_durations_weight():
+    notes = _notes('C4', 'E4', 'G4', 'A4')
+    assert Key.detect(notes, durations=[1, 0, 1, 8]).scale_type == 'minor'
+
+def test_detect_note_array_matches_list():
+    a = Note.random_notes(5000, 48, 72, method='gauss', chance_for_rest=0.1, generator=5, as_array=True)
+    durations = np.random.default_rng(5).random(5000)
+    assert Key.rank(a, durations) == Key.rank(a.to_notes(), durations)
+
+def test_detect_generator_matches_list():
+    notes = Note.random_notes(200000, 48, 72, method='gauss', generator=9)
+    durations = np.random.default_rng(9).random(len(notes))
+    from_generator = Key.rank((n for n in notes), (d for d in durations))
+    assert [k.correlation for k in from_generator] == pytest.approx([k.correlation for k in Key.rank(notes, durations)])
+
+def test_detect_empty():
+    assert Key.detect([]) is None
+
+def test_detect_only_rests():
+    assert Key.detect([Rest(), Rest()]) is None
+
+def test_detect_uniform_histogram():
+    assert Key.detect(Scale(Note('C', 4), 'chromatic').notes[:-1]) is None
+
+def test_detect_non_note():
+    with pytest.raises(TypeError):
+        Key.detect(['C4', 'E4'])
+
+def test_detect_too_few_durations():
+    with pytest.raises(ValueError):
+        Key.detect(_notes('C4', 'E4'), durations=[1])
+
+def test_detect_too_many_durations():
+    with pytest.raises(ValueError):
+        Key.detect(_notes('C4', 'E4'), durations=iter([1, 2, 3]))
+
+def test_detect_negative_duration():
+    with pytest.raises(ValueError):
+        Key.detect(_notes('C4', 'E4'), durations=[1, -1])
+
+def test_detect_note_array_wrong_durations():
+    with pytest.raises(ValueError):
+        Key.detect(NoteArray.from_notes(_notes('C4', 'E4')), durations=[1, 2, 3])
+
+# Test key ranking
+def test_rank_all_keys():
+    ranked = Key.rank(_notes('C4', 'E4', 'G4'))
+    assert (len(ranked) == 24) and (len(set(ranked)) == 24)
+
+def test_rank_ordered():
+    correlations = [k.correlation for k in Key.rank(_notes('C4', 'E4', 'G4', 'A4', 'F4'))]
+    assert correlations == sorted(correlations, reverse=True)
+
+def test_rank_first_is_detected():
+    notes = _notes('D4', 'F4#', 'A4', 'D5', 'C5#', 'E4')
+    assert Key.rank(notes)[0] == Key.detect(notes)
+
+def test_rank_empty():
+    assert Key.rank([]) == []
+
+# Test streaming key tracking
+def _scale_notes(tonic, scale_type, repeats=4):
+    return list(Scale(tonic, scale_type).notes) * repeats
+
+def test_tracker_update():
+    tracker = KeyTracker()
+    for n in _notes('C4', 'E4', 'G4', 'F4', 'D4', 'B3'):
+        k = tracker.update(n)
+    assert (str(k) == 'C major') and (tracker.key() == k)
+
+def test_tracker_matches_detect():
+    notes = Note.random_notes(500, 48, 72, method='gauss', generator=3)
+    tracker = KeyTracker()
+    for n in notes:
+        tracker.update(n)
+    assert tracker.key() == Key.detect(notes)
+    assert tracker.key().correlation == pytest.approx(Key.detect(notes).correlation)
+
+def test_tracker_extend_matches_update():
+    notes = Note.random_notes(300, 48, 72, method='gauss', chance_for_rest=0.1, generator=4)
+    durations = np.random.default_rng(4).random(300)
+    for kwargs in ({}, {'window': 50}, {'decay': 0.9}):
+        one_at_a_time = KeyTracker(**kwargs)
+        for n, d in zip(notes, durations):
+            one_at_a_time.update(n, d)
+        in_bulk = KeyTracker(**kwargs)
+        in_bulk.extend(notes[:120], durations[:120])
+        in_bulk.extend(NoteArray.from_notes(notes[120:]), durations[120:])
+        assert in_bulk.histogram() == pytest.approx(one_at_a_time.histogram())
+
+def test_tracker_window_follows_modulation():
+    tracker = KeyTracker(window=16)
+    tracker.extend(_scale_notes(Note('C', 4), 'major'))
+    assert str(tracker.extend(_scale_notes(Note('E', 4, 'b'), 'major'))) == 'Eb major'
+
+def test_tracker_window_forgets():
+    tracker = KeyTracker(window=3)
+    tracker.extend(_notes('C4', 'C4', 'C4', 'E4', 'G4', 'B4'))
+    assert list(tracker.histogram()) == [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1]
+
+def test_tracker_window_long_stream():
+    tracker = KeyTracker(window=5)
+    notes = Note.random_notes(1000, generator=8, chance_for_rest=0)
+    tracker.extend(notes, np.random.default_rng(8).random(1000))
+    assert tracker.histogram().sum() == pytest.approx(sum(np.random.default_rng(8).random(1000)[-5:]))
+
+def test_tracker_decay_follows_modulation():
+    tracker = KeyTracker(decay=0.8)
+    tracker.extend(_scale_notes(Note('C', 4), 'major'))
+    assert str(tracker.extend(_scale_notes(Note('A', 4), 'major', 2))) == 'A major'
+
+def test_tracker_decay_weights():
+    tracker = KeyTracker(decay=0.5)
+    tracker.update(Note('C', 4))
+    tracker.update(Note('D', 4))
+    assert list(tracker.histogram()[:3]) == [0.5, 0, 1]
+
+def test_tracker_ignores_rests():
+    tracker = KeyTracker(window=2)
+    tracker.extend(_notes('C4', 'E4'))
+    tracker.update(Rest())
+    assert tracker.histogram().sum() == 2
+
+def test_tracker_no_notes():
+    assert KeyTracker().key() is None
+
+def test_tracker_reset():
+    tracker = KeyTracker()
+    tracker.extend(_notes('C4', 'E4', 'G4'))
+    tracker.reset()
+    assert (tracker.key() is None) and (tracker.histogram().sum() == 0)
+
+def test_tracker_window_and_decay():
+    with pytest.raises(ValueError):
+        KeyTracker(window=4, decay=0.5)
+
+def test_tracker_invalid_window():
+    with pytest.raises(ValueError):
+        KeyTracker(window=0)
+
+def test_tracker_invalid_window_type():
+    with pytest.raises(TypeError):
+        KeyTracker(window=2.5)
+
+def test_tracker_invalid_decay():
+    with pytest.raises(ValueError):
+        KeyTracker(decay=1)
+
+def test_tracker_update_non_note():
+    with pytest.raises(TypeError):
+        KeyTracker().update('C4')
+
+def test_tracker_update_negative_duration():
+    with pytest.raises(ValueError):
+        KeyTracker().update(Note('C', 4), -1)
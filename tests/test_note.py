@@ -2,6 +2,8 @@ import pytest
 
 from music_essentials import Note
 from music_essentials import Rest
+from music_essentials import Interval
+from music_essentials import NoteParseError
 
 # Manual note creation - correct values
 def test_manual_note_creation_correct_pitch_uppercase():
@@ -1095,4 +1097,169 @@ def test_greater_than_or_equal_to_rest():
     n1 = Note.from_midi_num(44)
     n2 = Rest()
     with pytest.raises(TypeError):
-        n1 >= n2
\ No newline at end of file
+        n1 >= n2
+
+def test_rest_equality():
+    assert Rest() == Rest()
+    assert not (Rest() != Rest())
+
+def test_rest_set():
+    assert len(set([Rest(), Rest()])) == 1
+    assert len(set(Note.parse_many(['C4', 'r']) + [Rest()])) == 2
+
+def test_rest_equality_note():
+    with pytest.raises(TypeError):
+        Rest() == Note.from_midi_num(44)
+
+# Test interning of notes created through the factory methods
+def test_note_string_interned():
+    assert Note.from_note_string('C4#') is Note.from_note_string('C4#')
+
+def test_note_string_interned_case_insensitive():
+    assert Note.from_note_string('c4B') is Note.from_note_string('C4b')
+
+def test_midi_num_interned():
+    assert Note.from_midi_num(61) is Note.from_note_string('C4#')
+
+def test_addition_interned():
+    n = Note.from_note_string('C4') + Interval.from_interval_string('M3')
+    assert n is Note.from_note_string('E4')
+
+def test_rest_string_interned():
+    assert Note.from_note_string('r') is Note.from_note_string('r')
+
+def test_manual_note_creation_not_interned():
+    assert Note('C', 4) == Note.from_note_string('C4')
+
+# Test immutability and hashing
+def test_note_immutable_pitch():
+    n = Note('C', 4)
+    with pytest.raises(AttributeError):
+        n.pitch = 'D'
+
+def test_note_immutable_new_attribute():
+    n = Note('C', 4)
+    with pytest.raises(AttributeError):
+        n.duration = 4
+
+def test_note_no_dict():
+    n = Note('C', 4)
+    assert not hasattr(n, '__dict__')
+
+def test_note_hash_equal_notes():
+    assert hash(Note('C', 4, '#')) == hash(Note.from_note_string('C4#'))
+
+def test_note_set_dedup():
+    notes = set([Note('C', 4), Note.from_note_string('C4'), Note('E', 4)])
+    assert len(notes) == 2
+
+def test_note_dict_with_int_keys():
+    n = Note.from_note_string('C4')
+    table = {n.sort_key(): 'key', None: 'none', n: 'note'}
+    assert (table.get(n) == 'note') and (table[n.sort_key()] == 'key') and (table.get(Rest()) is None)
+
+def test_note_set_enharmonics_distinct():
+    notes = set([Note('C', 4, '#'), Note('D', 4, 'b')])
+    assert len(notes) == 2
+
+def test_note_dict_key():
+    d = {Note('G', 3): 'g'}
+    assert d[Note.from_note_string('G3')] == 'g'
+
+def test_note_pickle():
+    import pickle
+    n = Note('B', 2, 'b')
+    assert pickle.loads(pickle.dumps(n)) == n
+
+def test_rest_pickle():
+    import pickle
+    assert pickle.loads(pickle.dumps(Rest())).is_rest
+
+def test_note_is_rest():
+    assert not Note('C', 4).is_rest
+
+def test_rest_is_rest():
+    assert Rest().is_rest
+
+# Test bulk note string parsing
+def test_parse_many():
+    notes = Note.parse_many(['C4', 'e5b', 'C-1', 'A4##'])
+    assert [str(n) for n in notes] == ['C4', 'E5b', 'C-1', 'A4##']
+
+def test_parse_many_rest():
+    notes = Note.parse_many(['C4', 'r'])
+    assert notes[1].is_rest
+
+def test_parse_many_generator():
+    notes = Note.parse_many(s for s in ['D4', 'F4#'])
+    assert [str(n) for n in notes] == ['D4', 'F4#']
+
+def test_parse_many_interned():
+    assert Note.parse_many(['G2'])[0] is Note.from_note_string('G2')
+
+def test_parse_many_empty():
+    assert Note.parse_many([]) == []
+
+def test_parse_many_invalid_is_value_error():
+    with pytest.raises(ValueError):
+        Note.parse_many(['C4', 'x6'])
+
+def test_parse_many_reports_all_invalid():
+    with pytest.raises(NoteParseError) as e:
+        Note.parse_many(['C4', 'x6', 'D4', 'C#', 'A9', '', 4])
+    assert [err[0] for err in e.value.errors] == [1, 3, 4, 5, 6]
+
+# Test sort keys and bulk sorting
+def test_sort_key_matches_comparisons():
+    notes = list(Note.parse_many(['C4', 'B3#', 'D4bb', 'C4#', 'D4b', 'B3', 'C-1', 'G9', 'E4#', 'F4']))
+    for n1 in notes:
+        for n2 in notes:
+            assert (n1 < n2) == (n1.sort_key() < n2.sort_key())
+            assert (n1 == n2) == (n1.sort_key() == n2.sort_key())
+
+def test_sort_key_unique():
+    from music_essentials.note import _NOTE_TABLE
+    keys = [n.sort_key() for n in _NOTE_TABLE.values()]
+    assert len(set(keys)) == len(keys)
+
+def test_sort_key_range():
+    assert (Note.from_note_string('C-1').sort_key() >= 0) and (Note.from_note_string('G9').sort_key() <= 32767)
+
+def test_sort_key_rest():
+    with pytest.raises(TypeError):
+        Rest().sort_key()
+
+def test_sort_notes():
+    notes = Note.parse_many(['G4', 'C4', 'B3#', 'C4', 'D4bb', 'A0'])
+    assert Note.sort_notes(notes) == sorted(notes)
+
+def test_sort_notes_reverse():
+    notes = Note.parse_many(['G4', 'C4', 'B3#', 'C4', 'D4bb', 'A0'])
+    assert Note.sort_notes(notes, reverse=True) == sorted(notes, reverse=True)
+
+def test_sort_notes_duplicates_kept():
+    notes = Note.parse_many(['E4', 'E4', 'C4'])
+    assert len(Note.sort_notes(notes)) == 3
+
+def test_sort_notes_generator():
+    assert Note.sort_notes(Note.from_midi_num(m) for m in (64, 60)) == [Note.from_midi_num(60), Note.from_midi_num(64)]
+
+def test_sort_notes_empty():
+    assert Note.sort_notes([]) == []
+
+def test_sort_notes_rest():
+    with pytest.raises(TypeError):
+        Note.sort_notes([Note('C', 4), Rest()])
+
+def test_sort_notes_invalid_type():
+    with pytest.raises(TypeError):
+        Note.sort_notes([Note('C', 4), 4])
+
+# Test trusted construction
+def test_trusted_note_matches_validated():
+    n = Note._from_trusted('E', 3, 'b')
+    assert (n == Note('E', 3, 'b')) and (n.midi_note_number() == 51) and (hash(n) == hash(Note('E', 3, 'b')))
+
+def test_trusted_note_immutable():
+    with pytest.raises(AttributeError):
+        Note._from_trusted('E', 3).octave = 4
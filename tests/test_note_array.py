@@ -0,0 +1,390 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from music_essentials import Note, Rest, Interval, Scale, NoteArray
+
+def _array(*note_strings):
+    return NoteArray.from_notes([Note.from_note_string(s) for s in note_strings])
+
+# Test conversion to and from notes
+def test_from_notes_length():
+    a = _array('C4', 'E4b', 'r', 'G4')
+    assert len(a) == 4
+
+def test_from_notes_columns():
+    a = _array('C4', 'E4b', 'A3##')
+    assert list(a.pitch_index) == [0, 2, 5]
+    assert list(a.octave) == [4, 4, 3]
+    assert list(a.accidental) == [0, -1, 2]
+
+def test_from_notes_rest_mask():
+    a = _array('C4', 'r', 'G4')
+    assert list(a.rest_mask) == [False, True, False]
+
+def test_to_notes_round_trip():
+    notes = [Note.from_note_string(s) for s in ('C-1', 'B3#', 'r', 'G9', 'F5bb')]
+    assert [str(n) for n in NoteArray.from_notes(notes).to_notes()] == [str(n) for n in notes]
+
+def test_to_notes_interned():
+    a = _array('D4#')
+    assert a.to_notes()[0] is Note.from_note_string('D4#')
+
+def test_from_notes_invalid_type():
+    with pytest.raises(TypeError):
+        NoteArray.from_notes(['C4'])
+
+def test_manual_creation_invalid_midi_num():
+    with pytest.raises(ValueError):
+        NoteArray([5], [9], [0])
+
+def test_manual_creation_invalid_accidental():
+    with pytest.raises(ValueError):
+        NoteArray([0], [4], [3])
+
+def test_manual_creation_invalid_octave():
+    with pytest.raises(ValueError):
+        NoteArray([6], [-2], [1])
+
+def test_manual_creation_invalid_octave_high():
+    with pytest.raises(ValueError):
+        NoteArray([0], [10], [-2])
+
+def test_manual_creation_octave_wraps_int8():
+    with pytest.raises(ValueError):
+        NoteArray(np.array([0]), np.array([260]), np.array([0]))
+
+def test_manual_creation_octave_overflows_int8():
+    with pytest.raises(ValueError):
+        NoteArray([0], [260], [0])
+
+def test_manual_creation_mismatched_lengths():
+    with pytest.raises(ValueError):
+        NoteArray([0, 1], [4], [0, 0])
+
+def test_str():
+    assert str(_array('C4', 'r', 'E4b')) == 'C4 r E4b'
+
+# Test indexing
+def test_getitem_int():
+    assert _array('C4', 'D4')[1] == Note.from_note_string('D4')
+
+def test_getitem_negative_int():
+    assert _array('C4', 'D4')[-1] == Note.from_note_string('D4')
+
+def test_getitem_rest():
+    assert _array('C4', 'r')[1].is_rest
+
+def test_getitem_out_of_range():
+    with pytest.raises(IndexError):
+        _array('C4')[1]
+
+def test_getitem_slice():
+    assert str(_array('C4', 'D4', 'E4')[1:]) == 'D4 E4'
+
+def test_getitem_mask():
+    a = _array('C4', 'D4', 'E4')
+    assert str(a[a.midi_note_number() > 60]) == 'D4 E4'
+
+# Test MIDI numbers
+def test_midi_note_number():
+    a = _array('C-1', 'C4', 'r', 'G9', 'B0b')
+    assert list(a.midi_note_number()) == [0, 60, -1, 127, 22]
+
+def test_midi_note_number_matches_notes():
+    notes = [Note.from_midi_num(m) for m in range(128)]
+    assert list(NoteArray.from_notes(notes).midi_note_number()) == list(range(128))
+
+# Test comparisons
+def test_equality_note():
+    a = _array('C4', 'B3#', 'r')
+    assert list(a == Note.from_note_string('C4')) == [True, False, False]
+
+def test_inequality_note():
+    a = _array('C4', 'B3#', 'r')
+    assert list(a != Note.from_note_string('C4')) == [False, True, False]
+
+def test_less_than_matches_notes():
+    notes = [Note.from_note_string(s) for s in ('C4', 'B3#', 'D4bb', 'C4#', 'B3')]
+    a = NoteArray.from_notes(notes)
+    for other in notes:
+        assert list(a < other) == [n < other for n in notes]
+        assert list(a > other) == [n > other for n in notes]
+        assert list(a <= other) == [n <= other for n in notes]
+        assert list(a >= other) == [n >= other for n in notes]
+
+def test_comparison_array():
+    a = _array('C4', 'E4', 'G4')
+    b = _array('D4', 'E4', 'F4')
+    assert list(a < b) == [True, False, False]
+
+def test_comparison_array_different_lengths():
+    with pytest.raises(ValueError):
+        _array('C4', 'E4') < _array('D4')
+
+def test_comparison_invalid_type():
+    with pytest.raises(TypeError):
+        _array('C4') < 60
+
+def test_is_enharmonic():
+    a = _array('C4#', 'D4b', 'D4', 'r')
+    assert list(a.is_enharmonic(Note.from_note_string('C4#'))) == [True, True, False, False]
+
+def test_is_enharmonic_rest():
+    a = _array('C4#')
+    assert list(a.is_enharmonic(Rest())) == [False]
+
+# Test transposition
+def test_transpose_simple():
+    a = _array('C4', 'E4', 'r', 'G4')
+    assert str(a + Interval.from_interval_string('m3')) == 'E4b G4 r B4b'
+
+def test_transpose_matches_notes():
+    notes = [Note.from_note_string(s) for s in ('C4', 'B3#', 'D4bb', 'F2#', 'A5b', 'E1')]
+    a = NoteArray.from_notes(notes)
+    for interval_string in Interval.VALID_INTERVAL_TYPES + ('P8', 'M10', 'dim12', 'aug15'):
+        i = Interval.from_interval_string(interval_string)
+        expected = []
+        for n in notes:
+            try:
+                expected.append(str(n + i))
+            except RuntimeError:
+                expected = None
+                break
+        if expected is not None:
+            assert [str(n) for n in a.transpose(i)] == expected
+
+def test_transpose_descending():
+    a = _array('C4', 'E4', 'r', 'G4')
+    assert str(a + Interval.from_interval_string('-m3')) == 'A3 C4# r E4'
+
+def test_transpose_descending_matches_notes():
+    notes = [Note.from_note_string(s) for s in ('C4', 'B3#', 'D4bb', 'F2#', 'A5b', 'E1')]
+    a = NoteArray.from_notes(notes)
+    for interval_string in Interval.VALID_INTERVAL_TYPES + ('P8', 'M10', 'dim12', 'aug15'):
+        i = Interval.from_interval_string('-' + interval_string)
+        expected = []
+        for n in notes:
+            try:
+                expected.append(str(n + i))
+            except RuntimeError:
+                expected = None
+                break
+        if expected is not None:
+            assert [str(n) for n in a.transpose(i)] == expected
+
+def test_transpose_descending_below_lowest_octave():
+    with pytest.raises(ValueError):
+        _array('G-1#') + Interval.from_interval_string('-m6')
+
+def test_transpose_large_compound_interval():
+    with pytest.raises(ValueError):
+        _array('C4', 'r') + Interval('P', 995)
+    with pytest.raises(ValueError):
+        _array('C4') + Interval.from_interval_string('-P995')
+
+def test_transpose_large_compound_interval_rests():
+    assert str(NoteArray.from_notes([Rest()]) + Interval('P', 995)) == 'r'
+
+def test_transpose_matches_notes_every_spelling():
+    from music_essentials.note import _NOTE_TABLE
+    from music_essentials.interval import _INTERVALS
+    notes = list(_NOTE_TABLE.values())
+    for i in list(_INTERVALS.values()):
+        valid, expected = [], []
+        for n in notes:
+            try:
+                expected.append(n + i)
+                valid.append(n)
+            except (ValueError, RuntimeError) as e:
+                with pytest.raises(type(e)):
+                    NoteArray.from_notes([n]).transpose(i)
+        assert NoteArray.from_notes(valid).transpose(i).to_notes() == expected
+
+def test_transpose_out_of_range():
+    with pytest.raises(ValueError):
+        _array('G9') + Interval.from_interval_string('M2')
+
+def test_transpose_too_many_accidentals():
+    with pytest.raises(RuntimeError):
+        _array('B4##') + Interval.from_interval_string('aug2')
+
+def test_transpose_invalid_type():
+    with pytest.raises(TypeError):
+        _array('C4') + 2
+
+# Test bulk parsing into an array
+def test_parse_many_as_array():
+    a = Note.parse_many(['C4', 'r', 'C-1', 'G9'], as_array=True)
+    assert list(a.midi_note_number()) == [60, -1, 0, 127]
+
+def test_parse_many_numpy_strings():
+    notes = Note.parse_many(np.array(['C4', 'E4b', 'r']))
+    assert [str(n) for n in notes] == ['C4', 'E4b', 'r']
+
+# Test batch creation from MIDI numbers
+def test_from_midi_nums_list():
+    notes = Note.from_midi_nums(np.arange(128))
+    assert notes == [Note.from_midi_num(m) for m in range(128)]
+
+def test_from_midi_nums_interned():
+    assert Note.from_midi_nums(np.array([61]))[0] is Note.from_midi_num(61)
+
+def test_from_midi_nums_buffer():
+    notes = Note.from_midi_nums(bytes([0, 60, 127]))
+    assert [str(n) for n in notes] == ['C-1', 'C4', 'G9']
+
+def test_from_midi_nums_array():
+    a = Note.from_midi_nums(np.array([60, 61, 62], dtype=np.uint8), as_array=True)
+    assert str(a) == 'C4 C4# D4'
+
+def test_from_midi_nums_empty():
+    assert Note.from_midi_nums(np.array([], dtype=np.int64)) == []
+
+def test_from_midi_nums_out_of_range():
+    with pytest.raises(ValueError):
+        Note.from_midi_nums(np.array([60, 128]))
+
+def test_from_midi_nums_negative():
+    with pytest.raises(ValueError):
+        Note.from_midi_nums([-1, 60])
+
+def test_from_midi_nums_float():
+    with pytest.raises(TypeError):
+        Note.from_midi_nums(np.array([60.0]))
+
+def test_from_midi_nums_spelling():
+    spelling = Scale.build_spelling(Note('F', 4), 'major')
+    notes = Note.from_midi_nums(np.array([58, 61, 65]), spelling=spelling)
+    assert [str(n) for n in notes] == ['B3b', 'D4b', 'F4']
+
+def test_from_midi_nums_spelling_octave_boundary():
+    spelling = Scale.build_spelling(Note('C', 4, '#'), 'major')
+    notes = Note.from_midi_nums(np.array([60, 0]), spelling=spelling)
+    assert [str(n) for n in notes] == ['B3#', 'C-1']
+
+def test_from_midi_nums_spelling_as_array():
+    spelling = Scale.build_spelling(Note('F', 4), 'major')
+    a = NoteArray.from_midi_nums(np.array([58, 70]), spelling=spelling)
+    assert str(a) == 'B3b B4b'
+
+def test_from_midi_nums_invalid_spelling():
+    with pytest.raises(ValueError):
+        Note.from_midi_nums(np.array([60]), spelling=[('C', None)] * 12)
+
+def test_from_midi_nums_spelling_cache_bounded():
+    from music_essentials.note import _SPELLED_NOTES_BY_MIDI_NUM
+    from music_essentials.note_array import _SPELLED_COLUMNS_BY_MIDI_NUM
+    sharps = [('C', None), ('C', '#'), ('D', None), ('D', '#'), ('E', None), ('F', None),
+        ('F', '#'), ('G', None), ('G', '#'), ('A', None), ('A', '#'), ('B', None)]
+    others = [('B', '#'), ('D', 'b'), ('C', '##'), ('E', 'b'), ('F', 'b'), ('E', '#'),
+        ('G', 'b'), ('F', '##'), ('A', 'b'), ('G', '##'), ('B', 'b'), ('C', 'b')]
+    for choice in range(100):
+        spelling = [others[pc] if (choice >> pc) & 1 else sharps[pc] for pc in range(12)]
+        Note.from_midi_nums(np.array([61]), spelling=spelling)
+        NoteArray.from_midi_nums(np.array([61]), spelling=spelling)
+    assert len(_SPELLED_NOTES_BY_MIDI_NUM) <= _SPELLED_NOTES_BY_MIDI_NUM.maxsize
+    assert len(_SPELLED_COLUMNS_BY_MIDI_NUM) <= _SPELLED_COLUMNS_BY_MIDI_NUM.maxsize
+
+def test_from_midi_num_numpy_integer():
+    assert Note.from_midi_num(np.int64(61)) is Note.from_midi_num(61)
+
+# Test vectorized random note generation
+def test_random_notes_count():
+    assert len(Note.random_notes(100, generator=0)) == 100
+
+def test_random_notes_range():
+    notes = Note.random_notes(1000, 60, 72, chance_for_rest=0, generator=0)
+    assert all(60 <= n.midi_note_number() <= 72 for n in notes)
+
+def test_random_notes_gauss_range():
+    notes = Note.random_notes(1000, 60, 72, method='gauss', chance_for_rest=0, generator=0)
+    assert all(60 <= n.midi_note_number() <= 72 for n in notes)
+
+def test_random_notes_gauss_centred():
+    a = Note.random_notes(10000, 0, 120, method='gauss', chance_for_rest=0, generator=0, as_array=True)
+    assert abs(a.midi_note_number().mean() - 60) < 1
+
+def test_random_notes_gauss_narrow_range():
+    notes = Note.random_notes(10, 60, 62, method='gauss', chance_for_rest=0, generator=0)
+    assert all(n.midi_note_number() == 61 for n in notes)
+
+def test_random_notes_all_rests():
+    notes = Note.random_notes(10, chance_for_rest=1, generator=0)
+    assert all(n.is_rest for n in notes)
+
+def test_random_notes_no_rests():
+    notes = Note.random_notes(1000, chance_for_rest=0, generator=0)
+    assert not any(n.is_rest for n in notes)
+
+def test_random_notes_seed_reproducible():
+    assert [str(n) for n in Note.random_notes(50, generator=7)] == [str(n) for n in Note.random_notes(50, generator=7)]
+
+def test_random_notes_generator():
+    notes = Note.random_notes(5, generator=np.random.default_rng(3))
+    assert [str(n) for n in notes] == [str(n) for n in Note.random_notes(5, generator=3)]
+
+def test_random_notes_as_array_matches_list():
+    a = Note.random_notes(200, chance_for_rest=0.2, generator=11, as_array=True)
+    notes = Note.random_notes(200, chance_for_rest=0.2, generator=11)
+    assert str(a) == ' '.join(str(n) for n in notes)
+
+def test_random_notes_invalid_method():
+    with pytest.raises(ValueError):
+        Note.random_notes(10, method='poisson')
+
+def test_random_notes_invalid_range():
+    with pytest.raises(ValueError):
+        Note.random_notes(10, 72, 60)
+
+# Test sort keys and sorting
+def test_sort_key_matches_notes():
+    notes = Note.parse_many(['C4', 'B3#', 'D4bb', 'G9', 'C-1'])
+    assert list(NoteArray.from_notes(notes).sort_key()) == [n.sort_key() for n in notes]
+
+def test_sort_key_rest():
+    assert list(_array('r').sort_key()) == [-1]
+
+def test_sorted():
+    notes = Note.parse_many(['G4', 'C4', 'B3#', 'C4', 'D4bb', 'A0'])
+    assert NoteArray.from_notes(notes).sorted().to_notes() == sorted(notes)
+
+def test_sorted_reverse():
+    notes = Note.parse_many(['G4', 'C4', 'B3#', 'D4bb', 'A0'])
+    assert NoteArray.from_notes(notes).sorted(reverse=True).to_notes() == sorted(notes, reverse=True)
+
+def test_sorted_rests_last():
+    assert str(_array('G4', 'r', 'C4').sorted()) == 'C4 G4 r'
+
+def test_argsort_stable():
+    assert list(_array('E4', 'C4', 'E4', 'C4').argsort()) == [1, 3, 0, 2]
+
+# Test interval profiles
+def test_interval_profile():
+    a = _array('C4', 'E4', 'G4', 'C4', 'C6')
+    assert [str(i) for i in a.interval_profile()] == ['M3', 'm3', 'P5', 'P15']
+
+def test_interval_profile_rests():
+    a = _array('C4', 'r', 'G4', 'A4')
+    assert [str(i) for i in a.interval_profile()] == ['None', 'None', 'M2']
+
+def test_interval_profile_matches_between():
+    notes = Note.parse_many(['C4', 'B3#', 'D4', 'F2#', 'A2', 'E4', 'G3', 'C4', 'C4b'])
+    expected = [Interval.between(n1, n2) for n1, n2 in zip(notes[:-1], notes[1:])]
+    assert NoteArray.from_notes(notes).interval_profile() == expected
+
+def test_interval_profile_signed():
+    a = _array('C4', 'E4', 'r', 'G4', 'C4', 'C3')
+    assert [str(i) for i in a.interval_profile(signed=True)] == ['M3', 'None', 'None', '-P5', '-P8']
+
+def test_interval_profile_signed_matches_subtraction():
+    notes = [Note.from_note_string(s) for s in ['C4', 'B3#', 'D4', 'F2#', 'A2', 'E4', 'G3', 'C4', 'C4b']]
+    expected = [b - a for a, b in zip(notes, notes[1:])]
+    assert NoteArray.from_notes(notes).interval_profile(signed=True) == expected
+
+def test_interval_profile_single_note():
+    assert _array('C4').interval_profile() == []
+
+def test_interval_profile_unnamed_interval():
+    with pytest.raises(ValueError):
+        _array('B3#', 'C4b').interval_profile()
@@ -1,6 +1,6 @@
 import pytest
 
-from music_essentials import Note, Interval
+from music_essentials import Note, Rest, Interval
 
 # Simple additions
 def test_valid_addition_simple_major_second():
@@ -82,6 +82,55 @@ def test_fifth_addition_over_octave():
     res = n + i
     assert (res.pitch == 'E') and (res.octave == 5) and (res.accidental is None)
 
+# Descending intervals
+def test_valid_addition_descending_major_third():
+    n = Note.from_note_string('C4')
+    i = Interval.from_interval_string('-M3')
+    res = n + i
+    assert (res.pitch == 'A') and (res.octave == 3) and (res.accidental == 'b')
+
+def test_valid_addition_descending_unison():
+    n = Note.from_note_string('C4')
+    i = Interval.from_interval_string('-aug1')
+    res = n + i
+    assert (res.pitch == 'C') and (res.octave == 4) and (res.accidental == 'b')
+
+def test_valid_addition_descending_compound():
+    n = Note.from_note_string('E4')
+    i = Interval.from_interval_string('-m10')
+    res = n + i
+    assert (res.pitch == 'C') and (res.octave == 3) and (res.accidental == '#')
+
+def test_valid_subtraction_interval():
+    n = Note.from_note_string('G4')
+    i = Interval.from_interval_string('P5')
+    res = n - i
+    assert (res.pitch == 'C') and (res.octave == 4) and (res.accidental == None)
+
+def test_valid_subtraction_descending_interval():
+    n = Note.from_note_string('G4')
+    i = Interval.from_interval_string('-P5')
+    res = n - i
+    assert (res.pitch == 'D') and (res.octave == 5) and (res.accidental == None)
+
+def test_subtraction_reverses_addition():
+    for note_string in ('C4', 'B3#', 'D4b', 'F2#', 'A5b', 'E1'):
+        n = Note.from_note_string(note_string)
+        for interval_string in ('M2', 'm3', 'P4', 'P5', 'm6', 'M10'):
+            i = Interval.from_interval_string(interval_string)
+            assert (n + i) - i == n
+            assert (n - i) + i == n
+
+def test_note_subtraction_out_of_range():
+    n = Note.from_note_string('C-1')
+    i = Interval.from_interval_string('m2')
+    with pytest.raises(ValueError):
+        n - i
+
+def test_rest_subtraction_rejection():
+    with pytest.raises(TypeError):
+        Rest() - Interval.from_interval_string('M2')
+
 # Invalid additions
 def test_note_int_add_rejection():
     n = Note.from_note_string('A4')
@@ -96,4 +145,34 @@ def test_note_float_add_rejection():
 def test_note_str_add_rejection():
     n = Note.from_note_string('A4')
     with pytest.raises(TypeError):
-        n + 'interval'
\ No newline at end of file
+        n + 'interval'
+
+def test_note_addition_out_of_range():
+    n = Note.from_note_string('G9')
+    i = Interval.from_interval_string('M2')
+    with pytest.raises(ValueError):
+        n + i
+
+def test_note_addition_compound_from_low_octave():
+    n = Note.from_note_string('E-1')
+    i = Interval.from_interval_string('M13')
+    res = n + i
+    assert (res.pitch == 'C') and (res.octave == 1) and (res.accidental == '#')
+
+def test_note_addition_lowest_note_unison():
+    n = Note.from_note_string('C-1#')
+    i = Interval.from_interval_string('dim1')
+    res = n + i
+    assert (res.pitch == 'C') and (res.octave == -1) and (res.accidental is None)
+
+def test_note_addition_too_many_accidentals():
+    n = Note.from_note_string('B4##')
+    i = Interval.from_interval_string('aug2')
+    with pytest.raises(RuntimeError):
+        n + i
+
+def test_rest_addition_rejection():
+    r = Rest()
+    i = Interval.from_interval_string('M2')
+    with pytest.raises(TypeError):
+        r + i
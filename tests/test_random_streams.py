@@ -0,0 +1,91 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from concurrent.futures import ProcessPoolExecutor
+
+from music_essentials import Note, RandomStreams
+
+def _generate_chunk(args):
+    seed, key = args
+    return [str(n) for n in Note.random_notes(500, generator=RandomStreams(seed).generator(key))]
+
+def _generate_chunk_scalar(args):
+    seed, key = args
+    rng = RandomStreams(seed).random_instance(key)
+    return [str(Note.random_note(random_instance=rng)) for i in range(100)]
+
+# Test stream creation
+def test_seed_stored():
+    assert RandomStreams(1234).seed == 1234
+
+def test_seed_generated():
+    assert RandomStreams().seed is not None
+
+def test_seed_invalid_type():
+    with pytest.raises(TypeError):
+        RandomStreams('seed')
+
+def test_child_spawn_key():
+    assert RandomStreams(1).child(3).child(4).spawn_key == (3, 4)
+
+def test_child_negative_key():
+    with pytest.raises(ValueError):
+        RandomStreams(1).child(-1)
+
+def test_children_count():
+    assert len(RandomStreams(1).children(4)) == 4
+
+# Test reproducibility and independence
+def test_generator_reproducible():
+    a = RandomStreams(42).generator(0).integers(0, 1000, size=20)
+    b = RandomStreams(42).generator(0).integers(0, 1000, size=20)
+    assert list(a) == list(b)
+
+def test_generator_order_independent():
+    streams = RandomStreams(42)
+    later = streams.generator(5).integers(0, 1000, size=20)
+    first = RandomStreams(42).children(6)[5].generator().integers(0, 1000, size=20)
+    assert list(later) == list(first)
+
+def test_generator_keys_independent():
+    streams = RandomStreams(42)
+    a = streams.generator(0).integers(0, 1000, size=20)
+    b = streams.generator(1).integers(0, 1000, size=20)
+    assert list(a) != list(b)
+
+def test_generator_seeds_independent():
+    a = RandomStreams(1).generator(0).integers(0, 1000, size=20)
+    b = RandomStreams(2).generator(0).integers(0, 1000, size=20)
+    assert list(a) != list(b)
+
+def test_random_instance_reproducible():
+    a = RandomStreams(42).random_instance(2)
+    b = RandomStreams(42).random_instance(2)
+    assert [a.random() for i in range(10)] == [b.random() for i in range(10)]
+
+def test_random_instance_keys_independent():
+    a = RandomStreams(42).random_instance(0)
+    b = RandomStreams(42).random_instance(1)
+    assert [a.random() for i in range(10)] != [b.random() for i in range(10)]
+
+def test_random_note_reproducible():
+    a = RandomStreams(9).random_instance(0)
+    b = RandomStreams(9).random_instance(0)
+    assert [str(Note.random_note(random_instance=a)) for i in range(50)] == [str(Note.random_note(random_instance=b)) for i in range(50)]
+
+def test_random_note_default_instance():
+    assert isinstance(Note.random_note(chance_for_rest=0), Note)
+
+# Test generation on a process pool matches sequential generation
+def test_process_pool_matches_sequential():
+    jobs = [(2024, key) for key in range(4)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = list(pool.map(_generate_chunk, jobs))
+    assert parallel == [_generate_chunk(job) for job in jobs]
+
+def test_process_pool_matches_sequential_scalar():
+    jobs = [(2024, key) for key in range(4)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = list(pool.map(_generate_chunk_scalar, jobs))
+    assert parallel == [_generate_chunk_scalar(job) for job in jobs]
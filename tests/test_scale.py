@@ -1,6 +1,6 @@
 import pytest
 
-from music_essentials import Note, Scale
+from music_essentials import Note, Rest, Scale
 
 def test_non_note_tonic_str():
     with pytest.raises(TypeError):
@@ -12,4 +12,290 @@ def test_non_note_tonic_int():
 
 def test_unsupported_scale_type():
     with pytest.raises(ValueError):
-        Scale.build_scale(Note('C', 4), 'scale')
\ No newline at end of file
+        Scale.build_scale(Note('C', 4), 'scale')
+
+def test_build_spelling_sharp_key():
+    spelling = Scale.build_spelling(Note('D', 4), 'major')
+    assert (spelling[6] == ('F', '#')) and (spelling[1] == ('C', '#')) and (spelling[3] == ('D', '#'))
+
+def test_build_spelling_flat_key():
+    spelling = Scale.build_spelling(Note('F', 4), 'major')
+    assert (spelling[10] == ('B', 'b')) and (spelling[1] == ('D', 'b'))
+
+def test_build_spelling_double_sharp():
+    spelling = Scale.build_spelling(Note('G', 4, '#'), 'minor')
+    assert spelling[7] == ('F', '##')
+
+# Test the build_scale cache
+def test_cache_disabled_by_default():
+    assert Scale.cache_info() is None
+    assert isinstance(Scale.build_scale(Note('C', 4), 'major'), list)
+
+def test_cache_returns_shared_tuple():
+    Scale.enable_cache()
+    try:
+        s = Scale.build_scale(Note('C', 4), 'major')
+        assert isinstance(s, tuple)
+        assert Scale.build_scale(Note('C', 4), 'major') is s
+    finally:
+        Scale.disable_cache()
+
+def test_cache_matches_uncached():
+    expected = [str(n) for n in Scale.build_scale(Note('E', 4, 'b'), 'minor')]
+    Scale.enable_cache()
+    try:
+        assert [str(n) for n in Scale.build_scale(Note('E', 4, 'b'), 'minor')] == expected
+        assert [str(n) for n in Scale.build_scale(Note('E', 4, 'b'), 'minor')] == expected
+    finally:
+        Scale.disable_cache()
+
+def test_cache_aliases_share_entry():
+    Scale.enable_cache()
+    try:
+        s = Scale.build_scale(Note('D', 4), 'major')
+        assert Scale.build_scale(Note('D', 4), 'maj') is s
+    finally:
+        Scale.disable_cache()
+
+def test_cache_keyed_on_spelling():
+    Scale.enable_cache()
+    try:
+        s1 = Scale.build_scale(Note('C', 4, '#'), 'major')
+        s2 = Scale.build_scale(Note('D', 4, 'b'), 'major')
+        assert str(s1[0]) == 'C4#' and str(s2[0]) == 'D4b'
+    finally:
+        Scale.disable_cache()
+
+def test_cache_info():
+    Scale.enable_cache(2)
+    try:
+        Scale.build_scale(Note('C', 4), 'major')
+        Scale.build_scale(Note('C', 4), 'major')
+        Scale.build_scale(Note('D', 4), 'major')
+        Scale.build_scale(Note('E', 4), 'major')
+        info = Scale.cache_info()
+        assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 3, 1, 2, 2)
+    finally:
+        Scale.disable_cache()
+
+def test_cache_evicts_least_recently_used():
+    Scale.enable_cache(2)
+    try:
+        c = Scale.build_scale(Note('C', 4), 'major')
+        Scale.build_scale(Note('D', 4), 'major')
+        Scale.build_scale(Note('C', 4), 'major')
+        Scale.build_scale(Note('E', 4), 'major')
+        assert Scale.build_scale(Note('C', 4), 'major') is c
+        assert Scale.cache_info().hits == 2
+    finally:
+        Scale.disable_cache()
+
+def test_cache_clear():
+    Scale.enable_cache()
+    try:
+        Scale.build_scale(Note('C', 4), 'major')
+        Scale.clear_cache()
+        assert Scale.cache_info() == (0, 0, 0, 128, 0)
+    finally:
+        Scale.disable_cache()
+
+def test_cache_invalid_scale_type():
+    Scale.enable_cache()
+    try:
+        with pytest.raises(ValueError):
+            Scale.build_scale(Note('C', 4), 'scale')
+    finally:
+        Scale.disable_cache()
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        Scale.enable_cache(0)
+
+def test_cache_invalid_size_type():
+    with pytest.raises(TypeError):
+        Scale.enable_cache('big')
+
+# Test scale objects
+def test_scale_object_notes():
+    s = Scale(Note('D', 4), 'major')
+    assert [str(n) for n in s] == ['D4', 'E4', 'F4#', 'G4', 'A4', 'B4', 'C5#', 'D5']
+
+def test_scale_object_mask():
+    assert Scale(Note('C', 4), 'major').mask == 0b101010110101
+
+def test_scale_object_contains():
+    s = Scale(Note('D', 4), 'major')
+    assert (Note('F', 2, '#') in s) and (Note('C', 4) not in s)
+
+def test_scale_object_contains_enharmonic():
+    assert Note('G', 5, 'b') in Scale(Note('D', 4), 'major')
+
+def test_scale_object_contains_rest():
+    assert Rest() not in Scale(Note('C', 4), 'chromatic')
+
+def test_scale_object_contains_non_note():
+    with pytest.raises(TypeError):
+        'C4' in Scale(Note('C', 4), 'major')
+
+def test_scale_object_degree():
+    s = Scale(Note('D', 4), 'major')
+    assert (s.degree(Note('D', 6)) == 1) and (s.degree(Note('A', 2)) == 5) and (s.degree(Note('C', 5, '#')) == 7)
+
+def test_scale_object_degree_not_in_scale():
+    assert Scale(Note('D', 4), 'major').degree(Note('C', 4)) is None
+
+def test_scale_object_degree_rest():
+    assert Scale(Note('D', 4), 'major').degree(Rest()) is None
+
+def test_scale_object_sequence():
+    s = Scale(Note('A', 4), 'minor pentatonic')
+    assert (len(s) == 6) and (str(s[0]) == 'A4') and (str(s[-1]) == 'A5')
+
+def test_scale_object_intersection():
+    c = Scale(Note('C', 4), 'major')
+    g = Scale(Note('G', 4), 'major')
+    assert (c & g) == (c.mask & ~(1 << 5))
+
+def test_scale_object_union():
+    c = Scale(Note('C', 4), 'major')
+    g = Scale(Note('G', 4), 'major')
+    assert (c | g) == (c.mask | (1 << 6))
+
+def test_scale_object_mask_operations():
+    c = Scale(Note('C', 4), 'major')
+    assert ((c & 0b111) == 0b101) and ((0b10 | c) == (c.mask | 0b10))
+
+def test_scale_object_common_tones():
+    c = Scale(Note('C', 4), 'major')
+    a = Scale(Note('A', 4), 'major')
+    assert [str(n) for n in c.common_tones(a)] == ['D4', 'E4', 'A4', 'B4']
+
+def test_scale_object_common_tones_same_scale():
+    c = Scale(Note('C', 4), 'major')
+    assert len(c.common_tones(c)) == 7
+
+def test_scale_object_equality():
+    assert Scale(Note('C', 4), 'major') == Scale(Note('C', 4), 'maj')
+    assert Scale(Note('C', 4, '#'), 'major') != Scale(Note('D', 4, 'b'), 'major')
+
+def test_scale_object_hash():
+    assert len(set([Scale(Note('C', 4), 'major'), Scale(Note('C', 4), 'maj'), Scale(Note('C', 4), 'minor')])) == 2
+
+def test_scale_object_immutable():
+    s = Scale(Note('C', 4), 'major')
+    with pytest.raises(AttributeError):
+        s.mask = 0
+
+def test_scale_object_pickle():
+    import pickle
+    s = Scale(Note('E', 4, 'b'), 'dorian')
+    assert pickle.loads(pickle.dumps(s)) == s
+
+def test_scale_object_invalid_type():
+    with pytest.raises(ValueError):
+        Scale(Note('C', 4), 'scale')
+
+def test_scale_object_str():
+    assert str(Scale(Note('C', 4), 'major pentatonic')) == 'C4 D4 E4 G4 A4 C5'
+
+# Test finding scales by their notes
+def test_find_scales_major():
+    notes = [Note(p, 4) for p in ('C', 'D', 'E', 'F', 'G', 'A', 'B')]
+    found = Scale.find_scales(notes)
+    assert ('C', None, 'major') in found
+    assert ('A', None, 'natural minor') in found
+    assert ('D', None, 'dorian') in found
+    assert ('G', None, 'major') not in found
+
+def test_find_scales_matches_build_scale():
+    notes = [Note('C', 4), Note('E', 4, 'b'), Note('G', 4)]
+    found = Scale.find_scales(notes)
+    for pitch in Note.VALID_PITCHES:
+        for accidental in (None, '#', 'b'):
+            for scale_type in ('major', 'minor', 'dorian', 'minor pentatonic', 'chromatic'):
+                try:
+                    s = Scale(Note(pitch, 4, accidental), scale_type)
+                except RuntimeError:
+                    continue
+                assert ((pitch, accidental, scale_type) in found) == all(n in s for n in notes)
+
+def test_find_scales_canonical_names():
+    found = Scale.find_scales([Note('C', 4)])
+    assert ('C', None, 'major') in found and ('C', None, 'maj') not in found
+
+def test_find_scales_enharmonic_and_octave():
+    assert Scale.find_scales([Note('F', 2, '#'), Note('C', 7, '#')]) == Scale.find_scales([Note('G', 4, 'b'), Note('D', 4, 'b')])
+
+def test_find_scales_ignores_rests():
+    assert Scale.find_scales([Note('C', 4), Rest()]) == Scale.find_scales([Note('C', 4)])
+
+def test_find_scales_chromatic_only():
+    notes = [Note('C', 4), Note('C', 4, '#'), Note('D', 4), Note('D', 4, '#')]
+    assert set(scale_type for pitch, accidental, scale_type in Scale.find_scales(notes)) == set(['chromatic'])
+
+def test_find_scales_empty():
+    assert len(Scale.find_scales([])) > len(Scale.find_scales([Note('C', 4)]))
+    assert ('F', '#', 'lydian') in Scale.find_scales([])
+
+def test_find_scales_non_note():
+    with pytest.raises(TypeError):
+        Scale.find_scales(['C4'])
+
+# Test lazy scale access
+def test_note_at_first_octave():
+    s = Scale(Note('D', 4), 'dorian')
+    assert [str(s.note_at(i)) for i in range(8)] == [str(n) for n in s]
+
+def test_note_at_higher_octave():
+    assert str(Scale(Note('D', 4), 'dorian').note_at(16)) == 'F6'
+
+def test_note_at_negative():
+    s = Scale(Note('D', 4), 'major')
+    assert (str(s.note_at(-1)) == 'C4#') and (str(s.note_at(-7)) == 'D3')
+
+def test_note_at_pentatonic():
+    assert str(Scale(Note('A', 4), 'minor pentatonic').note_at(7)) == 'D6'
+
+def test_note_at_out_of_range():
+    with pytest.raises(IndexError):
+        Scale(Note('C', 4), 'major').note_at(100)
+
+def test_note_at_non_int():
+    with pytest.raises(TypeError):
+        Scale(Note('C', 4), 'major').note_at(1.0)
+
+def test_walk_one_octave():
+    s = Scale(Note('E', 4, 'b'), 'minor')
+    assert list(s.walk(octaves=1)) == list(s)
+
+def test_walk_two_octaves():
+    walked = list(Scale(Note('C', 4), 'major').walk(octaves=2))
+    assert (len(walked) == 15) and (str(walked[-1]) == 'C6')
+
+def test_walk_descending():
+    walked = [str(n) for n in Scale(Note('A', 4), 'minor pentatonic').walk('descending', octaves=1)]
+    assert walked == ['A4', 'G4', 'E4', 'D4', 'C4', 'A3']
+
+def test_walk_to_end_of_midi_range():
+    walked = list(Scale(Note('C', 4), 'chromatic').walk())
+    assert (walked[0].midi_note_number() == 60) and (walked[-1].midi_note_number() == 127) and (len(walked) == 68)
+
+def test_walk_descending_to_end_of_midi_range():
+    walked = list(Scale(Note('C', 4), 'major').walk('descending'))
+    assert str(walked[-1]) == 'C-1'
+
+def test_walk_stops_at_midi_range():
+    walked = list(Scale(Note('C', 8), 'major').walk(octaves=3))
+    assert str(walked[-1]) == 'G9'
+
+def test_walk_is_lazy():
+    walk = Scale(Note('C', 4), 'major').walk()
+    assert str(next(walk)) == 'C4' and str(next(walk)) == 'D4'
+
+def test_walk_invalid_direction():
+    with pytest.raises(ValueError):
+        Scale(Note('C', 4), 'major').walk('sideways')
+
+def test_walk_invalid_octaves():
+    with pytest.raises(ValueError):
+        Scale(Note('C', 4), 'major').walk(octaves=0)